@@ -8,10 +8,12 @@ from alembic import context
 # for 'autogenerate' support
 from src.infrastructure.models.product_model import Base as ProductBase
 from src.infrastructure.models.order_model import Base as OrderBase
+from src.infrastructure.models.outbox_model import Base as OutboxBase
+from src.infrastructure.models.inventory_sync_model import Base as InventorySyncBase
 from configs.service_config import settings
 
 # Combine metadata from all models
-target_metadata = [ProductBase.metadata, OrderBase.metadata]
+target_metadata = [ProductBase.metadata, OrderBase.metadata, OutboxBase.metadata, InventorySyncBase.metadata]
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
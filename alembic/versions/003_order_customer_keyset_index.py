@@ -0,0 +1,32 @@
+"""Composite index for customer order history pagination
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '003'
+down_revision = '002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Serves WHERE customer_id = ? ORDER BY created_at DESC, id DESC with keyset
+    # cursors; makes the single-column customer index redundant
+    op.create_index(
+        'idx_order_customer_created', 'orders',
+        ['customer_id', sa.text('created_at DESC'), sa.text('id DESC')],
+        unique=False,
+    )
+    op.drop_index('idx_order_customer', table_name='orders')
+
+
+def downgrade() -> None:
+    op.create_index('idx_order_customer', 'orders', ['customer_id'], unique=False)
+    op.drop_index('idx_order_customer_created', table_name='orders')
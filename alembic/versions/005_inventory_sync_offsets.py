@@ -0,0 +1,30 @@
+"""Add inventory write-behind offsets
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '005'
+down_revision = '004'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'inventory_sync_offsets',
+        sa.Column('stream', sa.String(length=100), nullable=False),
+        sa.Column('last_id', sa.String(length=40), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('stream')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('inventory_sync_offsets')
@@ -0,0 +1,27 @@
+"""Index sent outbox events for retention purging
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '006'
+down_revision = '005'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'idx_outbox_sent_at', 'outbox', ['sent_at'], unique=False,
+        postgresql_where=sa.text('sent_at IS NOT NULL'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_outbox_sent_at', table_name='outbox')
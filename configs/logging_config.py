@@ -5,8 +5,9 @@ Advanced Logging Configuration for multi-environment support.
 Features:
 1. Vibrant, high-contrast coloring for Development (Pretty Mode).
 2. Structured JSON serialization for Production/Staging.
-3. Sensitive data masking (PII).
+3. Sensitive data masking (PII), applied only on the sinks that need it.
 4. Standard library log interception.
+5. HotPathLogger: deferred formatting with cached level checks for per-request code.
 """
 
 import logging
@@ -14,6 +15,7 @@ import sys
 import re
 import json
 from pathlib import Path
+from typing import Any, Callable, Dict
 from loguru import logger
 from configs.service_config import ServiceSettings, LogFormat
 
@@ -24,6 +26,8 @@ CREDENTIAL_PATTERN = re.compile(
     r"(?i)\b(password|passwd|secret|token|api_key|authorization)\b(['\"]?\s*[:=]\s*['\"]?)([^'\"\s,{}]+)"
 )
 SENSITIVE_KEYWORDS = {"password", "passwd", "email", "secret", "token", "key", "authorization"}
+# Substring checks on the lowercased message beat a case-insensitive regex by ~10x
+_SENSITIVE_KEYWORDS = tuple(SENSITIVE_KEYWORDS)
 
 
 class InterceptHandler(logging.Handler):
@@ -50,23 +54,99 @@ class InterceptHandler(logging.Handler):
             logger.opt(exception=record.exc_info).log(level, record.getMessage())
 
 
+def mask_message(message: str) -> str:
+    """Mask emails and credentials in a message that mentions a sensitive keyword."""
+    message_lower = message.lower()
+    for keyword in _SENSITIVE_KEYWORDS:
+        if keyword in message_lower:
+            break
+    else:
+        return message
+    message = EMAIL_PATTERN.sub("[EMAIL_MASKED]", message)
+    return CREDENTIAL_PATTERN.sub(r"\1\2[HIDDEN]", message)
+
+
 def mask_sensitive_data(record):
     """
     High-performance PII masking patcher.
     Protects sensitive information from being leaked into logs.
     """
     try:
-        message = record["message"]
-        message_lower = message.lower()
-        
-        if any(keyword in message_lower for keyword in SENSITIVE_KEYWORDS):
-            message = EMAIL_PATTERN.sub("[EMAIL_MASKED]", message)
-            message = CREDENTIAL_PATTERN.sub(r"\1\2[HIDDEN]", message)
-            record["message"] = message
+        record["message"] = mask_message(record["message"])
     except Exception as e:
         sys.stderr.write(f"Logging Patcher Error: {str(e)}\n")
 
 
+# Set on a record once it is masked, so the next masked sink skips it
+_MASKED = "_pii_masked"
+
+
+def mask_filter(record) -> bool:
+    """
+    Sink filter that masks PII before the sink formats the record.
+
+    Given only to the sinks that need masking. The record is shared by all
+    sinks, so it is masked at most once however many sinks mask it, and a
+    sink added after a masked one also sees the masked message (never the
+    reverse): masked sinks may come in any order, unmasked sinks should be
+    added first.
+    """
+    if _MASKED not in record:
+        mask_sensitive_data(record)
+        record[_MASKED] = True
+    return True
+
+
+def _discard(*args: Any, **kwargs: Any) -> None:
+    """Stand-in for the logging methods of disabled levels."""
+
+
+class HotPathLogger:
+    """
+    Loguru front end for per-request code paths (order placement, inventory,
+    repositories, publishing).
+
+    Messages take `str.format` placeholders (`hot_logger.debug("Order {}", order_id)`)
+    that loguru only fills in if the record is emitted, so no f-string is built
+    for a disabled level. Level checks are cached: configure() binds `debug`,
+    `info` and `success` once, either straight to loguru or, for levels below
+    every sink, to a no-op. Until setup_logging() configures it, every call is
+    passed to loguru.
+    """
+
+    LEVELS = ("DEBUG", "INFO", "SUCCESS")
+
+    debug: Callable[..., None]
+    info: Callable[..., None]
+    success: Callable[..., None]
+
+    def __init__(self):
+        self._min_level_no = 0
+        self._enabled: Dict[str, bool] = {}
+        self._bind()
+
+    def configure(self, min_level: str) -> None:
+        """Set the lowest level any sink accepts and rebind the logging methods."""
+        self._min_level_no = logger.level(min_level).no
+        self._enabled.clear()
+        self._bind()
+
+    def enabled(self, level: str) -> bool:
+        """Whether records at this level can be emitted; use it to guard costly arguments."""
+        enabled = self._enabled.get(level)
+        if enabled is None:
+            enabled = self._enabled[level] = logger.level(level).no >= self._min_level_no
+        return enabled
+
+    def _bind(self) -> None:
+        for level in self.LEVELS:
+            method = getattr(logger, level.lower())
+            setattr(self, level.lower(), method if self.enabled(level) else _discard)
+
+
+hot_logger = HotPathLogger()
+
+
 def json_serializer(record):
     """
     Custom JSON serializer for structured logging.
@@ -106,7 +186,10 @@ def setup_logging(config: ServiceSettings):
     logger.level("ERROR", color="<red>")
     logger.level("CRITICAL", color="<bold><white><bg red>")
     
-    logger.configure(patcher=mask_sensitive_data)
+    # PII masking is a filter of the sinks that need it rather than a global
+    # patcher; the unmasked pretty console (if any) is added before the file sink
+    console_filter = mask_filter if config.LOG_MASK_CONSOLE else None
+    hot_logger.configure(config.LOG_LEVEL.upper())
 
     # 2. Intercept Standard Logging
     logging.basicConfig(handlers=[InterceptHandler()], level=0, force=True)
@@ -117,6 +200,7 @@ def setup_logging(config: ServiceSettings):
         logger.add(
             sys.stderr,
             level=config.LOG_LEVEL.upper(),
+            filter=mask_filter,
             serialize=True
         )
     else:
@@ -132,6 +216,7 @@ def setup_logging(config: ServiceSettings):
             sys.stderr,
             level=config.LOG_LEVEL.upper(),
             format=pretty_format,
+            filter=console_filter,
             colorize=True, # Force color regardless of TTY detection
         )
 
@@ -145,6 +230,8 @@ def setup_logging(config: ServiceSettings):
         str(file_format),
         level=config.LOG_LEVEL.upper(),
         format=file_sink_format,
+        # Persisted logs are always masked
+        filter=mask_filter,
         serialize=(config.LOG_FORMAT == LogFormat.JSON),
         rotation=config.LOG_ROTATION,
         retention=config.LOG_RETENTION,
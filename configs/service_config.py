@@ -41,6 +41,7 @@ class ServiceSettings(BaseSettings):
     LOG_DIR: str = Field(default="logs")
     LOG_RETENTION: str = Field(default="90 days")
     LOG_ROTATION: str = Field(default="00:00")
+    LOG_MASK_CONSOLE: bool = True
 
     # API Settings
     API_HOST: str = "0.0.0.0"
@@ -58,8 +59,44 @@ class ServiceSettings(BaseSettings):
     REDIS_URL: str = Field(..., alias="REDIS_URL")
     REDIS_MAX_CONNECTIONS: int = 50
 
+    # Product Catalog Cache (in-process)
+    PRODUCT_CACHE_MAX_SIZE: int = 10000
+    PRODUCT_CACHE_TTL: float = 60.0
+
+    # Inventory Reservation Settings
+    INVENTORY_RESERVATION_TTL: int = 300
+    INVENTORY_REAPER_INTERVAL: float = 10.0
+    INVENTORY_REAPER_BATCH_SIZE: int = 500
+    INVENTORY_SYNC_ENABLED: bool = True
+    INVENTORY_SYNC_INTERVAL: float = 1.0
+    INVENTORY_SYNC_BATCH_SIZE: int = 1000
+
+    # Idempotency-Key Settings
+    IDEMPOTENCY_IN_FLIGHT_TTL: int = 30
+    IDEMPOTENCY_RESULT_TTL: int = 86400
+    IDEMPOTENCY_WAIT_TIMEOUT: float = 5.0
+
     # RabbitMQ Settings
     RABBITMQ_URL: str = Field(..., alias="RABBITMQ_URL")
+    RABBITMQ_CHANNEL_POOL_SIZE: int = 4
+    RABBITMQ_PUBLISH_BATCH_SIZE: int = 100
+    RABBITMQ_PUBLISH_LINGER: float = 0.005
+    RABBITMQ_MAX_IN_FLIGHT: int = 1000
+    RABBITMQ_PREFETCH_COUNT: int = 10
+
+    # Worker (consumer) Settings
+    WORKER_QUEUE_NAME: str = "order_worker"
+    WORKER_CONCURRENCY: int = 10
+    WORKER_ACK_BATCH_SIZE: int = 5
+    WORKER_ACK_INTERVAL: float = 0.5
+    WORKER_RETRY_DELAYS: List[float] = [1.0, 5.0, 30.0]
+    WORKER_START_RETRY_INTERVAL: float = 5.0
+
+    # Outbox Relay Settings
+    OUTBOX_BATCH_SIZE: int = 100
+    OUTBOX_POLL_INTERVAL: float = 1.0
+    OUTBOX_RETENTION: int = 604800
+    OUTBOX_PURGE_INTERVAL: float = 3600.0
 
     # CORS Settings
     CORS_ORIGINS: List[str] = ["*"]
@@ -67,10 +104,20 @@ class ServiceSettings(BaseSettings):
     # Internal Service Communication
     AUTH_SERVICE_URL: str = Field(default="http://auth-service:8000")
     INTERNAL_API_KEY: str = Field(default="your-internal-api-key")
+    AUTH_SERVICE_TIMEOUT: float = 5.0
+    AUTH_SERVICE_HTTP2: bool = True
+    AUTH_SERVICE_MAX_CONNECTIONS: int = 100
+    AUTH_SERVICE_MAX_KEEPALIVE: int = 20
+    AUTH_SERVICE_KEEPALIVE_EXPIRY: float = 30.0
+    AUTH_SERVICE_MAX_CONCURRENCY: int = 10
+    AUTH_DECISION_CACHE_TTL: float = 5.0
+    AUTH_DECISION_CACHE_MAX_SIZE: int = 10000
 
     # Security
     SECRET_KEY: str = "your-secret-key-change-in-production"
     SUPABASE_JWT_SECRET: str = Field(default="your-supabase-jwt-secret")
+    AUTH_TOKEN_CACHE_MAX_SIZE: int = 10000
+    AUTH_TOKEN_CACHE_TTL: float = 300.0
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
 
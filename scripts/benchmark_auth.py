@@ -0,0 +1,62 @@
+"""
+Benchmark of per-request token verification cost, with and without the token cache.
+
+Usage: python -m scripts.benchmark_auth [--requests 20000] [--users 200]
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from jose import jwt
+from loguru import logger
+
+from src.infrastructure.clients.auth_provider import AuthProvider
+from src.infrastructure.caching.token_verification_cache import TokenVerificationCache
+
+SECRET = "benchmark-secret"
+
+
+def make_tokens(users: int) -> list:
+    exp = int(time.time()) + 3600
+    return [
+        jwt.encode({"sub": f"user-{i}", "aud": "authenticated", "exp": exp}, SECRET, algorithm="HS256")
+        for i in range(users)
+    ]
+
+
+async def run(provider: AuthProvider, tokens: list, requests: int) -> float:
+    """Verify `requests` tokens drawn from `tokens`; return microseconds per call."""
+    rng = random.Random(42)
+    sample = [rng.choice(tokens) for _ in range(requests)]
+    started = time.perf_counter()
+    for token in sample:
+        assert await provider.verify_token(token) is not None
+    return (time.perf_counter() - started) / requests * 1e6
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--users", type=int, default=200, help="Distinct tokens in the sample")
+    args = parser.parse_args()
+
+    # Per-call audit logs would dominate the timing
+    logger.remove()
+    tokens = make_tokens(args.users)
+
+    uncached = AuthProvider("http://auth", "key", SECRET)
+    cache = TokenVerificationCache(max_size=10000)
+    cached = AuthProvider("http://auth", "key", SECRET, token_cache=cache)
+
+    uncached_us = await run(uncached, tokens, args.requests)
+    cached_us = await run(cached, tokens, args.requests)
+
+    print(f"Requests: {args.requests} | Distinct tokens: {args.users}")
+    print(f"jwt.decode every call : {uncached_us:8.2f} µs/request")
+    print(f"with token cache      : {cached_us:8.2f} µs/request ({uncached_us / cached_us:.1f}x)")
+    print(f"cache stats           : {cache.stats()}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
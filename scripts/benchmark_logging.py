@@ -0,0 +1,109 @@
+"""
+Microbenchmark of logging CPU per placed order: eager f-strings with the previous
+global masking patcher (before) versus HotPathLogger with the masking sink filter (after).
+
+Replays the log calls one PlaceOrderService.execute makes (service, product
+repository and cache, inventory cache, order and outbox repositories) into two
+masked text sinks that discard their output, like the console and file sinks of
+setup_logging().
+
+Usage: python -m scripts.benchmark_logging [--orders 20000] [--level INFO]
+"""
+
+import argparse
+import time
+from decimal import Decimal
+from loguru import logger
+
+from configs.logging_config import SENSITIVE_KEYWORDS, EMAIL_PATTERN, CREDENTIAL_PATTERN
+from configs.logging_config import hot_logger, mask_filter
+
+SINK_FORMAT = "{time:YYYY-MM-DD HH:mm:ss.SSS} | {level: <7} | {name}:{function}:{line} - {message}"
+
+
+def legacy_mask_sensitive_data(record):
+    """The previous patcher: lowercases and scans every message for each keyword."""
+    message = record["message"]
+    message_lower = message.lower()
+    if any(keyword in message_lower for keyword in SENSITIVE_KEYWORDS):
+        message = EMAIL_PATTERN.sub("[EMAIL_MASKED]", message)
+        message = CREDENTIAL_PATTERN.sub(r"\1\2[HIDDEN]", message)
+        record["message"] = message
+
+
+def order_before(customer_id: int, product_ids: list, order_id: int, total: Decimal) -> None:
+    logger.info(f"AUDIT | START | Placing order for customer {customer_id} with {len(product_ids)} items")
+    logger.debug("STEP 1 | Validating products")
+    logger.debug(f"Fetching {len(product_ids)} products")
+    logger.debug(f"Product cache | Memory misses: {len(product_ids)} | Redis hits: {0} | Database: {0}")
+    logger.debug("STEP 2 | Reserving inventory")
+    logger.info(f"AUDIT | SUCCESS | Reserved stock for {len(product_ids)} products")
+    logger.debug(f"Reserved {len(product_ids)} order items under hold res-{order_id}")
+    logger.debug("STEP 3 | Creating order entity")
+    logger.debug("STEP 4 | Persisting order to database")
+    logger.debug(f"AUDIT | Creating new order for customer {customer_id}")
+    logger.debug("STEP 5 | Publishing OrderPlaced event")
+    logger.debug(f"AUDIT | Outbox | Staged event: {'order.placed'}")
+    logger.info(f"Published OrderPlaced event for order {order_id}")
+    logger.success(f"AUDIT | SUCCESS | Order {order_id} placed for customer {customer_id}. Total: {total}")
+
+
+def order_after(customer_id: int, product_ids: list, order_id: int, total: Decimal) -> None:
+    hot_logger.info(
+        "AUDIT | START | Placing order for customer {} with {} items", customer_id, len(product_ids)
+    )
+    hot_logger.debug("STEP 1 | Validating products")
+    hot_logger.debug("Fetching {} products", len(product_ids))
+    hot_logger.debug(
+        "Product cache | Memory misses: {} | Redis hits: {} | Database: {}", len(product_ids), 0, 0
+    )
+    hot_logger.debug("STEP 2 | Reserving inventory")
+    hot_logger.info("AUDIT | SUCCESS | Reserved stock for {} products", len(product_ids))
+    hot_logger.debug("Reserved {} order items under hold {}", len(product_ids), f"res-{order_id}")
+    hot_logger.debug("STEP 3 | Creating order entity")
+    hot_logger.debug("STEP 4 | Persisting order to database")
+    hot_logger.debug("AUDIT | Creating new order for customer {}", customer_id)
+    hot_logger.debug("STEP 5 | Publishing OrderPlaced event")
+    hot_logger.debug("AUDIT | Outbox | Staged event: {}", "order.placed")
+    hot_logger.info("Published OrderPlaced event for order {}", order_id)
+    hot_logger.success(
+        "AUDIT | SUCCESS | Order {} placed for customer {}. Total: {}", order_id, customer_id, total
+    )
+
+
+def run(place_order, orders: int) -> float:
+    """Log `orders` order placements; return microseconds of CPU per order."""
+    product_ids = [1, 2, 3]
+    total = Decimal("59.97")
+    started = time.process_time()
+    for order_id in range(orders):
+        place_order(42, product_ids, order_id, total)
+    return (time.process_time() - started) / orders * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--orders", type=int, default=20000)
+    parser.add_argument("--level", default="INFO", help="Level of the sink (LOG_LEVEL)")
+    args = parser.parse_args()
+
+    # loguru cannot unset a patcher, so the "after" setup runs first
+    logger.remove()
+    for _ in range(2):
+        logger.add(lambda message: None, level=args.level, format=SINK_FORMAT, filter=mask_filter)
+    hot_logger.configure(args.level)
+    after = run(order_after, args.orders)
+
+    logger.remove()
+    logger.configure(patcher=legacy_mask_sensitive_data)
+    for _ in range(2):
+        logger.add(lambda message: None, level=args.level, format=SINK_FORMAT)
+    before = run(order_before, args.orders)
+
+    print(f"Orders: {args.orders} | Log level: {args.level}")
+    print(f"f-strings + global patcher : {before:7.2f} µs CPU/order")
+    print(f"HotPathLogger + filter     : {after:7.2f} µs CPU/order ({before / after:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Benchmark of request throughput through LoggingMiddleware: the previous
+BaseHTTPMiddleware implementation versus the pure ASGI one.
+
+Requests are driven straight through the ASGI stack (no sockets), so the
+numbers isolate middleware overhead.
+
+Usage: python -m scripts.benchmark_middleware [--requests 20000] [--level INFO]
+"""
+
+import argparse
+import asyncio
+import time
+from loguru import logger
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from src.interface.http.middlewares import LoggingMiddleware
+
+
+class BaseHTTPLoggingMiddleware(BaseHTTPMiddleware):
+    """The previous LoggingMiddleware, kept as the baseline."""
+
+    _mask_pii = LoggingMiddleware._mask_pii
+    SENSITIVE_FIELDS = LoggingMiddleware.SENSITIVE_FIELDS
+
+    async def dispatch(self, request: Request, call_next):
+        start_time = time.time()
+        method = request.method
+        path = request.url.path
+        masked_query = self._mask_pii(dict(request.query_params))
+        logger.info(f"HTTP | REQUEST | {method} {path} | Params: {masked_query}")
+        response = await call_next(request)
+        process_time = (time.time() - start_time) * 1000
+        logger.info(
+            f"HTTP | RESPONSE | {method} {path} | Status: {response.status_code} | "
+            f"Duration: {process_time:.2f}ms"
+        )
+        return response
+
+
+async def endpoint(request: Request):
+    return JSONResponse({"status": "ok"})
+
+
+def make_app(middleware_class) -> Starlette:
+    return Starlette(
+        routes=[Route("/orders", endpoint)],
+        middleware=[Middleware(middleware_class)],
+    )
+
+
+async def run(app: Starlette, requests: int) -> float:
+    """Send `requests` GET requests through the app; return requests per second."""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/orders",
+        "raw_path": b"/orders",
+        "query_string": b"customer_id=42&limit=20&token=secret",
+        "root_path": "",
+        "headers": [(b"host", b"localhost")],
+        "client": ("127.0.0.1", 50000),
+        "server": ("127.0.0.1", 8000),
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    started = time.perf_counter()
+    for _ in range(requests):
+        await app(dict(scope), receive, send)
+    return requests / (time.perf_counter() - started)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--level", default="INFO", help="Log level of the (discarding) sink")
+    args = parser.parse_args()
+
+    # Records are formatted as usual but not written anywhere
+    logger.remove()
+    logger.add(lambda message: None, level=args.level)
+
+    before = await run(make_app(BaseHTTPLoggingMiddleware), args.requests)
+    after = await run(make_app(LoggingMiddleware), args.requests)
+
+    print(f"Requests: {args.requests} | Log level: {args.level}")
+    print(f"BaseHTTPMiddleware : {before:10.0f} req/s")
+    print(f"pure ASGI          : {after:10.0f} req/s ({after / before:.2f}x)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
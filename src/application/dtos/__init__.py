@@ -9,6 +9,12 @@ from src.application.dtos.order_dtos import (
     PlaceOrderRequestDTO,
     OrderResponseDTO,
     OrderItemResponseDTO,
+    BatchOrderResultDTO,
+    OrderPageDTO,
+)
+from src.application.dtos.product_dtos import (
+    ProductResponseDTO,
+    ProductPageDTO,
 )
 
 __all__ = [
@@ -16,4 +22,8 @@ __all__ = [
     "PlaceOrderRequestDTO",
     "OrderResponseDTO",
     "OrderItemResponseDTO",
+    "BatchOrderResultDTO",
+    "OrderPageDTO",
+    "ProductResponseDTO",
+    "ProductPageDTO",
 ]
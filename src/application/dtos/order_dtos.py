@@ -6,7 +6,7 @@ Data Transfer Objects for Order operations.
 
 from dataclasses import dataclass
 from decimal import Decimal
-from typing import List
+from typing import List, Optional
 from datetime import datetime
 
 
@@ -82,3 +82,25 @@ class OrderResponseDTO:
             created_at=order.created_at,
             updated_at=order.updated_at,
         )
+
+
+@dataclass
+class BatchOrderResultDTO:
+    """DTO for the outcome of one order in a batch placement."""
+    
+    index: int
+    order: Optional[OrderResponseDTO] = None
+    error: Optional[str] = None
+    
+    @property
+    def succeeded(self) -> bool:
+        """Whether the order was placed."""
+        return self.order is not None
+
+
+@dataclass
+class OrderPageDTO:
+    """DTO for one page of orders."""
+    
+    items: List[OrderResponseDTO]
+    next_cursor: Optional[str] = None
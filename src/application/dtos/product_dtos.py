@@ -0,0 +1,49 @@
+"""
+product_dtos.py
+
+Data Transfer Objects for Product operations.
+"""
+
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import List, Optional
+
+
+@dataclass
+class ProductResponseDTO:
+    """DTO for product response."""
+    
+    id: int
+    sku: str
+    name: str
+    description: str
+    price: Decimal
+    stock_quantity: int
+    
+    @classmethod
+    def from_entity(cls, product):
+        """
+        Create ProductResponseDTO from Product entity.
+        
+        Args:
+            product: Product entity from domain.
+            
+        Returns:
+            ProductResponseDTO instance.
+        """
+        return cls(
+            id=product.id,
+            sku=product.sku,
+            name=product.name,
+            description=product.description,
+            price=product.price,
+            stock_quantity=product.stock_quantity,
+        )
+
+
+@dataclass
+class ProductPageDTO:
+    """DTO for one page of products."""
+    
+    items: List[ProductResponseDTO]
+    next_cursor: Optional[str] = None
@@ -6,8 +6,12 @@ Export services.
 
 from src.application.service.order_service import PlaceOrderService
 from src.application.service.seed_service import SeedService
+from src.application.service.order_query_service import OrderQueryService
+from src.application.service.product_query_service import ProductQueryService
 
 __all__ = [
     "PlaceOrderService",
     "SeedService",
+    "OrderQueryService",
+    "ProductQueryService",
 ]
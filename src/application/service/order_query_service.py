@@ -0,0 +1,122 @@
+"""
+order_query_service.py
+
+OrderQueryService - Read-side use cases for orders.
+Serves order lookups, customer order history with cursor-based pagination,
+and streaming exports for reporting.
+"""
+
+from datetime import datetime
+from typing import AsyncIterator, Optional, Tuple
+from loguru import logger
+
+from src.constants import PAGE_SIZE_DEFAULT, EXPORT_BATCH_SIZE
+from src.domain.exceptions import OrderNotFoundError, InvalidCursorError
+from src.application.dtos import OrderResponseDTO, OrderPageDTO
+from src.application.service.pagination import encode_cursor, decode_cursor
+from src.interface.protocols.repositories import IOrderReadRepository
+
+
+class OrderQueryService:
+    """
+    Use case: Look up orders and browse a customer's orders.
+    
+    Reads go through the projection repository, which returns response DTOs
+    directly instead of domain entities.
+    
+    Cursors are opaque to clients: a URL-safe base64 encoding of the
+    (created_at, id) of the last order on the previous page.
+    """
+    
+    def __init__(self, order_read_repository: IOrderReadRepository):
+        """
+        Initialize OrderQueryService.
+        
+        Args:
+            order_read_repository: Read-only repository of order projections.
+        """
+        self.order_repo = order_read_repository
+    
+    async def get_order(self, order_id: int) -> OrderResponseDTO:
+        """
+        Get one order.
+        
+        Raises:
+            OrderNotFoundError: If the order does not exist.
+        """
+        order = await self.order_repo.get_by_id(order_id)
+        if order is None:
+            raise OrderNotFoundError(order_id=order_id)
+        return order
+    
+    async def list_customer_orders(
+        self,
+        customer_id: int,
+        limit: int = PAGE_SIZE_DEFAULT,
+        cursor: Optional[str] = None,
+    ) -> OrderPageDTO:
+        """
+        Get one page of a customer's orders, newest first.
+        
+        Args:
+            customer_id: Customer whose orders are listed.
+            limit: Maximum orders per page.
+            cursor: next_cursor of the previous page, or None for the first page.
+            
+        Returns:
+            OrderPageDTO with the orders and the cursor of the next page (None on the last page).
+            
+        Raises:
+            InvalidCursorError: If the cursor is malformed.
+        """
+        after = self._decode_cursor(cursor) if cursor else None
+        
+        # One extra row tells whether another page exists
+        orders = await self.order_repo.get_by_customer_id(customer_id, limit=limit + 1, after=after)
+        has_more = len(orders) > limit
+        orders = orders[:limit]
+        
+        logger.debug(f"AUDIT | Listed {len(orders)} orders for customer {customer_id}")
+        
+        return OrderPageDTO(
+            items=orders,
+            next_cursor=self._encode_cursor(orders[-1]) if has_more else None,
+        )
+    
+    def export_orders(
+        self,
+        status: Optional[str] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+    ) -> AsyncIterator[OrderResponseDTO]:
+        """
+        Stream every matching order with its items, oldest ID first.
+        
+        Orders are yielded one at a time from a server-side cursor, so an export
+        of any size runs in constant memory.
+        
+        Args:
+            status: Only orders in this status.
+            created_from: Only orders created at or after this time.
+            created_to: Only orders created before this time.
+        """
+        return self.order_repo.stream_orders(
+            status=status,
+            created_from=created_from,
+            created_to=created_to,
+            batch_size=EXPORT_BATCH_SIZE,
+        )
+    
+    @staticmethod
+    def _encode_cursor(order: OrderResponseDTO) -> str:
+        """Encode the keyset position of an order."""
+        return encode_cursor([order.created_at.isoformat(), order.id])
+    
+    @staticmethod
+    def _decode_cursor(cursor: str) -> Tuple[datetime, int]:
+        """Decode a cursor produced by _encode_cursor."""
+        created_at, order_id = decode_cursor(cursor, size=2)
+        try:
+            return datetime.fromisoformat(created_at), int(order_id)
+        except (ValueError, TypeError) as e:
+            raise InvalidCursorError(cursor) from e
@@ -6,22 +6,24 @@ Orchestrates product validation, inventory reservation, order creation, and even
 """
 
 from datetime import datetime, timezone, timezone
-from typing import Protocol, List
+from typing import Awaitable, Callable, List, Optional
+from uuid import uuid4
 from loguru import logger
+from configs.logging_config import hot_logger
 
 from src.domain.entities import Product, Order, OrderItem, OrderStatus
 from src.domain.events import OrderPlaced, OrderFailed
 from src.domain.exceptions import (
     ProductNotFoundError,
     InsufficientStockError,
-    InventoryLockError,
     OrderValidationError,
 )
-from src.application.dtos import PlaceOrderRequestDTO, OrderResponseDTO
+from src.application.dtos import PlaceOrderRequestDTO, OrderResponseDTO, BatchOrderResultDTO
 from src.interface.protocols.repositories import IProductRepository, IOrderRepository
 from src.interface.protocols.infrastructure import IInventoryCache, IEventPublisher
 
-
+# Registers a coroutine function to run once the current transaction has committed
+AfterCommit = Callable[[Callable[[], Awaitable[None]]], None]
 
 
 class PlaceOrderService:
@@ -30,12 +32,16 @@ class PlaceOrderService:
     
     This service orchestrates the order placement process:
     1. Validate products exist
-    2. Check and reserve inventory (Redis with distributed locking)
+    2. Check and reserve inventory (single atomic Redis script, recorded as an expiring hold)
     3. Create order entity
     4. Persist to database (PostgreSQL)
-    5. Publish OrderPlaced event (RabbitMQ)
+    5. Publish OrderPlaced event (written to the outbox in the order's transaction)
+    6. Renew the hold, and confirm it once the transaction has committed
     
-    If any step fails, it rolls back reservations and publishes OrderFailed event.
+    If any step fails, it cancels the hold and publishes OrderFailed event
+    through the failure publisher, which must not depend on the rolled-back transaction.
+    If the process dies or the commit fails instead, the hold expires and the
+    worker's reaper returns the stock.
     """
     
     def __init__(
@@ -44,6 +50,8 @@ class PlaceOrderService:
         order_repository: IOrderRepository,
         inventory_cache: IInventoryCache,
         event_publisher: IEventPublisher,
+        after_commit: AfterCommit,
+        failure_event_publisher: Optional[IEventPublisher] = None,
     ):
         """
         Initialize PlaceOrderService.
@@ -53,11 +61,17 @@ class PlaceOrderService:
             order_repository: Repository for order data access.
             inventory_cache: Redis cache for inventory management.
             event_publisher: Service to publish domain events.
+            after_commit: Registers work to run after the session shared with the
+                repositories commits (confirming holds).
+            failure_event_publisher: Publisher for OrderFailed events; defaults to
+                event_publisher.
         """
         self.product_repo = product_repository
         self.order_repo = order_repository
         self.inventory_cache = inventory_cache
         self.event_publisher = event_publisher
+        self.after_commit = after_commit
+        self.failure_event_publisher = failure_event_publisher or event_publisher
     
     async def execute(self, request: PlaceOrderRequestDTO) -> OrderResponseDTO:
         """
@@ -73,39 +87,43 @@ class PlaceOrderService:
             ProductNotFoundError: If any product is not found.
             InsufficientStockError: If any product has insufficient stock.
             OrderValidationError: If order validation fails.
-            InventoryLockError: If unable to acquire inventory lock.
         """
-        logger.info(
-            f"AUDIT | START | Placing order for customer {request.customer_id} "
-            f"with {len(request.items)} items"
+        hot_logger.info(
+            "AUDIT | START | Placing order for customer {} with {} items",
+            request.customer_id, len(request.items),
         )
         
-        reserved_items: List[tuple[int, int]] = []  # (product_id, quantity)
+        reservation_id: Optional[str] = None
         
         try:
             # Step 1: Fetch and validate products (Workflow)
-            logger.debug("STEP 1 | Validating products")
+            hot_logger.debug("STEP 1 | Validating products")
             products = await self._fetch_and_validate_products(request)
             
             # Step 2: Check and reserve inventory
-            logger.debug("STEP 2 | Reserving inventory")
-            reserved_items = await self._reserve_inventory(request, products)
+            hot_logger.debug("STEP 2 | Reserving inventory")
+            reservation_id = await self._reserve_inventory(request, products)
             
             # Step 3: Create order entity
-            logger.debug("STEP 3 | Creating order entity")
+            hot_logger.debug("STEP 3 | Creating order entity")
             order = self._create_order_entity(request, products)
             
             # Step 4: Persist order
-            logger.debug("STEP 4 | Persisting order to database")
+            hot_logger.debug("STEP 4 | Persisting order to database")
             saved_order = await self.order_repo.save(order)
             
             # Step 5: Publish Side Effects
-            logger.debug("STEP 5 | Publishing OrderPlaced event")
+            hot_logger.debug("STEP 5 | Publishing OrderPlaced event")
             await self._publish_order_placed_event(saved_order)
             
-            logger.success(
-                f"AUDIT | SUCCESS | Order {saved_order.id} placed for customer "
-                f"{request.customer_id}. Total: {saved_order.total_amount}"
+            # Step 6: Keep the hold alive through the commit; confirm it after
+            hot_logger.debug("STEP 6 | Renewing reservation until commit")
+            reservation_id = await self._renew_reservation(request, products, reservation_id)
+            self._confirm_after_commit(saved_order.id, reservation_id, request)
+            
+            hot_logger.success(
+                "AUDIT | SUCCESS | Order {} placed for customer {}. Total: {}",
+                saved_order.id, request.customer_id, saved_order.total_amount,
             )
             
             return OrderResponseDTO.from_entity(saved_order)
@@ -113,13 +131,13 @@ class PlaceOrderService:
         except (ProductNotFoundError, InsufficientStockError) as e:
             # Domain Errors are already friendly, just re-raise
             logger.warning(f"AUDIT | BUSINESS_ERROR | {e}")
-            await self._rollback_reservations(reserved_items)
+            await self._rollback_reservations(reservation_id)
             raise e
             
         except Exception as e:
             # Step 6: Error Translation (Fulfills Core Responsibility 4)
             logger.error(f"AUDIT | FAILED | Unexpected error: {e}. Starting rollback.")
-            await self._rollback_reservations(reserved_items)
+            await self._rollback_reservations(reservation_id)
             
             # Wrap technical error into a business-level failure
             error_msg = f"System error during order placement: {str(e)}"
@@ -131,6 +149,126 @@ class PlaceOrderService:
             # Re-raise the exception
             raise
     
+    async def execute_many(
+        self, requests: List[PlaceOrderRequestDTO]
+    ) -> List[BatchOrderResultDTO]:
+        """
+        Place many orders at once with per-order results.
+        
+        Batched counterpart of execute():
+        1. Fetch all distinct products in one query
+        2. Reserve inventory for every order in one Redis round trip (each order all-or-nothing)
+        3. Insert orders and items with multi-row INSERTs
+        4. Stage all OrderPlaced events in the outbox (flushed together at commit)
+        5. Renew the holds together, and confirm them together once the transaction
+           has committed
+        
+        Orders rejected for business reasons (unknown product, insufficient stock,
+        validation) fail individually while the rest are placed. A system error
+        while persisting fails the whole batch like execute() does, and so does a
+        hold that expired before commit and whose stock is gone by then (the
+        orders are already staged in the shared transaction).
+        
+        Args:
+            requests: Order request DTOs, in submission order.
+            
+        Returns:
+            One BatchOrderResultDTO per request, in the same order.
+            
+        Raises:
+            OrderValidationError: If the batch could not be persisted.
+        """
+        hot_logger.info("AUDIT | START | Placing batch of {} orders", len(requests))
+        
+        results = [BatchOrderResultDTO(index=index) for index in range(len(requests))]
+        
+        # Step 1: One product query for the whole batch
+        product_ids = list(dict.fromkeys(
+            item.product_id for request in requests for item in request.items
+        ))
+        products = {p.id: p for p in await self.product_repo.get_many_by_ids(product_ids)}
+        
+        candidates: List[tuple[int, Order]] = []
+        for index, request in enumerate(requests):
+            try:
+                for item in request.items:
+                    if item.product_id not in products:
+                        raise ProductNotFoundError(product_id=item.product_id)
+                candidates.append((index, self._create_order_entity(request, products)))
+            except (ProductNotFoundError, OrderValidationError) as e:
+                results[index].error = str(e)
+        
+        if not candidates:
+            return results
+        
+        reservation_ids = {index: uuid4().hex for index, _ in candidates}
+        reserved: List[tuple[int, Order]] = []
+        
+        try:
+            # Step 2: Reserve every order in one round trip
+            failures = await self.inventory_cache.reserve_batch([
+                (
+                    reservation_ids[index],
+                    [(item.product_id, item.quantity) for item in requests[index].items],
+                )
+                for index, _ in candidates
+            ])
+            
+            for (index, order), failed_product_id in zip(candidates, failures):
+                if failed_product_id is None:
+                    reserved.append((index, order))
+                    continue
+                results[index].error = str(InsufficientStockError(
+                    product_id=failed_product_id,
+                    requested=sum(
+                        item.quantity for item in requests[index].items
+                        if item.product_id == failed_product_id
+                    ),
+                    available=products[failed_product_id].stock_quantity,
+                ))
+            
+            if reserved:
+                # Step 3: Multi-row INSERTs
+                saved_orders = await self.order_repo.save_many([order for _, order in reserved])
+                
+                # Step 4: Events
+                for (index, _), saved_order in zip(reserved, saved_orders):
+                    await self._publish_order_placed_event(saved_order)
+                    results[index].order = OrderResponseDTO.from_entity(saved_order)
+                
+                # Step 5: Keep the holds alive through the commit; confirm them after
+                await self._renew_reservations(requests, products, reserved, reservation_ids)
+                self._confirm_many_after_commit([
+                    (
+                        saved_order.id,
+                        reservation_ids[index],
+                        [(item.product_id, item.quantity) for item in requests[index].items],
+                    )
+                    for (index, _), saved_order in zip(reserved, saved_orders)
+                ])
+        
+        except Exception as e:
+            logger.error(f"AUDIT | FAILED | Unexpected error in order batch: {e}. Starting rollback.")
+            try:
+                # Safe for orders that were never reserved: unknown holds are ignored
+                await self.inventory_cache.cancel_reservations(list(reservation_ids.values()))
+            except Exception as cancel_error:
+                logger.error(
+                    f"Failed to cancel batch reservations: {cancel_error}. "
+                    f"They will be reaped when they expire."
+                )
+            
+            error_msg = f"System error during order placement: {str(e)}"
+            for _, order in candidates:
+                await self._publish_order_failed_event(order.customer_id, error_msg)
+            
+            raise OrderValidationError(error_msg)
+        
+        hot_logger.success(
+            "AUDIT | SUCCESS | Placed {}/{} orders in batch", len(reserved), len(requests)
+        )
+        return results
+    
     async def _fetch_and_validate_products(
         self, request: PlaceOrderRequestDTO
     ) -> dict[int, Product]:
@@ -163,56 +301,165 @@ class PlaceOrderService:
         self,
         request: PlaceOrderRequestDTO,
         products: dict[int, Product],
-    ) -> List[tuple[int, int]]:
+    ) -> str:
         """
         Reserve inventory for all order items.
         
-        Uses Redis distributed locking to prevent overselling.
+        Uses a single atomic Redis script call so the whole order is reserved
+        (or rejected) in one round trip, without per-item locking. The
+        reservation is recorded as a hold that expires unless confirmed.
         
         Args:
             request: Order request DTO.
             products: Map of product_id to Product entity.
             
         Returns:
-            List of (product_id, quantity) tuples that were successfully reserved.
+            ID of the reservation hold.
             
         Raises:
             InsufficientStockError: If stock is insufficient for any product.
-            InventoryLockError: If unable to acquire lock.
         """
-        reserved: List[tuple[int, int]] = []
+        items: List[tuple[int, int]] = [
+            (item.product_id, item.quantity) for item in request.items
+        ]
+        reservation_id = uuid4().hex
         
-        try:
-            for item in request.items:
-                product = products[item.product_id]
-                
-                # Check and reserve in Redis (with distributed lock)
-                success = await self.inventory_cache.check_and_reserve_stock(
-                    product_id=item.product_id,
-                    quantity=item.quantity
-                )
-                
-                if not success:
-                    # Stock insufficient or lock failed
-                    raise InsufficientStockError(
-                        product_id=item.product_id,
-                        requested=item.quantity,
-                        available=product.stock_quantity,
-                    )
-                
-                reserved.append((item.product_id, item.quantity))
-                
-                logger.debug(
-                    f"Reserved {item.quantity} units of product {item.product_id}"
-                )
-            
-            return reserved
+        failed_product_id = await self.inventory_cache.reserve_many(
+            items, reservation_id=reservation_id
+        )
+        
+        if failed_product_id is not None:
+            # Nothing was reserved (all-or-nothing), so there is nothing to release
+            raise InsufficientStockError(
+                product_id=failed_product_id,
+                requested=sum(
+                    quantity for product_id, quantity in items
+                    if product_id == failed_product_id
+                ),
+                available=products[failed_product_id].stock_quantity,
+            )
+        
+        hot_logger.debug("Reserved {} order items under hold {}", len(items), reservation_id)
+        return reservation_id
+    
+    async def _renew_reservation(
+        self,
+        request: PlaceOrderRequestDTO,
+        products: dict[int, Product],
+        reservation_id: str,
+    ) -> str:
+        """
+        Renew the hold right before commit so the reaper cannot take it back meanwhile.
+        
+        If it already expired and was reaped, its stock went back to the pool
+        and is reserved again under a new hold.
+        
+        Returns:
+            ID of the hold that now covers the order.
             
-        except Exception:
-            # If any reservation fails, release all previous reservations
-            for product_id, quantity in reserved:
-                await self.inventory_cache.release_stock(product_id, quantity)
-            raise
+        Raises:
+            InsufficientStockError: If the stock was sold in the meantime.
+        """
+        if await self.inventory_cache.renew_reservation(reservation_id):
+            return reservation_id
+        
+        logger.warning(f"AUDIT | EXPIRED | Reservation {reservation_id} expired before commit, reserving again")
+        return await self._reserve_inventory(request, products)
+    
+    async def _renew_reservations(
+        self,
+        requests: List[PlaceOrderRequestDTO],
+        products: dict[int, Product],
+        reserved: List[tuple[int, Order]],
+        reservation_ids: dict[int, str],
+    ) -> None:
+        """
+        Batched _renew_reservation: renew every hold in one round trip and reserve
+        the reaped ones again under new holds (updating reservation_ids).
+        
+        Raises:
+            InsufficientStockError: If the stock of a reaped hold was sold in the meantime.
+        """
+        renewed = await self.inventory_cache.renew_reservations(
+            [reservation_ids[index] for index, _ in reserved]
+        )
+        expired = [index for (index, _), ok in zip(reserved, renewed) if not ok]
+        if not expired:
+            return
+        
+        logger.warning(
+            f"AUDIT | EXPIRED | {len(expired)} reservations expired before commit, reserving again"
+        )
+        replacements = {index: uuid4().hex for index in expired}
+        failures = await self.inventory_cache.reserve_batch([
+            (
+                replacements[index],
+                [(item.product_id, item.quantity) for item in requests[index].items],
+            )
+            for index in expired
+        ])
+        
+        # Track the new holds first, so a failure below cancels them too
+        reservation_ids.update(
+            (index, replacements[index])
+            for index, failed_product_id in zip(expired, failures)
+            if failed_product_id is None
+        )
+        for index, failed_product_id in zip(expired, failures):
+            if failed_product_id is not None:
+                raise InsufficientStockError(
+                    product_id=failed_product_id,
+                    requested=sum(
+                        item.quantity for item in requests[index].items
+                        if item.product_id == failed_product_id
+                    ),
+                    available=products[failed_product_id].stock_quantity,
+                )
+    
+    def _confirm_many_after_commit(
+        self, holds: List[tuple[int, str, List[tuple[int, int]]]]
+    ) -> None:
+        """Confirm (order_id, reservation_id, items) holds together once the orders are committed."""
+        
+        async def confirm() -> None:
+            confirmed = await self.inventory_cache.confirm_reservations(
+                [reservation_id for _, reservation_id, _ in holds]
+            )
+            for (order_id, _, items), ok in zip(holds, confirmed):
+                if not ok:
+                    await self._reserve_again(order_id, items)
+        
+        self.after_commit(confirm)
+    
+    def _confirm_after_commit(
+        self, order_id: int, reservation_id: str, request: PlaceOrderRequestDTO
+    ) -> None:
+        """Confirm the hold once the order is committed; rolled-back orders leave it to expire."""
+        items = [(item.product_id, item.quantity) for item in request.items]
+        
+        async def confirm() -> None:
+            if not await self.inventory_cache.confirm_reservation(reservation_id):
+                await self._reserve_again(order_id, items)
+        
+        self.after_commit(confirm)
+    
+    async def _reserve_again(self, order_id: int, items: List[tuple[int, int]]) -> None:
+        """
+        Take the stock of a committed order again after its hold was reaped.
+        
+        Only happens when the commit outlasted the renewed hold. The order
+        exists, so a failure here can only be reported, not rolled back.
+        """
+        reservation_id = uuid4().hex
+        failed_product_id = await self.inventory_cache.reserve_many(items, reservation_id=reservation_id)
+        if failed_product_id is None and await self.inventory_cache.confirm_reservation(reservation_id):
+            logger.warning(f"AUDIT | EXPIRED | Stock for order {order_id} reserved again after commit")
+            return
+        
+        logger.error(
+            f"AUDIT | OVERSOLD | Order {order_id} committed after its hold expired; "
+            f"stock could not be reserved again (product {failed_product_id})"
+        )
     
     def _create_order_entity(
         self,
@@ -272,7 +519,7 @@ class PlaceOrderService:
         )
         
         await self.event_publisher.publish(event)
-        logger.info(f"Published OrderPlaced event for order {order.id}")
+        hot_logger.info("Published OrderPlaced event for order {}", order.id)
     
     async def _publish_order_failed_event(
         self, customer_id: int, reason: str
@@ -291,25 +538,24 @@ class PlaceOrderService:
             failed_at=datetime.now(timezone.utc),
         )
         
-        await self.event_publisher.publish(event)
+        await self.failure_event_publisher.publish(event)
         logger.warning(f"Published OrderFailed event for customer {customer_id}")
     
-    async def _rollback_reservations(
-        self, reserved_items: List[tuple[int, int]]
-    ) -> None:
+    async def _rollback_reservations(self, reservation_id: Optional[str]) -> None:
         """
-        Release all reserved inventory.
+        Cancel the reservation hold and release its inventory.
         
         Args:
-            reserved_items: List of (product_id, quantity) tuples to release.
+            reservation_id: ID of the hold to cancel, or None if nothing was reserved.
         """
-        for product_id, quantity in reserved_items:
-            try:
-                await self.inventory_cache.release_stock(product_id, quantity)
-                logger.debug(
-                    f"Released {quantity} units of product {product_id}"
-                )
-            except Exception as e:
-                logger.error(
-                    f"Failed to release stock for product {product_id}: {e}"
-                )
+        if reservation_id is None:
+            return
+        
+        try:
+            await self.inventory_cache.cancel_reservation(reservation_id)
+            hot_logger.debug("Cancelled reservation {}", reservation_id)
+        except Exception as e:
+            logger.error(
+                f"Failed to cancel reservation {reservation_id}: {e}. "
+                f"It will be reaped when it expires."
+            )
@@ -0,0 +1,35 @@
+"""
+pagination.py
+
+Opaque cursor encoding shared by the query services.
+"""
+
+import base64
+import binascii
+import json
+from typing import Any, List
+
+from src.domain.exceptions import InvalidCursorError
+
+
+def encode_cursor(position: List[Any]) -> str:
+    """Encode a keyset position (JSON-serializable values) as a URL-safe cursor."""
+    raw = json.dumps(position, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> List[Any]:
+    """
+    Decode a cursor produced by encode_cursor.
+    
+    Raises:
+        InvalidCursorError: If the cursor is malformed or does not hold `size` values.
+    """
+    try:
+        position = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (binascii.Error, ValueError) as e:
+        raise InvalidCursorError(cursor) from e
+    
+    if not isinstance(position, list) or len(position) != size:
+        raise InvalidCursorError(cursor)
+    return position
@@ -0,0 +1,97 @@
+"""
+product_query_service.py
+
+ProductQueryService - Read-side use cases for the product catalog.
+Serves catalog browsing and ranked name search with cursor-based pagination.
+"""
+
+from typing import Optional
+from loguru import logger
+
+from src.constants import PAGE_SIZE_DEFAULT
+from src.domain.exceptions import InvalidCursorError
+from src.application.dtos import ProductResponseDTO, ProductPageDTO
+from src.application.service.pagination import encode_cursor, decode_cursor
+from src.interface.protocols.repositories import IProductRepository
+
+
+class ProductQueryService:
+    """
+    Use case: Browse and search the product catalog.
+    
+    Without a search term products are listed by ID; with one they are ranked
+    by name similarity. Either way the next page is addressed by an opaque cursor.
+    """
+    
+    def __init__(self, product_repository: IProductRepository):
+        """
+        Initialize ProductQueryService.
+        
+        Args:
+            product_repository: Repository for product data access.
+        """
+        self.product_repo = product_repository
+    
+    async def list_products(
+        self,
+        search: Optional[str] = None,
+        limit: int = PAGE_SIZE_DEFAULT,
+        cursor: Optional[str] = None,
+    ) -> ProductPageDTO:
+        """
+        Get one page of products.
+        
+        Args:
+            search: Optional name search term.
+            limit: Maximum products per page.
+            cursor: next_cursor of the previous page (from the same search), or None.
+            
+        Returns:
+            ProductPageDTO with the products and the cursor of the next page (None on the last page).
+            
+        Raises:
+            InvalidCursorError: If the cursor is malformed.
+        """
+        if search:
+            return await self._search(search, limit, cursor)
+        
+        after_id = 0
+        if cursor:
+            (after_id,) = decode_cursor(cursor, size=1)
+            if not isinstance(after_id, int):
+                raise InvalidCursorError(cursor)
+        
+        # One extra row tells whether another page exists
+        products = await self.product_repo.list_products(limit=limit + 1, after_id=after_id)
+        has_more = len(products) > limit
+        products = products[:limit]
+        
+        return ProductPageDTO(
+            items=[ProductResponseDTO.from_entity(product) for product in products],
+            next_cursor=encode_cursor([products[-1].id]) if has_more else None,
+        )
+    
+    async def _search(self, term: str, limit: int, cursor: Optional[str]) -> ProductPageDTO:
+        """Ranked search page; the cursor holds the (rank, id) of the last result."""
+        after = None
+        if cursor:
+            rank, product_id = decode_cursor(cursor, size=2)
+            if not isinstance(rank, (int, float)) or not isinstance(product_id, int):
+                raise InvalidCursorError(cursor)
+            after = (float(rank), product_id)
+        
+        matches = await self.product_repo.search_products(term, limit=limit + 1, after=after)
+        has_more = len(matches) > limit
+        matches = matches[:limit]
+        
+        logger.debug(f"AUDIT | Product search '{term}' returned {len(matches)} results")
+        
+        next_cursor = None
+        if has_more:
+            last_product, last_rank = matches[-1]
+            next_cursor = encode_cursor([last_rank, last_product.id])
+        
+        return ProductPageDTO(
+            items=[ProductResponseDTO.from_entity(product) for product, _ in matches],
+            next_cursor=next_cursor,
+        )
@@ -3,33 +3,134 @@ seed_service.py
 
 Application service for managing initial data seeding.
 Orchestrates the population of initial datasets into the system.
+Imports product catalogs of any size by streaming the file and upserting in chunks.
 """
 
+import csv
 import json
 import os
-from typing import List, Dict, Any
+import time
+from decimal import Decimal, InvalidOperation
+from typing import Any, Awaitable, Callable, Dict, Iterator, TextIO
 from loguru import logger
 
 from src.interface.protocols.repositories import IProductRepository
 from src.domain.entities.product import Product
 
 
+def _iter_json_array(
+    file: TextIO, read_size: int = 1 << 16, max_element_size: int = 1 << 20
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the elements of a top-level JSON array while reading the file incrementally.
+
+    Only the element being decoded is held in memory, not the whole document.
+    An element that still does not decode once max_element_size characters
+    are buffered is treated as malformed, instead of reading the rest of the
+    file in search of its end.
+    """
+    decoder = json.JSONDecoder()
+    buffer, pos, eof = "", 0, False
+
+    def fill() -> bool:
+        """Append the next block of the file to the unread part of the buffer."""
+        nonlocal buffer, pos, eof
+        if eof:
+            return False
+        chunk = file.read(read_size)
+        eof = not chunk
+        buffer, pos = buffer[pos:] + chunk, 0
+        return not eof
+
+    def peek() -> str:
+        """Skip whitespace and return the next character ('' at end of file)."""
+        nonlocal pos
+        while True:
+            while pos < len(buffer) and buffer[pos].isspace():
+                pos += 1
+            if pos < len(buffer):
+                return buffer[pos]
+            if not fill():
+                return ""
+
+    if peek() != "[":
+        raise ValueError("Expected a JSON array of products")
+    pos += 1
+    if peek() == "]":
+        return
+
+    while True:
+        if not peek():
+            raise ValueError("Unexpected end of JSON array")
+        try:
+            item, pos = decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError as e:
+            if len(buffer) - pos > max_element_size:
+                raise ValueError(
+                    f"Malformed JSON array element (not decodable within "
+                    f"{max_element_size} characters): {e.msg}"
+                ) from e
+            # The element is cut off at the end of the buffer
+            if not fill():
+                raise
+            continue
+        yield item
+
+        separator = peek()
+        if separator == "]":
+            return
+        if separator != ",":
+            raise ValueError(f"Unexpected {separator!r} after an element of the JSON array")
+        pos += 1
+
+
+def _iter_ndjson(file: TextIO) -> Iterator[Dict[str, Any]]:
+    """Yield one JSON object per non-empty line."""
+    for line in file:
+        if line.strip():
+            yield json.loads(line)
+
+
+def _iter_csv(file: TextIO) -> Iterator[Dict[str, Any]]:
+    """Yield one dict per CSV row, keyed by the header row."""
+    yield from csv.DictReader(file)
+
+
+READERS = {
+    ".json": _iter_json_array,
+    ".ndjson": _iter_ndjson,
+    ".jsonl": _iter_ndjson,
+    ".csv": _iter_csv,
+}
+
+
 class SeedService:
     """
     Service responsible for seeding the system with initial data.
     Ensures that the core product catalog and other baseline datasets are populated.
+
+    Imports are idempotent: products are matched by SKU, created when new and
+    updated otherwise. Each chunk is committed on its own, so an import holds
+    no long transaction and a failed import keeps the chunks written before it
+    (re-running it updates them).
     """
 
-    def __init__(self, product_repository: IProductRepository):
+    def __init__(
+        self,
+        product_repository: IProductRepository,
+        commit: Callable[[], Awaitable[None]],
+    ):
         """
         Initialize SeedService.
 
         Args:
             product_repository: Repository for product persistence.
+            commit: Commits the session shared with the repository.
         """
         self.product_repo = product_repository
+        self.commit = commit
 
-    async def seed_products_from_json(self, file_path: str) -> Dict[str, int]:
+    async def seed_products_from_json(self, file_path: str) -> Dict[str, float]:
         """
         Load products from a JSON file and persist them.
 
@@ -39,45 +140,104 @@ class SeedService:
         Returns:
             Dictionary containing 'created' and 'updated' counts.
         """
-        logger.info(f"AUDIT | Seeding products from {file_path}")
-        
+        return await self.import_products(file_path)
+
+    async def import_products(
+        self,
+        file_path: str,
+        chunk_size: int = 1000,
+        use_copy: bool = False,
+    ) -> Dict[str, float]:
+        """
+        Stream products from a JSON array, NDJSON or CSV file and upsert them in chunks.
+
+        The file is parsed incrementally and each chunk is written with a single
+        `INSERT ... ON CONFLICT (sku) DO UPDATE` (or a COPY into a staging table)
+        and committed, so memory and transaction size stay flat and round trips
+        are per chunk instead of per product. Records that fail validation are
+        skipped and counted.
+
+        Args:
+            file_path: Path to a .json, .ndjson/.jsonl or .csv file.
+            chunk_size: Products written per statement.
+            use_copy: Load chunks with COPY through a staging table (PostgreSQL/asyncpg).
+
+        Returns:
+            Dictionary with 'created', 'updated' and 'skipped' counts, 'seconds' elapsed
+            and 'rate' (products per second).
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            ValueError: If the file format is not supported or the file is malformed.
+        """
+        logger.info(f"AUDIT | Seeding products from {file_path} | Chunk: {chunk_size} | COPY: {use_copy}")
+
         if not os.path.exists(file_path):
             error_msg = f"Seed file not found: {file_path}"
             logger.error(f"AUDIT | FAILED | {error_msg}")
             raise FileNotFoundError(error_msg)
 
-        with open(file_path, "r") as f:
-            products_data: List[Dict[str, Any]] = json.load(f)
+        reader = READERS.get(os.path.splitext(file_path)[1].lower())
+        if reader is None:
+            raise ValueError(f"Unsupported seed file format: {file_path} (expected one of {sorted(READERS)})")
 
+        upsert = self.product_repo.copy_upsert_many if use_copy else self.product_repo.upsert_many
+        started = time.perf_counter()
         created_count = 0
         updated_count = 0
+        skipped_count = 0
+        # Keyed by SKU: a row may only be upserted once per statement, the last one wins
+        chunk: Dict[str, Product] = {}
+
+        async def flush() -> None:
+            nonlocal created_count, updated_count
+            results = await upsert(list(chunk.values()))
+            await self.commit()
+            created = sum(1 for _, was_created in results if was_created)
+            created_count += created
+            updated_count += len(results) - created
+            chunk.clear()
+            logger.debug(f"AUDIT | Seeded {created_count + updated_count} products so far")
+
+        with open(file_path, "r", newline="") as f:
+            for index, record in enumerate(reader(f)):
+                try:
+                    product = self._to_product(record)
+                except (KeyError, TypeError, ValueError, InvalidOperation) as e:
+                    skipped_count += 1
+                    logger.warning(f"AUDIT | Skipping product record {index}: {e!r}")
+                    continue
+
+                chunk[product.sku] = product
+                if len(chunk) >= chunk_size:
+                    await flush()
+
+            if chunk:
+                await flush()
+
+        seconds = time.perf_counter() - started
+        total = created_count + updated_count
+        rate = total / seconds if seconds > 0 else 0.0
+        logger.info(
+            f"AUDIT | SUCCESS | Seeded {created_count} created, {updated_count} updated, "
+            f"{skipped_count} skipped in {seconds:.2f}s ({rate:.0f} products/s)"
+        )
+        return {
+            "created": created_count,
+            "updated": updated_count,
+            "skipped": skipped_count,
+            "seconds": seconds,
+            "rate": rate,
+        }
 
-        for p_data in products_data:
-            sku = p_data.get("sku")
-            existing_product = await self.product_repo.get_by_sku(sku)
-
-            if existing_product:
-                # Update existing product
-                logger.debug(f"AUDIT | Updating existing product SKU: {sku}")
-                existing_product.name = p_data["name"]
-                existing_product.description = p_data["description"]
-                existing_product.price = p_data["price"]
-                existing_product.stock_quantity = p_data["stock_quantity"]
-                await self.product_repo.save(existing_product)
-                updated_count += 1
-            else:
-                # Create new product
-                logger.debug(f"AUDIT | Creating new product SKU: {sku}")
-                new_product = Product(
-                    id=None,
-                    sku=sku,
-                    name=p_data["name"],
-                    description=p_data["description"],
-                    price=p_data["price"],
-                    stock_quantity=p_data["stock_quantity"]
-                )
-                await self.product_repo.save(new_product)
-                created_count += 1
-
-        logger.info(f"AUDIT | SUCCESS | Seeded {created_count} created, {updated_count} updated.")
-        return {"created": created_count, "updated": updated_count}
+    @staticmethod
+    def _to_product(record: Dict[str, Any]) -> Product:
+        """Map a seed record (JSON values or CSV strings) to a new Product entity."""
+        return Product(
+            id=None,
+            sku=str(record["sku"]).strip(),
+            name=record["name"],
+            description=record.get("description") or "",
+            price=Decimal(str(record["price"])),
+            stock_quantity=int(record.get("stock_quantity") or 0),
+        )
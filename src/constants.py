@@ -26,6 +26,7 @@ class EventTypes(str, Enum):
 # Database constants
 PAGE_SIZE_DEFAULT = 20
 PAGE_SIZE_MAX = 100
+EXPORT_BATCH_SIZE = 1000  # Rows per server-side cursor fetch
 
 # Cache TTLs (in seconds)
 CACHE_TTL_PRODUCT = 3600
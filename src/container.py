@@ -5,16 +5,30 @@ Centralized Dependency Injection container.
 Initializes and manages instances of repositories, services, and clients.
 """
 
-from typing import Optional
+from typing import Dict, List, Optional
+import httpx
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from redis import asyncio as aioredis
 from loguru import logger
 
-from src.infrastructure.repositories import ProductRepository, OrderRepository
+from src.infrastructure.repositories import (
+    ProductRepository,
+    OrderRepository,
+    CachedProductRepository,
+    OrderQueryRepository,
+    TransactionalSession,
+)
 from src.infrastructure.caching.redis_inventory_cache import RedisInventoryCache
+from src.infrastructure.caching.inventory_write_behind import InventoryWriteBehind
+from src.infrastructure.caching.product_catalog_cache import ProductCatalogCache
+from src.infrastructure.caching.redis_product_cache import RedisProductCache
+from src.infrastructure.caching.idempotency_store import RedisIdempotencyStore
+from src.infrastructure.caching.token_verification_cache import TokenVerificationCache
+from src.infrastructure.repositories.outbox_repository import OutboxRepository
 from src.infrastructure.messaging.rabbitmq_publisher import RabbitMQPublisher
+from src.infrastructure.messaging.outbox_publisher import OutboxEventPublisher, DetachedOutboxPublisher
 from src.infrastructure.clients.auth_provider import AuthProvider
-from src.application.service import PlaceOrderService, SeedService
+from src.application.service import PlaceOrderService, SeedService, OrderQueryService, ProductQueryService
 from configs.service_config import settings
 
 
@@ -33,8 +47,9 @@ class AppContainer:
             max_overflow=settings.DATABASE_MAX_OVERFLOW,
             echo=settings.DATABASE_ECHO,
         )
+        # Sessions run after-commit callbacks (hold confirmation, cache invalidation)
         self.session_factory = async_sessionmaker(
-            self.engine, expire_on_commit=False, class_=AsyncSession
+            self.engine, expire_on_commit=False, class_=TransactionalSession
         )
         
         # Redis setup
@@ -45,12 +60,60 @@ class AppContainer:
         )
         
         # Infrastructure Clients
-        self.inventory_cache = RedisInventoryCache(self.redis)
-        self.event_publisher = RabbitMQPublisher(settings.RABBITMQ_URL)
+        self.product_cache = ProductCatalogCache(
+            self.redis,
+            max_size=settings.PRODUCT_CACHE_MAX_SIZE,
+            ttl=settings.PRODUCT_CACHE_TTL,
+        )
+        self.shared_product_cache = RedisProductCache(self.redis)
+        self.inventory_cache = RedisInventoryCache(
+            self.redis,
+            reservation_ttl=settings.INVENTORY_RESERVATION_TTL,
+            stock_loader=self.load_stock_levels,
+            journal=settings.INVENTORY_SYNC_ENABLED,
+        )
+        self.inventory_write_behind = InventoryWriteBehind(
+            self.redis, self.inventory_cache, self.session_factory
+        )
+        self.idempotency_store = RedisIdempotencyStore(
+            self.redis,
+            in_flight_ttl=settings.IDEMPOTENCY_IN_FLIGHT_TTL,
+            result_ttl=settings.IDEMPOTENCY_RESULT_TTL,
+            wait_timeout=settings.IDEMPOTENCY_WAIT_TIMEOUT,
+        )
+        # Broker publisher is only used by the worker's outbox relay;
+        # request handlers write events to the outbox instead
+        self.event_publisher = RabbitMQPublisher(
+            settings.RABBITMQ_URL,
+            channel_pool_size=settings.RABBITMQ_CHANNEL_POOL_SIZE,
+            batch_size=settings.RABBITMQ_PUBLISH_BATCH_SIZE,
+            linger=settings.RABBITMQ_PUBLISH_LINGER,
+            max_in_flight=settings.RABBITMQ_MAX_IN_FLIGHT,
+        )
+        self.failure_event_publisher = DetachedOutboxPublisher(self.session_factory)
+        # One pooled keep-alive client for the app's lifetime instead of a
+        # new connection (and TLS handshake) per authorization check
+        self.auth_http_client = httpx.AsyncClient(
+            http2=settings.AUTH_SERVICE_HTTP2,
+            timeout=settings.AUTH_SERVICE_TIMEOUT,
+            limits=httpx.Limits(
+                max_connections=settings.AUTH_SERVICE_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.AUTH_SERVICE_MAX_KEEPALIVE,
+                keepalive_expiry=settings.AUTH_SERVICE_KEEPALIVE_EXPIRY,
+            ),
+        )
         self.auth_provider = AuthProvider(
             base_url=settings.AUTH_SERVICE_URL,
             api_key=settings.INTERNAL_API_KEY,
-            jwt_secret=settings.SUPABASE_JWT_SECRET
+            jwt_secret=settings.SUPABASE_JWT_SECRET,
+            token_cache=TokenVerificationCache(
+                max_size=settings.AUTH_TOKEN_CACHE_MAX_SIZE,
+                ttl=settings.AUTH_TOKEN_CACHE_TTL,
+            ),
+            http_client=self.auth_http_client,
+            decision_cache_ttl=settings.AUTH_DECISION_CACHE_TTL,
+            decision_cache_max_size=settings.AUTH_DECISION_CACHE_MAX_SIZE,
+            max_concurrency=settings.AUTH_SERVICE_MAX_CONCURRENCY,
         )
         
     @classmethod
@@ -59,25 +122,52 @@ class AppContainer:
             cls._instance = AppContainer()
         return cls._instance
 
+    async def load_stock_levels(self, product_ids: List[int]) -> Dict[int, int]:
+        """
+        Stock for the given products' missing Redis counters (inventory cache read-through).
+        
+        PostgreSQL stock minus units held by open reservations and sales not yet
+        written behind, which the lost counter had already taken. Runs inside
+        the cache's single-flight load.
+        """
+        # Bypasses the catalog cache: its stock_quantity may be stale
+        return await self.inventory_write_behind.available_stocks(product_ids)
+
     # Methods to get service instances
-    def product_repository(self, session: AsyncSession) -> ProductRepository:
-        return ProductRepository(session)
+    def product_repository(self, session: TransactionalSession) -> CachedProductRepository:
+        return CachedProductRepository(
+            ProductRepository(session),
+            self.product_cache,
+            after_commit=session.after_commit,
+            shared_cache=self.shared_product_cache,
+        )
     
     def order_repository(self, session: AsyncSession) -> OrderRepository:
         return OrderRepository(session)
     
-    def place_order_service(self, session: AsyncSession) -> PlaceOrderService:
+    def place_order_service(self, session: TransactionalSession) -> PlaceOrderService:
         return PlaceOrderService(
             product_repository=self.product_repository(session),
             order_repository=self.order_repository(session),
             inventory_cache=self.inventory_cache,
-            event_publisher=self.event_publisher,
+            event_publisher=OutboxEventPublisher(OutboxRepository(session)),
+            after_commit=session.after_commit,
+            failure_event_publisher=self.failure_event_publisher,
         )
     
-    def seed_service(self, session: AsyncSession) -> SeedService:
+    def order_query_service(self, session: AsyncSession) -> OrderQueryService:
+        """Get an instance of OrderQueryService."""
+        return OrderQueryService(order_read_repository=OrderQueryRepository(session))
+    
+    def product_query_service(self, session: AsyncSession) -> ProductQueryService:
+        """Get an instance of ProductQueryService."""
+        return ProductQueryService(product_repository=ProductRepository(session))
+    
+    def seed_service(self, session: TransactionalSession) -> SeedService:
         """Get an instance of SeedService."""
         return SeedService(
-            product_repository=self.product_repository(session)
+            product_repository=self.product_repository(session),
+            commit=session.commit,
         )
 
     async def dispose(self) -> None:
@@ -106,7 +196,11 @@ class AppContainer:
             except Exception as e:
                 logger.warning(f"AUDIT | DISPOSAL | RabbitMQ close failed: {e}")
 
-            # 4. Final step: Clear loggers to stop enqueue threads/processes (Fixes semaphore leaks)
+            # 4. Close Auth Service connections
+            await self.auth_provider.close()
+            logger.debug("AUDIT | DISPOSAL | Auth Service client closed.")
+
+            # 5. Final step: Clear loggers to stop enqueue threads/processes (Fixes semaphore leaks)
             logger.info("AUDIT | SUCCESS | DISPOSAL | Resources cleared. Shutting down logging...")
             logger.remove()
             
@@ -6,13 +6,15 @@ These functions retrieve service instances from the centralized container
 and enforce security constraints like Bearer token validation.
 """
 
-from typing import AsyncGenerator, Dict, Any
+from typing import AsyncGenerator, Awaitable, Callable, Dict, Any
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from loguru import logger
 
 from src.container import get_container
-from src.application.service import PlaceOrderService
+from src.application.service import PlaceOrderService, OrderQueryService, ProductQueryService
+from src.infrastructure.caching.idempotency_store import RedisIdempotencyStore
+from src.interface.protocols.infrastructure import IAuthProvider
 
 
 # Security schema for Bearer Token
@@ -47,17 +49,50 @@ async def get_auth_payload(
         HTTPException: If token is invalid or missing.
     """
     container = get_container()
-    try:
-        token = credentials.credentials
-        payload = container.auth_provider.verify_token(token)
-        return payload
-    except ValueError as e:
-        logger.warning(f"AUDIT | Security Breach Attempt | {str(e)}")
+    payload = await container.auth_provider.verify_token(credentials.credentials)
+    if payload is None:
+        logger.warning("AUDIT | Security Breach Attempt | Invalid or expired token")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
             headers={"WWW-Authenticate": "Bearer"},
-        ) from e
+        )
+    return payload
+
+
+def get_auth_provider() -> IAuthProvider:
+    """Inject the shared auth provider."""
+    container = get_container()
+    return container.auth_provider
+
+
+def require_permission(permission: str) -> Callable[..., Awaitable[Dict[str, Any]]]:
+    """
+    Build a dependency that lets only callers holding `permission` through.
+
+    The token is validated like get_auth_payload, then checked against the
+    central Auth Service.
+
+    Returns:
+        Dependency returning the decoded JWT payload.
+
+    Raises:
+        HTTPException: 401 if the token is invalid, 403 if the permission is denied.
+    """
+    async def dependency(
+        credentials: HTTPAuthorizationCredentials = Depends(security),
+        payload: Dict[str, Any] = Depends(get_auth_payload),
+        auth_provider: IAuthProvider = Depends(get_auth_provider),
+    ) -> Dict[str, Any]:
+        if not await auth_provider.authorize(credentials.credentials, permission):
+            logger.warning(f"AUDIT | FORBIDDEN | {payload.get('sub')} lacks {permission}")
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=f"Missing permission: {permission}",
+            )
+        return payload
+
+    return dependency
 
 
 async def get_place_order_service(
@@ -66,3 +101,25 @@ async def get_place_order_service(
     """Inject PlaceOrderService with an active DB session."""
     container = get_container()
     return container.place_order_service(session)
+
+
+async def get_order_query_service(
+    session=Depends(get_session)
+) -> OrderQueryService:
+    """Inject OrderQueryService with an active DB session."""
+    container = get_container()
+    return container.order_query_service(session)
+
+
+async def get_product_query_service(
+    session=Depends(get_session)
+) -> ProductQueryService:
+    """Inject ProductQueryService with an active DB session."""
+    container = get_container()
+    return container.product_query_service(session)
+
+
+def get_idempotency_store() -> RedisIdempotencyStore:
+    """Inject the shared Idempotency-Key store."""
+    container = get_container()
+    return container.idempotency_store
@@ -129,6 +129,34 @@ class PaymentFailedError(DomainException):
         self.reason = reason
 
 
+# ==================== Query Exceptions ====================
+
+class InvalidCursorError(DomainException):
+    """Raised when a pagination cursor cannot be decoded."""
+    
+    def __init__(self, cursor: str):
+        super().__init__("Invalid pagination cursor")
+        self.cursor = cursor
+
+
+# ==================== Idempotency Exceptions ====================
+
+class IdempotencyKeyInUseError(DomainException):
+    """Raised when a request with the same idempotency key is still being processed."""
+    
+    def __init__(self, key: str):
+        super().__init__(f"A request with idempotency key '{key}' is still in progress")
+        self.key = key
+
+
+class IdempotencyKeyMismatchError(DomainException):
+    """Raised when an idempotency key is reused with a different request payload."""
+    
+    def __init__(self, key: str):
+        super().__init__(f"Idempotency key '{key}' was already used with a different request")
+        self.key = key
+
+
 # ==================== General Business Rule Violations ====================
 
 class BusinessRuleViolationError(DomainException):
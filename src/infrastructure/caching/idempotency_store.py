@@ -0,0 +1,119 @@
+"""
+idempotency_store.py
+
+Redis-backed store of responses for idempotent request retries.
+Collapses concurrent duplicates with a short in-flight marker.
+"""
+
+import asyncio
+import json
+from typing import Optional
+from redis import asyncio as aioredis
+from loguru import logger
+
+from src.domain.exceptions import IdempotencyKeyInUseError, IdempotencyKeyMismatchError
+
+
+# Deletes KEYS[1] only if it still holds the in-flight marker ARGV[1].
+RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+class RedisIdempotencyStore:
+    """
+    Records the outcome of requests carrying an idempotency key.
+
+    Lifecycle of a key:
+    1. begin(): SET NX of an in-flight marker (with a short TTL) claims the key
+    2. complete(): the marker is replaced by the serialized response (long TTL)
+    3. release(): on failure the marker is removed so the client can retry
+
+    A duplicate that arrives while the first request is in flight waits for its
+    response (up to wait_timeout) instead of running the request again. Each
+    entry stores a fingerprint of the request payload, so reusing a key for a
+    different request is rejected.
+    """
+
+    def __init__(
+        self,
+        redis_client: aioredis.Redis,
+        in_flight_ttl: int = 30,
+        result_ttl: int = 86400,
+        wait_timeout: float = 5.0,
+        poll_interval: float = 0.05,
+    ):
+        """
+        Initialize idempotency store.
+
+        Args:
+            redis_client: Redis client instance.
+            in_flight_ttl: Seconds a claimed key stays locked if its request never finishes.
+            result_ttl: Seconds a stored response is replayed to retries.
+            wait_timeout: Seconds a duplicate waits for the in-flight request's response.
+            poll_interval: Seconds between checks while waiting.
+        """
+        self.redis = redis_client
+        self.in_flight_ttl = in_flight_ttl
+        self.result_ttl = result_ttl
+        self.wait_timeout = wait_timeout
+        self.poll_interval = poll_interval
+
+    def _get_key(self, scope: str, key: str) -> str:
+        """Get Redis key for an idempotency key within a scope (e.g. the caller)."""
+        return f"idempotency:{scope}:{key}"
+
+    @staticmethod
+    def _marker(fingerprint: str) -> str:
+        """In-flight marker value for a request fingerprint."""
+        return json.dumps({"fingerprint": fingerprint})
+
+    async def begin(self, scope: str, key: str, fingerprint: str) -> Optional[str]:
+        """
+        Claim a key, or get the response stored for it.
+
+        Returns:
+            None if the caller now owns the key and must run the request, otherwise
+            the stored response body to replay.
+
+        Raises:
+            IdempotencyKeyMismatchError: If the key was used for a different request.
+            IdempotencyKeyInUseError: If the first request is still running after wait_timeout.
+        """
+        redis_key = self._get_key(scope, key)
+        deadline = asyncio.get_running_loop().time() + self.wait_timeout
+
+        while True:
+            if await self.redis.set(redis_key, self._marker(fingerprint), ex=self.in_flight_ttl, nx=True):
+                return None
+
+            stored = await self.redis.get(redis_key)
+            if stored is None:
+                continue  # Released or expired in between; try to claim it again
+
+            entry = json.loads(stored)
+            if entry["fingerprint"] != fingerprint:
+                logger.warning(f"AUDIT | FAILED | Idempotency key {key} reused with a different payload")
+                raise IdempotencyKeyMismatchError(key)
+            if "body" in entry:
+                logger.info(f"AUDIT | REPLAY | Idempotency key {key}")
+                return entry["body"]
+
+            if asyncio.get_running_loop().time() >= deadline:
+                raise IdempotencyKeyInUseError(key)
+            await asyncio.sleep(self.poll_interval)
+
+    async def complete(self, scope: str, key: str, fingerprint: str, body: str) -> None:
+        """Store the response of a claimed key for replay."""
+        await self.redis.set(
+            self._get_key(scope, key),
+            json.dumps({"fingerprint": fingerprint, "body": body}),
+            ex=self.result_ttl,
+        )
+
+    async def release(self, scope: str, key: str, fingerprint: str) -> None:
+        """Give up a claimed key without a response, so a retry runs the request again."""
+        await self.redis.eval(RELEASE_SCRIPT, 1, self._get_key(scope, key), self._marker(fingerprint))
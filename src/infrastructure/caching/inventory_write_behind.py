@@ -0,0 +1,203 @@
+"""
+inventory_write_behind.py
+
+Writes stock sold in Redis behind to PostgreSQL.
+Drains the stock journal stream in coalesced, batched updates and reports drift
+between the two stores.
+"""
+
+import json
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+from redis import asyncio as aioredis
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from loguru import logger
+
+from src.infrastructure.caching.redis_inventory_cache import RedisInventoryCache
+from src.infrastructure.repositories.product_repository import ProductRepository
+from src.infrastructure.repositories.inventory_sync_repository import InventorySyncRepository
+
+JournalEntry = Tuple[str, Dict[str, str]]
+
+
+@dataclass
+class StockDrift:
+    """Stock of one product in both stores."""
+
+    product_id: int
+    database: int
+    redis: Optional[int]  # None when the product is not cached
+    in_flight: int  # Held by open reservations, or sold but not yet written behind
+
+    @property
+    def drift(self) -> Optional[int]:
+        """Redis stock minus what it should be given the database and in-flight units."""
+        if self.redis is None:
+            return None
+        return self.redis - (self.database - self.in_flight)
+
+
+class InventoryWriteBehind:
+    """
+    Applies the stock journal to products.stock_quantity.
+
+    The inventory cache appends every confirmed reservation to a Redis stream
+    in the same script that confirms it, so a sale is journaled durably even if
+    the process dies right after. Each flush:
+    1. Locks this stream's offset row (FOR UPDATE), serializing workers
+    2. Reads the next batch of entries after the offset
+    3. Coalesces them to one delta per product and applies them in one UPDATE;
+       deltas the database rejects are copied to a dead-letter stream
+    4. Stores the new offset in the same transaction
+    5. Settles the applied entries: takes them off the pending counters and trims them
+
+    A crash before commit re-reads the same entries; after commit they are
+    skipped, so every sale is applied exactly once. A crash between commit and
+    settling is caught up by the next flush, which settles everything up to the
+    committed offset first.
+    """
+
+    DEAD_LETTER_KEY = "inventory:stock_journal:rejected"
+
+    def __init__(
+        self,
+        redis_client: aioredis.Redis,
+        inventory_cache: RedisInventoryCache,
+        session_factory: async_sessionmaker[AsyncSession],
+    ):
+        """
+        Initialize write-behind.
+
+        Args:
+            redis_client: Redis client holding the stock journal.
+            inventory_cache: Inventory cache whose journal is drained.
+            session_factory: Factory for database sessions.
+        """
+        self.redis = redis_client
+        self.inventory_cache = inventory_cache
+        self.session_factory = session_factory
+        self.journal_key = inventory_cache.JOURNAL_KEY
+        self.settled_key = inventory_cache.SETTLED_KEY
+
+    async def flush(self, batch_size: int = 1000) -> int:
+        """
+        Apply up to batch_size journal entries to PostgreSQL.
+
+        Returns:
+            Number of entries applied (a full batch means more may be waiting).
+        """
+        async with self.session_factory() as session:
+            offsets = InventorySyncRepository(session)
+            offset = await offsets.lock_offset(self.journal_key)
+            await self._settle_through(offset, batch_size)
+
+            entries = await self._read_after(offset, batch_size)
+            if not entries:
+                return 0
+
+            deltas = self._coalesce(entries)
+            applied = await ProductRepository(session).update_stock_many(deltas)
+            last_id = entries[-1][0]
+            rejected = {
+                product_id: delta for product_id, delta in deltas.items() if product_id not in applied
+            }
+            if rejected:
+                # Unknown products, or sales the database stock cannot cover: kept for
+                # reconciliation before the offset moves past them (a retried flush
+                # may record them twice, with the same `through` entry ID)
+                await self.redis.xadd(
+                    self.DEAD_LETTER_KEY, {"through": last_id, "deltas": json.dumps(rejected)}
+                )
+                logger.error(f"AUDIT | DRIFT | Stock journal deltas not applicable, dead-lettered: {rejected}")
+
+            await offsets.set_offset(self.journal_key, last_id)
+            await session.commit()
+
+        # Applied entries are no longer in flight; if this fails the next flush settles them
+        sold = {product_id: -delta for product_id, delta in deltas.items()}
+        await self.inventory_cache.settle_journal(offset, last_id, sold)
+
+        logger.info(
+            f"AUDIT | SUCCESS | Wrote behind {len(entries)} journal entries "
+            f"as {len(applied)} product stock updates"
+        )
+        return len(entries)
+
+    async def _settle_through(self, offset: str, page_size: int) -> None:
+        """Settle committed entries up to offset that a previous flush failed to settle."""
+        settled = await self.redis.get(self.settled_key)
+        if settled is None:
+            # First flush since the counters were introduced (or Redis lost them):
+            # nothing journaled up to the offset was ever counted as pending
+            await self.redis.set(self.settled_key, offset, nx=True)
+            return
+
+        while settled != offset:
+            entries = await self.redis.xrange(
+                self.journal_key, min=f"({settled}", max=offset, count=page_size
+            )
+            # Entries lost from the stream can no longer be counted; just move the marker
+            through = entries[-1][0] if entries else offset
+            sold = {product_id: -delta for product_id, delta in self._coalesce(entries).items()}
+            if not await self.inventory_cache.settle_journal(settled, through, sold):
+                return  # Settled concurrently by a flush finishing after its commit
+            settled = through
+
+    async def in_flight_quantities(self, product_ids: List[int]) -> Dict[int, int]:
+        """Units per product held by open reservations or journaled but not yet applied."""
+        return await self.inventory_cache.in_flight_quantities(product_ids)
+
+    async def available_stocks(self, product_ids: List[int]) -> Dict[int, int]:
+        """
+        Stock the Redis counters of products should hold: database stock minus in-flight units.
+
+        Used to rebuild missing counters (inventory cache read-through). In-flight
+        units are read before the database, so a flush running in between can
+        only make the result too low (double-counted), never too high (resold).
+        """
+        in_flight = await self.in_flight_quantities(product_ids)
+        async with self.session_factory() as session:
+            products = await ProductRepository(session).get_many_by_ids(product_ids)
+        return {
+            product.id: max(0, product.stock_quantity - in_flight.get(product.id, 0))
+            for product in products
+        }
+
+    async def compare(
+        self,
+        database_stocks: Dict[int, int],
+        in_flight: Dict[int, int],
+    ) -> List[StockDrift]:
+        """
+        Compare database stock with Redis stock for a chunk of products.
+
+        Not a consistent snapshot: orders placed while comparing show up as
+        transient drift, so run it again before acting on small differences.
+
+        Args:
+            database_stocks: Stock per product ID read from PostgreSQL.
+            in_flight: Result of in_flight_quantities() for these products.
+        """
+        redis_stocks = await self.inventory_cache.get_stocks(list(database_stocks))
+        return [
+            StockDrift(
+                product_id=product_id,
+                database=stock,
+                redis=redis_stocks.get(product_id),
+                in_flight=in_flight.get(product_id, 0),
+            )
+            for product_id, stock in database_stocks.items()
+        ]
+
+    async def _read_after(self, offset: str, count: int) -> List[JournalEntry]:
+        """Read up to count journal entries with IDs greater than offset."""
+        return await self.redis.xrange(self.journal_key, min=f"({offset}", count=count)
+
+    @staticmethod
+    def _coalesce(entries: Sequence[JournalEntry]) -> Dict[int, int]:
+        """Sum the sold quantities of journal entries into one negative delta per product."""
+        deltas: Dict[int, int] = {}
+        for _, fields in entries:
+            for product_id, quantity in json.loads(fields["items"]):
+                deltas[product_id] = deltas.get(product_id, 0) - quantity
+        return deltas
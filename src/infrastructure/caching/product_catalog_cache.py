@@ -0,0 +1,156 @@
+"""
+product_catalog_cache.py
+
+In-process LRU/TTL cache of Product entities.
+Invalidated across replicas through a Redis pub/sub channel.
+"""
+
+import asyncio
+import copy
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, List
+from redis import asyncio as aioredis
+from loguru import logger
+
+from src.domain.entities import Product
+
+
+class ProductCatalogCache:
+    """
+    Bounded in-memory cache for catalog data (sku, name, price) that rarely changes.
+
+    Features:
+    1. LRU eviction once max_size entries are held
+    2. Per-entry TTL as an upper bound on staleness if an invalidation is lost
+    3. Cross-replica invalidation: writers publish product IDs, every replica evicts them
+    4. Versioned fills: a load that started before an invalidation is not cached
+    """
+
+    INVALIDATION_CHANNEL = "catalog:products:invalidate"
+
+    def __init__(
+        self,
+        redis_client: aioredis.Redis,
+        max_size: int = 10000,
+        ttl: float = 60.0,
+    ):
+        """
+        Initialize product catalog cache.
+
+        Args:
+            redis_client: Redis client used to publish and receive invalidations.
+            max_size: Maximum number of products held in memory.
+            ttl: Seconds an entry may be served before it is reloaded.
+        """
+        self.redis = redis_client
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[int, tuple[float, Product]]" = OrderedDict()
+        self._version = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def version(self) -> int:
+        """Invalidation counter; capture it before loading from the database."""
+        return self._version
+
+    def get_many(self, product_ids: Iterable[int]) -> Dict[int, Product]:
+        """
+        Return cached products by ID; absent or expired IDs are counted as misses.
+        Copies are returned so callers cannot mutate the cached entities.
+        """
+        now = time.monotonic()
+        found: Dict[int, Product] = {}
+
+        for product_id in product_ids:
+            entry = self._entries.get(product_id)
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    del self._entries[product_id]
+                self.misses += 1
+                continue
+
+            self._entries.move_to_end(product_id)
+            found[product_id] = copy.copy(entry[1])
+            self.hits += 1
+
+        return found
+
+    def put_many(self, products: Iterable[Product], version: int) -> None:
+        """
+        Cache products loaded from the database.
+
+        Args:
+            products: Freshly loaded products.
+            version: Value of `version` captured before the load; if an invalidation
+                happened since, the products may be stale and are not cached.
+        """
+        if version != self._version:
+            return
+
+        expires_at = time.monotonic() + self.ttl
+        for product in products:
+            self._entries[product.id] = (expires_at, copy.copy(product))
+            self._entries.move_to_end(product.id)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def evict(self, product_ids: Iterable[int]) -> None:
+        """Drop products from this replica's cache."""
+        self._version += 1
+        for product_id in product_ids:
+            self._entries.pop(product_id, None)
+
+    async def invalidate(self, product_ids: List[int]) -> None:
+        """Evict products locally and tell every other replica to do the same."""
+        self.evict(product_ids)
+        try:
+            await self.redis.publish(
+                self.INVALIDATION_CHANNEL, ",".join(str(product_id) for product_id in product_ids)
+            )
+        except Exception as e:
+            # Other replicas fall back to TTL expiry
+            logger.warning(f"AUDIT | FAILED | Product cache invalidation publish: {e}")
+
+    async def listen_for_invalidations(self) -> None:
+        """
+        Subscribe to the invalidation channel and evict announced products.
+        Runs until cancelled; reconnects after errors.
+        """
+        while True:
+            pubsub = self.redis.pubsub()
+            try:
+                await pubsub.subscribe(self.INVALIDATION_CHANNEL)
+                logger.info("AUDIT | START | Listening for product cache invalidations")
+                async for message in pubsub.listen():
+                    if message.get("type") != "message":
+                        continue
+                    self.evict(int(product_id) for product_id in str(message["data"]).split(",") if product_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Anything published while disconnected is missed; start clean
+                logger.error(f"AUDIT | FAILED | Product cache invalidation listener: {e}")
+                self.clear()
+                await asyncio.sleep(1)
+            finally:
+                await pubsub.aclose()
+
+    def clear(self) -> None:
+        """Drop every cached product."""
+        self._version += 1
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss/eviction counters and current size."""
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
@@ -2,53 +2,259 @@
 redis_inventory_cache.py
 
 Redis-based implementation of IInventoryCache.
-Provides atomic stock reservation using distributed locks.
+Provides atomic stock reservation using server-side Lua scripts.
 """
 
 import asyncio
-from typing import Optional
+import hashlib
+import json
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
 from redis import asyncio as aioredis
+from redis.exceptions import NoScriptError
 from loguru import logger
+from configs.logging_config import hot_logger
 
 from src.interface.protocols.infrastructure import IInventoryCache
-from src.domain.exceptions import InventoryLockError
+
+
+# Atomically checks every stock key and decrements all of them, or none.
+# Returns 0 on success, -i when KEYS[i] is missing, i when KEYS[i] is short.
+# When three extra keys (ledger zset, hold hash, held-units hash) and three extra
+# args (hold id, hold TTL in seconds, JSON items) are passed, the hold is recorded
+# in the same script, with a deadline taken from the Redis server clock, and its
+# units are added to the per-product held counters. Hold mode is recognised by
+# the JSON items list in the last arg (stock args are plain integers).
+RESERVE_MANY_SCRIPT = """
+local n = #KEYS
+local hold = #ARGV > 0 and string.sub(ARGV[#ARGV], 1, 1) == '['
+if hold then
+    n = n - 3
+end
+for i = 1, n do
+    local stock = redis.call('GET', KEYS[i])
+    if not stock then
+        return -i
+    end
+    if tonumber(stock) < tonumber(ARGV[i]) then
+        return i
+    end
+end
+for i = 1, n do
+    redis.call('DECRBY', KEYS[i], ARGV[i])
+end
+if hold then
+    local now = redis.call('TIME')
+    local deadline = tonumber(now[1]) + tonumber(ARGV[n + 2])
+    redis.call('ZADD', KEYS[n + 1], deadline, ARGV[n + 1])
+    redis.call('HSET', KEYS[n + 2], ARGV[n + 1], ARGV[n + 3])
+    for _, item in ipairs(cjson.decode(ARGV[n + 3])) do
+        redis.call('HINCRBY', KEYS[n + 3], item[1], item[2])
+    end
+end
+return 0
+"""
+
+# Removes one hold from the ledger, takes its units off the held counters (KEYS[3])
+# and returns its JSON items, or nil if it was already confirmed, cancelled or reaped.
+CLAIM_RESERVATION_SCRIPT = """
+if redis.call('ZREM', KEYS[1], ARGV[1]) == 0 then
+    return false
+end
+local items = redis.call('HGET', KEYS[2], ARGV[1])
+redis.call('HDEL', KEYS[2], ARGV[1])
+if items then
+    for _, item in ipairs(cjson.decode(items)) do
+        if redis.call('HINCRBY', KEYS[3], item[1], -item[2]) <= 0 then
+            redis.call('HDEL', KEYS[3], item[1])
+        end
+    end
+end
+return items
+"""
+
+# Moves the deadline of a hold to ARGV[2] seconds from now (Redis server clock).
+# Returns 1, or 0 if the hold was already confirmed, cancelled or reaped.
+RENEW_RESERVATION_SCRIPT = """
+if not redis.call('ZSCORE', KEYS[1], ARGV[1]) then
+    return 0
+end
+local now = redis.call('TIME')
+redis.call('ZADD', KEYS[1], 'XX', tonumber(now[1]) + tonumber(ARGV[2]), ARGV[1])
+return 1
+"""
+
+# Confirms one hold like CLAIM_RESERVATION_SCRIPT and, in the same atomic step,
+# appends its items to the stock journal stream (KEYS[4]) for write-behind to Postgres,
+# moving its units from the held counters to the pending counters (KEYS[5]).
+CONFIRM_RESERVATION_SCRIPT = """
+if redis.call('ZREM', KEYS[1], ARGV[1]) == 0 then
+    return false
+end
+local items = redis.call('HGET', KEYS[2], ARGV[1])
+redis.call('HDEL', KEYS[2], ARGV[1])
+if items then
+    redis.call('XADD', KEYS[4], '*', 'reservation_id', ARGV[1], 'items', items)
+    for _, item in ipairs(cjson.decode(items)) do
+        if redis.call('HINCRBY', KEYS[3], item[1], -item[2]) <= 0 then
+            redis.call('HDEL', KEYS[3], item[1])
+        end
+        redis.call('HINCRBY', KEYS[5], item[1], item[2])
+    end
+end
+return items
+"""
+
+# Removes up to ARGV[1] holds whose deadline has passed, takes their units off the
+# held counters (KEYS[3]) and returns their JSON items.
+CLAIM_EXPIRED_SCRIPT = """
+local now = redis.call('TIME')
+local ids = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', now[1], 'LIMIT', 0, ARGV[1])
+local claimed = {}
+for _, id in ipairs(ids) do
+    redis.call('ZREM', KEYS[1], id)
+    local items = redis.call('HGET', KEYS[2], id)
+    if items then
+        redis.call('HDEL', KEYS[2], id)
+        for _, item in ipairs(cjson.decode(items)) do
+            if redis.call('HINCRBY', KEYS[3], item[1], -item[2]) <= 0 then
+                redis.call('HDEL', KEYS[3], item[1])
+            end
+        end
+        table.insert(claimed, items)
+    end
+end
+return claimed
+"""
+
+# Takes journal entries written behind to Postgres off the pending counters (KEYS[1])
+# and trims them from the journal (KEYS[3]). Compare-and-set on the settled marker
+# (KEYS[2]): runs only if the marker still equals ARGV[1], then moves it to ARGV[2],
+# so each entry is settled once. ARGV[3..] are product ID / quantity pairs.
+# Returns 1, or 0 if the marker had moved.
+SETTLE_JOURNAL_SCRIPT = """
+if redis.call('GET', KEYS[2]) ~= ARGV[1] then
+    return 0
+end
+for i = 3, #ARGV, 2 do
+    if redis.call('HINCRBY', KEYS[1], ARGV[i], -tonumber(ARGV[i + 1])) <= 0 then
+        redis.call('HDEL', KEYS[1], ARGV[i])
+    end
+end
+redis.call('SET', KEYS[2], ARGV[2])
+redis.call('XTRIM', KEYS[3], 'MINID', ARGV[2])
+return 1
+"""
 
 
 class RedisInventoryCache(IInventoryCache):
     """
-    Redis-based inventory cache with distributed locking.
+    Redis-based inventory cache with atomic, script-based reservations.
     
     Uses Redis for:
     1. Fast inventory lookups (cache)
-    2. Distributed locking to prevent race conditions
-    3. Atomic stock reservation
+    2. Atomic all-or-nothing stock reservation in one Lua script per order
+    3. A reservation ledger: holds expire unless confirmed, and are reaped back into stock
+    4. An optional stock journal: every confirmed hold is appended to a Redis stream,
+       from which the worker writes the sold quantities behind to PostgreSQL
+    
+    Requires a single Redis node (optionally behind Sentinel). Redis Cluster is not
+    supported: one reservation script touches the stock keys of several products
+    plus the ledger, which Cluster rejects with CROSSSLOT.
     """
     
+    LEDGER_KEY = "inventory:reservations"
+    HOLDS_KEY = "inventory:reservation_items"
+    HELD_KEY = "inventory:held_units"  # product_id -> units held by open holds
+    PENDING_KEY = "inventory:pending_units"  # product_id -> units journaled, not yet written behind
+    JOURNAL_KEY = "inventory:stock_journal"
+    SETTLED_KEY = "inventory:stock_journal:settled"  # last entry taken off the pending counters
+    
     def __init__(
         self,
         redis_client: aioredis.Redis,
-        lock_timeout: int = 30,
-        lock_sleep: float = 0.1,
+        reservation_ttl: int = 300,
+        stock_loader: Optional[Callable[[List[int]], Awaitable[Dict[int, int]]]] = None,
+        journal: bool = False,
     ):
         """
         Initialize Redis inventory cache.
         
         Args:
             redis_client: Redis client instance.
-            lock_timeout: Lock timeout in seconds.
-            lock_sleep: Sleep duration between lock acquisition retries.
+            reservation_ttl: Seconds a hold may stay unconfirmed before it is reaped.
+            stock_loader: Async callable returning {product_id: stock} from the source of
+                truth, used to fill missing stock keys (read-through).
+            journal: Append confirmed holds to the stock journal stream (JOURNAL_KEY).
         """
         self.redis = redis_client
-        self.lock_timeout = lock_timeout
-        self.lock_sleep = lock_sleep
+        self.reservation_ttl = reservation_ttl
+        self.stock_loader = stock_loader
+        self.journal = journal
+        self._script_shas: Dict[str, str] = {}
+        self._loads_in_flight: Dict[int, asyncio.Future] = {}
     
     def _get_stock_key(self, product_id: int) -> str:
         """Get Redis key for product stock."""
         return f"inventory:product:{product_id}:stock"
     
-    def _get_lock_key(self, product_id: int) -> str:
-        """Get Redis key for product lock."""
-        return f"inventory:product:{product_id}:lock"
+    async def _eval_script(self, script: str, keys: List[str], args: List[Any]) -> Any:
+        """
+        Run a Lua script via EVALSHA, loading it on first use.
+        
+        The SHA1 digest is computed locally and cached per script, so the happy path
+        is a single EVALSHA round trip. If Redis lost its script cache (restart,
+        failover, SCRIPT FLUSH) the NOSCRIPT error triggers a reload and one retry.
+        """
+        sha = self._script_sha(script)
+        
+        try:
+            return await self.redis.evalsha(sha, len(keys), *keys, *args)
+        except NoScriptError:
+            hot_logger.debug("Lua script {} not cached on server, loading it", sha)
+            self._script_shas[script] = await self.redis.script_load(script)
+            return await self.redis.evalsha(self._script_shas[script], len(keys), *keys, *args)
+    
+    def _script_sha(self, script: str) -> str:
+        """SHA1 digest EVALSHA uses for a script, computed once."""
+        sha = self._script_shas.get(script)
+        if sha is None:
+            sha = hashlib.sha1(script.encode(), usedforsecurity=False).hexdigest()
+            self._script_shas[script] = sha
+        return sha
+    
+    async def _eval_script_many(
+        self, script: str, calls: Sequence[tuple[List[str], List[Any]]]
+    ) -> List[Any]:
+        """
+        Run a Lua script once per (keys, args) call in a single pipelined round trip.
+        
+        Calls are independent (no MULTI); each script run is still atomic. Calls
+        rejected with NOSCRIPT did not run, so they are retried after a reload.
+        """
+        if not calls:
+            return []
+        
+        async def run(indexes: List[int]) -> List[Any]:
+            sha = self._script_sha(script)
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for index in indexes:
+                    keys, args = calls[index]
+                    pipe.evalsha(sha, len(keys), *keys, *args)
+                return await pipe.execute(raise_on_error=False)
+        
+        results = await run(list(range(len(calls))))
+        
+        missing = [index for index, result in enumerate(results) if isinstance(result, NoScriptError)]
+        if missing:
+            hot_logger.debug("Lua script {} not cached on server, loading it", self._script_sha(script))
+            self._script_shas[script] = await self.redis.script_load(script)
+            for index, result in zip(missing, await run(missing)):
+                results[index] = result
+        
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
+        return results
     
     async def get_stock(self, product_id: int) -> Optional[int]:
         """Get current stock from cache."""
@@ -60,64 +266,426 @@ class RedisInventoryCache(IInventoryCache):
         
         return int(stock)
     
-    async def set_stock(self, product_id: int, quantity: int, ttl: int = 3600) -> None:
-        """Set stock in cache."""
+    async def get_stocks(self, product_ids: List[int]) -> Dict[int, Optional[int]]:
+        """Get the cached stock of many products in one MGET (None where not cached)."""
+        if not product_ids:
+            return {}
+        values = await self.redis.mget([self._get_stock_key(pid) for pid in product_ids])
+        return {
+            product_id: int(value) if value is not None else None
+            for product_id, value in zip(product_ids, values)
+        }
+    
+    async def in_flight_quantities(self, product_ids: List[int]) -> Dict[int, int]:
+        """
+        Units per product held by open reservations or journaled but not yet written behind.
+        
+        Reads the per-product held and pending counters the reservation scripts
+        maintain, in one MULTI so a confirmation moving units from one to the other
+        is never missed. Products with nothing in flight are left out.
+        """
+        if not product_ids:
+            return {}
+        
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.hmget(self.HELD_KEY, product_ids)
+            pipe.hmget(self.PENDING_KEY, product_ids)
+            held, pending = await pipe.execute()
+        
+        in_flight: Dict[int, int] = {}
+        for product_id, held_units, pending_units in zip(product_ids, held, pending):
+            units = max(int(held_units or 0), 0) + max(int(pending_units or 0), 0)
+            if units:
+                in_flight[product_id] = units
+        return in_flight
+    
+    async def settle_journal(self, settled: str, through: str, quantities: Dict[int, int]) -> bool:
+        """
+        Take journal entries up to `through` off the pending counters and trim them.
+        
+        Call once the entries after `settled` up to `through` are committed to the
+        database; `quantities` are their sold units per product. Guarded by the
+        settled marker, so it is a no-op (returning False) if another call already
+        moved the marker past `settled`.
+        """
+        args: List[Any] = [settled, through]
+        for product_id, quantity in quantities.items():
+            args += [product_id, quantity]
+        settled_now = await self._eval_script(
+            SETTLE_JOURNAL_SCRIPT, [self.PENDING_KEY, self.SETTLED_KEY, self.JOURNAL_KEY], args
+        )
+        return bool(int(settled_now))
+    
+    async def set_stock(self, product_id: int, quantity: int, ttl: Optional[int] = None) -> None:
+        """
+        Set stock in cache.
+        
+        Stock counters are the live inventory, so they do not expire unless a
+        ttl is given: reloading an expired counter would resell units whose
+        decrement had not reached the database yet.
+        """
         key = self._get_stock_key(product_id)
-        await self.redis.setex(key, ttl, quantity)
-        logger.debug(f"Cached stock for product {product_id}: {quantity}")
+        await self.redis.set(key, quantity, ex=ttl)
+        hot_logger.debug("Cached stock for product {}: {}", product_id, quantity)
+    
+    def _log_reservation_failure(self, product_id: int, result: int) -> None:
+        """Log why a reservation failed, given a RESERVE_MANY_SCRIPT style result code."""
+        if result < 0:
+            logger.warning(f"Stock for product {product_id} not in cache")
+        else:
+            hot_logger.debug("Insufficient stock for product {}", product_id)
     
-    async def check_and_reserve_stock(
+    async def reserve_many(
         self,
-        product_id: int,
-        quantity: int,
-        max_retries: int = 3,
-    ) -> bool:
-        """Check stock availability and reserve if available using distributed lock."""
-        lock_key = self._get_lock_key(product_id)
-        stock_key = self._get_stock_key(product_id)
+        items: Sequence[tuple[int, int]],
+        reservation_id: Optional[str] = None,
+    ) -> Optional[int]:
+        """
+        Atomically reserve stock for several products in one round trip.
         
-        for attempt in range(max_retries):
-            lock_acquired = await self.redis.set(
-                lock_key,
-                "1",
-                ex=self.lock_timeout,
-                nx=True,
-            )
+        All-or-nothing: either every product is decremented or none is.
+        Quantities for repeated product IDs are summed before the check.
+        
+        When reservation_id is given, the hold is written to the ledger in the
+        same script call. It must be confirmed within reservation_ttl seconds
+        or the reaper returns the stock.
+        
+        If a stock key is missing (e.g. Redis lost its data), stock is loaded
+        through the stock loader and the reservation retried once.
+        
+        Args:
+            items: Sequence of (product_id, quantity) pairs.
+            reservation_id: Optional unique ID recording this reservation as a hold.
             
-            if not lock_acquired:
-                logger.debug(f"Failed to acquire lock for product {product_id}, attempt {attempt + 1}")
-                await asyncio.sleep(self.lock_sleep)
-                continue
+        Returns:
+            None if everything was reserved, otherwise the ID of the first
+            product whose stock is missing from cache or insufficient.
+        """
+        totals: Dict[int, int] = {}
+        for product_id, quantity in items:
+            totals[product_id] = totals.get(product_id, 0) + quantity
+        
+        result, failed_product_id = await self._try_reserve_many(totals, reservation_id)
+        if result < 0 and await self._read_through(list(totals)):
+            result, failed_product_id = await self._try_reserve_many(totals, reservation_id)
+        
+        return failed_product_id
+    
+    async def _try_reserve_many(
+        self,
+        totals: Dict[int, int],
+        reservation_id: Optional[str],
+    ) -> tuple[int, Optional[int]]:
+        """
+        Single all-or-nothing reservation attempt for reserve_many.
+        
+        Returns:
+            (RESERVE_MANY_SCRIPT style result code, failing product ID or None).
+        """
+        product_ids = list(totals)
+        keys, args = self._reserve_many_call(product_ids, totals, reservation_id)
+        result = int(await self._eval_script(RESERVE_MANY_SCRIPT, keys, args))
+        
+        if result == 0:
+            hot_logger.info("AUDIT | SUCCESS | Reserved stock for {} products", len(totals))
+            return 0, None
+        
+        failed_product_id = product_ids[abs(result) - 1]
+        self._log_reservation_failure(failed_product_id, result)
+        return result, failed_product_id
+    
+    def _reserve_many_call(
+        self,
+        product_ids: List[int],
+        totals: Dict[int, int],
+        reservation_id: Optional[str],
+    ) -> tuple[List[str], List[Any]]:
+        """Build RESERVE_MANY_SCRIPT keys and args for the product_ids."""
+        keys: List[str] = [self._get_stock_key(product_id) for product_id in product_ids]
+        args: List[Any] = [totals[product_id] for product_id in product_ids]
+        if reservation_id is not None:
+            keys += [self.LEDGER_KEY, self.HOLDS_KEY, self.HELD_KEY]
+            args += [reservation_id, self.reservation_ttl, json.dumps(list(totals.items()))]
+        return keys, args
+    
+    async def reserve_batch(
+        self, orders: Sequence[tuple[str, Sequence[tuple[int, int]]]]
+    ) -> List[Optional[int]]:
+        """
+        Reserve stock for many orders, each all-or-nothing, in one round trip.
+        
+        Every order is one RESERVE_MANY_SCRIPT run recorded as a hold, and all runs
+        are pipelined. Orders are independent: one failing does not affect the
+        others. Orders that hit a missing stock key go through reserve_many
+        individually instead, with read-through.
+        
+        Args:
+            orders: Sequence of (reservation_id, [(product_id, quantity), ...]).
             
+        Returns:
+            One entry per order: None if reserved, otherwise the failing product ID.
+        """
+        results: List[Optional[int]] = [None] * len(orders)
+        pipelined: List[tuple[int, List[int]]] = []
+        calls: List[tuple[List[str], List[Any]]] = []
+        
+        for index, (reservation_id, items) in enumerate(orders):
+            totals: Dict[int, int] = {}
+            for product_id, quantity in items:
+                totals[product_id] = totals.get(product_id, 0) + quantity
+            pipelined.append((index, list(totals)))
+            calls.append(self._reserve_many_call(list(totals), totals, reservation_id))
+        
+        codes = await self._eval_script_many(RESERVE_MANY_SCRIPT, calls)
+        
+        handled = set()
+        for (index, product_ids), code in zip(pipelined, codes):
+            code = int(code)
+            if code < 0:
+                continue  # Missing key: retried with read-through below
+            handled.add(index)
+            if code > 0:
+                results[index] = product_ids[code - 1]
+                self._log_reservation_failure(results[index], code)
+        
+        for index, (reservation_id, items) in enumerate(orders):
+            if index not in handled:
+                results[index] = await self.reserve_many(items, reservation_id=reservation_id)
+        
+        hot_logger.info(
+            "AUDIT | SUCCESS | Batch reservation: {}/{} orders reserved",
+            sum(result is None for result in results), len(orders),
+        )
+        return results
+    
+    async def _read_through(self, product_ids: List[int]) -> bool:
+        """
+        Load stock for products whose keys are missing from Redis.
+        
+        Single-flight: concurrent misses for the same product in this process
+        share one loader call instead of each querying the database. Values are
+        written with SET NX, so a counter created meanwhile by another process is
+        never overwritten with (staler) database stock.
+        
+        Returns:
+            True if a load was performed or awaited, False if there is no loader
+            or nothing was missing.
+        """
+        if self.stock_loader is None:
+            return False
+        
+        missing = await self._find_missing(product_ids)
+        if not missing:
+            return False
+        
+        pending = {self._loads_in_flight[pid] for pid in missing if pid in self._loads_in_flight}
+        to_load = [pid for pid in missing if pid not in self._loads_in_flight]
+        
+        if to_load:
+            load = asyncio.get_running_loop().create_future()
+            for product_id in to_load:
+                self._loads_in_flight[product_id] = load
             try:
-                current_stock = await self.redis.get(stock_key)
-                
-                if current_stock is None:
-                    logger.warning(f"Stock for product {product_id} not in cache")
-                    return False
-                
-                current_stock = int(current_stock)
-                
-                if current_stock < quantity:
-                    logger.debug(f"Insufficient stock for product {product_id}")
-                    return False
-                
-                new_stock = current_stock - quantity
-                await self.redis.set(stock_key, new_stock)
-                
-                logger.info(f"AUDIT | SUCCESS | Reserved {quantity} units of product {product_id}")
-                return True
-                
+                stocks = await self.stock_loader(to_load)
+                await self._set_stock_if_missing(stocks)
+                hot_logger.info(
+                    "AUDIT | CACHE_MISS | Loaded stock for {} products from database", len(stocks)
+                )
             finally:
-                await self.redis.delete(lock_key)
+                for product_id in to_load:
+                    self._loads_in_flight.pop(product_id, None)
+                load.set_result(None)
+        
+        if pending:
+            await asyncio.gather(*pending)
+        return True
+    
+    async def _find_missing(self, product_ids: List[int]) -> List[int]:
+        """Return the products with no cached stock."""
+        stocks = await self.get_stocks(product_ids)
+        return [product_id for product_id, stock in stocks.items() if stock is None]
+    
+    async def _set_stock_if_missing(self, stocks: Dict[int, int]) -> None:
+        """Pipeline SET NX of stock levels."""
+        if not stocks:
+            return
+        
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for product_id, quantity in stocks.items():
+                pipe.set(self._get_stock_key(product_id), quantity, nx=True)
+            await pipe.execute()
+    
+    async def warm_up(self, stocks: Dict[int, int], overwrite: bool = False) -> None:
+        """
+        Bulk-load stock levels into Redis in one round trip.
+        
+        By default only missing counters are created (SET NX): a live counter
+        already reflects outstanding holds that the database stock does not.
+        
+        Args:
+            stocks: Mapping of product_id to stock quantity (one chunk).
+            overwrite: Replace existing counters with one MSET instead.
+        """
+        if not overwrite:
+            await self._set_stock_if_missing(stocks)
+            return
+        
+        mapping = {
+            self._get_stock_key(product_id): quantity for product_id, quantity in stocks.items()
+        }
+        if not mapping:
+            return
+        
+        await self.redis.mset(mapping)
+    
+    async def _release_many(self, items: Sequence[tuple[int, int]]) -> None:
+        """Release several reservations in one pipelined round trip."""
+        if not items:
+            return
+        
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for product_id, quantity in items:
+                pipe.incrby(self._get_stock_key(product_id), quantity)
+            await pipe.execute()
+    
+    def _confirm_call(self) -> tuple[str, List[str]]:
+        """Script and keys that confirm a hold, journaling it when enabled."""
+        if self.journal:
+            return CONFIRM_RESERVATION_SCRIPT, [
+                self.LEDGER_KEY, self.HOLDS_KEY, self.HELD_KEY, self.JOURNAL_KEY, self.PENDING_KEY
+            ]
+        return CLAIM_RESERVATION_SCRIPT, [self.LEDGER_KEY, self.HOLDS_KEY, self.HELD_KEY]
+    
+    async def renew_reservation(self, reservation_id: str) -> bool:
+        """
+        Give a hold a fresh reservation_ttl before its order is committed.
+        
+        Returns:
+            False if the hold had already expired and been reaped (or cancelled),
+            in which case its stock is no longer reserved.
+        """
+        renewed = await self._eval_script(
+            RENEW_RESERVATION_SCRIPT, [self.LEDGER_KEY], [reservation_id, self.reservation_ttl]
+        )
+        return bool(int(renewed))
+    
+    async def confirm_reservation(self, reservation_id: str) -> bool:
+        """
+        Confirm a hold so it is never reaped; the stock stays decremented.
         
-        raise InventoryLockError(
-            product_id=product_id,
-            reason=f"Could not acquire lock after {max_retries} attempts",
+        Returns:
+            False if the hold had already expired and been reaped (or cancelled).
+        """
+        script, keys = self._confirm_call()
+        claimed = await self._eval_script(script, keys, [reservation_id])
+        if claimed is None:
+            logger.warning(f"AUDIT | FAILED | Reservation {reservation_id} no longer held")
+            return False
+        
+        hot_logger.debug("Confirmed reservation {}", reservation_id)
+        return True
+    
+    async def cancel_reservation(self, reservation_id: str) -> bool:
+        """
+        Cancel a hold and return its stock.
+        
+        Guarded by the ledger, so a hold is released at most once even if the
+        reaper races with the cancellation.
+        
+        Returns:
+            True if stock was released, False if the hold was already gone.
+        """
+        claimed = await self._eval_script(
+            CLAIM_RESERVATION_SCRIPT, [self.LEDGER_KEY, self.HOLDS_KEY, self.HELD_KEY], [reservation_id]
+        )
+        if claimed is None:
+            return False
+        
+        await self._release_many(json.loads(claimed))
+        hot_logger.info("AUDIT | SUCCESS | Cancelled reservation {}", reservation_id)
+        return True
+    
+    async def renew_reservations(self, reservation_ids: Sequence[str]) -> List[bool]:
+        """
+        Renew several holds in one pipelined round trip (see renew_reservation).
+        
+        Returns:
+            Per hold, in order: False if it had already been reaped (or cancelled).
+        """
+        renewed = await self._eval_script_many(
+            RENEW_RESERVATION_SCRIPT,
+            [([self.LEDGER_KEY], [reservation_id, self.reservation_ttl]) for reservation_id in reservation_ids],
         )
+        return [bool(int(result)) for result in renewed]
+    
+    async def confirm_reservations(self, reservation_ids: Sequence[str]) -> List[bool]:
+        """
+        Confirm several holds in one pipelined round trip.
+        
+        Returns:
+            Per hold, in order: False if it had already been reaped (or cancelled).
+        """
+        script, keys = self._confirm_call()
+        claimed = await self._eval_script_many(
+            script, [(keys, [reservation_id]) for reservation_id in reservation_ids]
+        )
+        confirmed = [items is not None for items in claimed]
+        if not all(confirmed):
+            logger.warning(
+                f"AUDIT | FAILED | {confirmed.count(False)} reservations no longer held"
+            )
+        return confirmed
+    
+    async def cancel_reservations(self, reservation_ids: Sequence[str]) -> int:
+        """
+        Cancel several holds and return their stock in two pipelined round trips.
+        
+        Returns:
+            Number of holds whose stock was released.
+        """
+        claimed = await self._eval_script_many(
+            CLAIM_RESERVATION_SCRIPT,
+            [([self.LEDGER_KEY, self.HOLDS_KEY, self.HELD_KEY], [reservation_id]) for reservation_id in reservation_ids],
+        )
+        items = [item for hold in claimed if hold is not None for item in json.loads(hold)]
+        await self._release_many(items)
+        
+        cancelled = sum(hold is not None for hold in claimed)
+        hot_logger.info("AUDIT | SUCCESS | Cancelled {} reservations", cancelled)
+        return cancelled
+    
+    async def reap_expired_reservations(self, batch_size: int = 500) -> int:
+        """
+        Return the stock of up to batch_size expired holds.
+        
+        Holds are claimed in one script call and their quantities coalesced per
+        product, so a batch costs two round trips regardless of its size.
+        
+        Returns:
+            Number of holds reaped.
+        """
+        claimed = await self._eval_script(
+            CLAIM_EXPIRED_SCRIPT, [self.LEDGER_KEY, self.HOLDS_KEY, self.HELD_KEY], [batch_size]
+        )
+        if not claimed:
+            return 0
+        
+        totals: Dict[int, int] = {}
+        for payload in claimed:
+            for product_id, quantity in json.loads(payload):
+                totals[product_id] = totals.get(product_id, 0) + quantity
+        
+        await self._release_many(list(totals.items()))
+        logger.warning(
+            f"AUDIT | REAPED | Released {len(claimed)} expired reservations "
+            f"covering {len(totals)} products"
+        )
+        return len(claimed)
     
     async def release_stock(self, product_id: int, quantity: int) -> None:
         """Release reserved stock (increment)."""
         stock_key = self._get_stock_key(product_id)
         new_stock = await self.redis.incrby(stock_key, quantity)
-        logger.info(f"AUDIT | SUCCESS | Released {quantity} units of product {product_id}. New stock: {new_stock}")
+        hot_logger.info(
+            "AUDIT | SUCCESS | Released {} units of product {}. New stock: {}", quantity, product_id, new_stock
+        )
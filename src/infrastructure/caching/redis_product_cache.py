@@ -0,0 +1,144 @@
+"""
+redis_product_cache.py
+
+Shared Redis cache tier for Product entities.
+Sits behind the in-process ProductCatalogCache so replicas share one warm set.
+"""
+
+import json
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Tuple
+from redis import asyncio as aioredis
+from loguru import logger
+
+from src.constants import CACHE_TTL_PRODUCT
+from src.domain.entities import Product
+
+
+# Caches products read from the database, each only if its version key still holds
+# the version read before the load. KEYS are (product key, version key) pairs; ARGV[1]
+# is the TTL, then one (expected version, JSON product) pair per product. A missing
+# version is passed as ''. Returns the number of products cached.
+FILL_IF_UNCHANGED_SCRIPT = """
+local filled = 0
+for i = 1, #KEYS / 2 do
+    if (redis.call('GET', KEYS[2 * i]) or '') == ARGV[2 * i] then
+        redis.call('SET', KEYS[2 * i - 1], ARGV[2 * i + 1], 'EX', ARGV[1])
+        filled = filled + 1
+    end
+end
+return filled
+"""
+
+
+class RedisProductCache:
+    """
+    Redis-backed product cache shared by all replicas.
+    
+    Reads a whole order's products with one MGET and writes misses back with
+    one script call. Redis errors degrade to cache misses.
+    
+    Every product has a version key that writers bump when they invalidate it.
+    Readers take the version in the same MGET as the product and write a
+    database row back only if the version has not moved since, so a row loaded
+    before a write committed on any replica is never cached after that write's
+    invalidation, whenever the invalidation reaches this replica.
+    """
+    
+    def __init__(self, redis_client: aioredis.Redis, ttl: int = CACHE_TTL_PRODUCT):
+        """
+        Initialize shared product cache.
+        
+        Args:
+            redis_client: Redis client instance.
+            ttl: Expiry in seconds for cached products.
+        """
+        self.redis = redis_client
+        self.ttl = ttl
+    
+    def _get_key(self, product_id: int) -> str:
+        """Get Redis key for a cached product."""
+        return f"catalog:product:{product_id}"
+    
+    def _get_version_key(self, product_id: int) -> str:
+        """Get Redis key for a product's invalidation version (never expires)."""
+        return f"catalog:product:{product_id}:version"
+    
+    async def get_many(self, product_ids: List[int]) -> Tuple[Dict[int, Product], Dict[int, str]]:
+        """
+        Fetch cached products and the current versions of all requested IDs in a single MGET.
+        
+        Returns:
+            (cached products, absent IDs left out; version per product ID, '' if
+            never invalidated). Pass the versions to set_many after loading misses.
+        """
+        if not product_ids:
+            return {}, {}
+        
+        keys = [self._get_key(product_id) for product_id in product_ids]
+        keys += [self._get_version_key(product_id) for product_id in product_ids]
+        try:
+            values = await self.redis.mget(keys)
+        except Exception as e:
+            logger.warning(f"AUDIT | FAILED | Shared product cache read: {e}")
+            return {}, {}
+        
+        products, versions = values[:len(product_ids)], values[len(product_ids):]
+        cached = {
+            product_id: self._deserialize(value)
+            for product_id, value in zip(product_ids, products)
+            if value is not None
+        }
+        return cached, {product_id: version or "" for product_id, version in zip(product_ids, versions)}
+    
+    async def set_many(self, products: Iterable[Product], versions: Dict[int, str]) -> None:
+        """
+        Cache products loaded from the database in one script call.
+        
+        Each product is written only if its version still equals the one in
+        versions (from get_many before the load); otherwise it was invalidated
+        meanwhile and the loaded row may predate the write. Products without a
+        recorded version are skipped.
+        """
+        keys: List[str] = []
+        args: List[Any] = [self.ttl]
+        for product in products:
+            if product.id not in versions:
+                continue
+            keys += [self._get_key(product.id), self._get_version_key(product.id)]
+            args += [versions[product.id], self._serialize(product)]
+        if not keys:
+            return
+        
+        try:
+            await self.redis.eval(FILL_IF_UNCHANGED_SCRIPT, len(keys), *keys, *args)
+        except Exception as e:
+            logger.warning(f"AUDIT | FAILED | Shared product cache write: {e}")
+    
+    async def delete_many(self, product_ids: List[int]) -> None:
+        """Drop products from the shared cache and bump their versions, in one MULTI."""
+        try:
+            async with self.redis.pipeline(transaction=True) as pipe:
+                for product_id in product_ids:
+                    pipe.incr(self._get_version_key(product_id))
+                    pipe.delete(self._get_key(product_id))
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"AUDIT | FAILED | Shared product cache delete: {e}")
+    
+    def _serialize(self, product: Product) -> str:
+        """Encode a product as JSON (price kept as a string to stay exact)."""
+        return json.dumps({
+            "id": product.id,
+            "sku": product.sku,
+            "name": product.name,
+            "description": product.description,
+            "price": str(product.price),
+            "stock_quantity": product.stock_quantity,
+        })
+    
+    def _deserialize(self, value: str) -> Product:
+        """Decode a product cached by _serialize."""
+        data = json.loads(value)
+        data["price"] = Decimal(data["price"])
+        return Product(**data)
@@ -0,0 +1,90 @@
+"""
+token_verification_cache.py
+
+In-process LRU cache of verified JWT payloads.
+Lets repeat callers skip signature verification until their token expires.
+"""
+
+import copy
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+
+class TokenVerificationCache:
+    """
+    Bounded in-memory cache of decoded token payloads, keyed by token hash.
+
+    Features:
+    1. LRU eviction once max_size entries are held
+    2. Entries expire at the token's own `exp` claim (or after ttl, if sooner),
+       so a cached token is never accepted after it would fail verification
+    3. Only a SHA-256 of the token is kept as key, never the bearer token itself
+    4. Failed verifications are not cached
+    """
+
+    def __init__(self, max_size: int = 10000, ttl: float = 300.0):
+        """
+        Initialize token verification cache.
+
+        Args:
+            max_size: Maximum number of payloads held in memory.
+            ttl: Upper bound in seconds on how long a payload is served, for
+                tokens with a far-off or missing `exp`.
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[bytes, tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str) -> Optional[Dict[str, Any]]:
+        """Return the cached payload of a token, or None if absent or expired."""
+        key = self._key(token)
+        entry = self._entries.get(key)
+        # exp is wall-clock (epoch seconds), so entries expire on time.time()
+        if entry is None or entry[0] <= time.time():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return copy.copy(entry[1])
+
+    def put(self, token: str, payload: Dict[str, Any]) -> None:
+        """Cache the payload of a token that has just passed verification."""
+        expires_at = time.time() + self.ttl
+        exp = payload.get("exp")
+        if isinstance(exp, (int, float)):
+            expires_at = min(expires_at, exp)
+
+        key = self._key(token)
+        self._entries[key] = (expires_at, copy.copy(payload))
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop every cached payload."""
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, float]:
+        """Hit/miss/eviction counters, hit rate and current size."""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
@@ -4,44 +4,99 @@ infrastructure/clients/auth_provider.py
 Hybrid Infrastructure client for the Supabase Auth Service.
 Features:
 1. Local Validation: Uses SUPABASE_JWT_SECRET for instant signature checks.
+   Verified payloads are cached until the token expires, so repeat callers skip it.
 2. Remote Authorization: Calls Auth Service for centralized RBAC/Permission checks.
+   Decisions are cached briefly per (token, permission) and concurrent identical
+   checks share one call over a pooled keep-alive connection.
 """
 
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
 import httpx
 from loguru import logger
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Sequence, Tuple
 from jose import jwt, JWTError
 from src.interface.protocols.infrastructure import IAuthProvider
+from src.infrastructure.caching.token_verification_cache import TokenVerificationCache
 
 
 class AuthProvider(IAuthProvider):
     """Hybrid client for Authentication (Local) and Authorization (Remote)."""
 
-    def __init__(self, base_url: str, api_key: str, jwt_secret: str):
+    # Claims checked on every full verification, resolved once instead of per call
+    ALGORITHMS = ["HS256"]
+    AUDIENCE = "authenticated"
+    DECODE_OPTIONS = {"verify_aud": True, "verify_exp": True, "verify_nbf": True, "verify_iat": True}
+
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        jwt_secret: str,
+        token_cache: Optional[TokenVerificationCache] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
+        decision_cache_ttl: float = 5.0,
+        decision_cache_max_size: int = 10000,
+        max_concurrency: int = 10,
+    ):
+        """
+        Initialize auth provider.
+
+        Args:
+            base_url: Base URL of the Auth Service.
+            api_key: Internal API key sent to the Auth Service.
+            jwt_secret: Secret used to verify token signatures locally.
+            token_cache: Cache of verified payloads; None verifies every call.
+            http_client: Long-lived pooled client for Auth Service calls, owned by
+                the caller. Defaults to a private client with a 5s timeout.
+            decision_cache_ttl: Seconds an authorization decision is reused; 0 disables caching.
+            decision_cache_max_size: Maximum number of cached decisions.
+            max_concurrency: Maximum parallel Auth Service calls per authorize_many.
+        """
         self.base_url = base_url.rstrip("/")
         self.headers = {
             "X-Internal-API-Key": api_key,
             "Content-Type": "application/json"
         }
         self.jwt_secret = jwt_secret
+        self.token_cache = token_cache
+        self.http_client = http_client or httpx.AsyncClient(timeout=5.0)
+        self.decision_cache_ttl = decision_cache_ttl
+        self.decision_cache_max_size = decision_cache_max_size
+        self.max_concurrency = max_concurrency
+        self._decisions: "OrderedDict[Tuple[str, str], tuple[float, bool]]" = OrderedDict()
+        self._decisions_in_flight: Dict[Tuple[str, str], asyncio.Task] = {}
 
     async def verify_token(self, token: str) -> Optional[Dict[str, Any]]:
         """
         Verify a JWT token. 
-        PERFORMANCE: Performs local signature validation first.
+        PERFORMANCE: Serves cached payloads, then falls back to local signature validation.
+
+        HS256 verification takes microseconds, so it runs inline: handing it to a
+        thread pool would cost more than it saves.
         """
+        if self.token_cache is not None:
+            cached = self.token_cache.get(token)
+            if cached is not None:
+                return cached
+
         try:
             # 1. Local Signature Validation (Ultra-fast)
             payload = jwt.decode(
                 token, 
                 self.jwt_secret, 
-                algorithms=["HS256"], 
-                audience="authenticated"
+                algorithms=self.ALGORITHMS, 
+                audience=self.AUDIENCE,
+                options=self.DECODE_OPTIONS,
             )
             
             # Extract basic info
             user_id = payload.get("sub")
             logger.success(f"Audit: Token verified LOCALLY for user {user_id}")
+            if self.token_cache is not None:
+                self.token_cache.put(token, payload)
             return payload
             
         except JWTError as e:
@@ -55,6 +110,83 @@ class AuthProvider(IAuthProvider):
         """
         Check if a user has a specific permission.
         CONSISTENCY: Calls central Auth Service for single point of truth.
+        PERFORMANCE: Reuses a decision for the same token and permission for
+        decision_cache_ttl seconds, and concurrent identical checks share one call.
+        Decisions are keyed by a hash of the token, not its subject, so one token's
+        answer never stands in for another token of the same user (e.g. one whose
+        session was revoked); a change of the user's grants applies within the TTL.
+        """
+        payload = await self.verify_token(token)
+        if payload is None:
+            # Invalid locally: let the Auth Service judge the token, without caching
+            return bool(await self._authorize_remote(token, required_permission))
+
+        key = (hashlib.sha256(token.encode()).hexdigest(), required_permission)
+        decision = self._cached_decision(key)
+        if decision is not None:
+            return decision
+
+        task = self._decisions_in_flight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._fetch_decision(key, token))
+            self._decisions_in_flight[key] = task
+            task.add_done_callback(lambda _: self._decisions_in_flight.pop(key, None))
+        # Shielded: a cancelled caller must not cancel the call others are waiting on
+        return bool(await asyncio.shield(task))
+
+    async def authorize_many(self, token: str, permissions: Sequence[str]) -> Dict[str, bool]:
+        """
+        Check several permissions for one user.
+
+        The Auth Service has no batch endpoint, so uncached permissions are checked
+        in parallel (at most max_concurrency calls at a time) instead of one after
+        another: the cost is about one round trip rather than one per permission.
+        Each check goes through authorize(), sharing its cache and coalescing.
+
+        Returns:
+            Decision per permission (duplicates are checked once).
+        """
+        unique = list(dict.fromkeys(permissions))
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def check(permission: str) -> bool:
+            async with semaphore:
+                return await self.authorize(token, permission)
+
+        decisions = await asyncio.gather(*(check(permission) for permission in unique))
+        return dict(zip(unique, decisions))
+
+    async def close(self) -> None:
+        """Close the HTTP client's pooled connections."""
+        await self.http_client.aclose()
+
+    def _cached_decision(self, key: Tuple[str, str]) -> Optional[bool]:
+        """Return a cached, unexpired decision."""
+        entry = self._decisions.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del self._decisions[key]
+            return None
+        self._decisions.move_to_end(key)
+        return entry[1]
+
+    async def _fetch_decision(self, key: Tuple[str, str], token: str) -> Optional[bool]:
+        """Ask the Auth Service and cache a definite answer (errors are not cached)."""
+        decision = await self._authorize_remote(token, key[1])
+        if decision is not None and self.decision_cache_ttl > 0:
+            self._decisions[key] = (time.monotonic() + self.decision_cache_ttl, decision)
+            self._decisions.move_to_end(key)
+            while len(self._decisions) > self.decision_cache_max_size:
+                self._decisions.popitem(last=False)
+        return decision
+
+    async def _authorize_remote(self, token: str, required_permission: str) -> Optional[bool]:
+        """
+        Call the Auth Service authorize endpoint.
+
+        Returns:
+            The decision, or None if the Auth Service could not give one.
         """
         url = f"{self.base_url}/api/v1/internal/authorize"
         payload = {
@@ -63,17 +195,16 @@ class AuthProvider(IAuthProvider):
         }
 
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                logger.debug(f"Action: Checking permission '{required_permission}' for token")
-                response = await client.post(url, json=payload, headers=self.headers)
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    is_authorized = data.get("is_authorized", False)
-                    return is_authorized
-                
-                logger.warning(f"Audit: Authorization check failed | Status: {response.status_code}")
-                return False
+            logger.debug(f"Action: Checking permission '{required_permission}' for token")
+            response = await self.http_client.post(url, json=payload, headers=self.headers)
+            
+            if response.status_code == 200:
+                data = response.json()
+                is_authorized = data.get("is_authorized", False)
+                return is_authorized
+            
+            logger.warning(f"Audit: Authorization check failed | Status: {response.status_code}")
+            return None
         except Exception as e:
             logger.error(f"Audit: Error communicating with Auth Service for authorization: {str(e)}")
-            return False
+            return None
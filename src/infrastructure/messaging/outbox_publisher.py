@@ -0,0 +1,48 @@
+"""
+outbox_publisher.py
+
+Outbox-based implementations of IEventPublisher.
+Events are written to the outbox table and relayed to RabbitMQ by the worker.
+"""
+
+from typing import Any
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.interface.protocols.infrastructure import IEventPublisher
+from src.infrastructure.repositories.outbox_repository import OutboxRepository
+
+
+class OutboxEventPublisher(IEventPublisher):
+    """
+    Publishes events by staging them in the caller's transaction.
+    
+    No broker I/O on the request path: the event becomes visible to the relay
+    only if the surrounding transaction commits.
+    """
+    
+    def __init__(self, outbox_repository: OutboxRepository):
+        """Initialize with a session-bound outbox repository."""
+        self.outbox_repo = outbox_repository
+    
+    async def publish(self, event: Any) -> None:
+        """Stage the event in the outbox."""
+        await self.outbox_repo.add(event)
+
+
+class DetachedOutboxPublisher(IEventPublisher):
+    """
+    Publishes events through the outbox in their own short transaction.
+    
+    For events that must survive a rollback of the request transaction,
+    such as OrderFailed.
+    """
+    
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession]):
+        """Initialize with the application session factory."""
+        self.session_factory = session_factory
+    
+    async def publish(self, event: Any) -> None:
+        """Write the event to the outbox and commit immediately."""
+        async with self.session_factory() as session:
+            await OutboxRepository(session).add(event)
+            await session.commit()
@@ -0,0 +1,93 @@
+"""
+outbox_relay.py
+
+Relays events from the outbox table to RabbitMQ.
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from loguru import logger
+
+from src.infrastructure.messaging.rabbitmq_publisher import RabbitMQPublisher
+from src.infrastructure.repositories.outbox_repository import OutboxRepository
+
+
+class OutboxRelay:
+    """
+    Drains the outbox in batches.
+    
+    Each batch is published concurrently and awaited on publisher confirms;
+    only rows the broker acknowledged are marked sent, so a crash or nack means
+    redelivery (at-least-once). The outbox row ID is sent as the message ID so
+    consumers can deduplicate. Sent rows are kept for a retention period and
+    then deleted by purge_sent().
+    """
+    
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        publisher: RabbitMQPublisher,
+    ):
+        """
+        Initialize relay.
+        
+        Args:
+            session_factory: Factory for database sessions.
+            publisher: Connected RabbitMQ publisher (confirm mode).
+        """
+        self.session_factory = session_factory
+        self.publisher = publisher
+    
+    async def relay_batch(self, batch_size: int = 100) -> int:
+        """
+        Publish up to batch_size unsent events.
+        
+        Returns:
+            Number of events published. A full batch means more may be waiting;
+            anything less (including failed publishes) means the caller should back off.
+        """
+        async with self.session_factory() as session:
+            repo = OutboxRepository(session)
+            rows = await repo.fetch_unsent(batch_size)
+            if not rows:
+                return 0
+            
+            results = await asyncio.gather(
+                *[
+                    self.publisher.publish_raw(
+                        row.event_type, row.payload.encode(), message_id=str(row.id)
+                    )
+                    for row in rows
+                ],
+                return_exceptions=True,
+            )
+            
+            sent_ids = []
+            for row, result in zip(rows, results):
+                if isinstance(result, Exception):
+                    logger.error(f"AUDIT | FAILED | Outbox relay for event {row.id}: {result}")
+                else:
+                    sent_ids.append(row.id)
+            
+            await repo.mark_sent(sent_ids)
+            await session.commit()
+        
+        logger.info(f"AUDIT | SUCCESS | Outbox relay published {len(sent_ids)}/{len(rows)} events")
+        return len(sent_ids)
+    
+    async def purge_sent(self, retention: float, batch_size: int = 1000) -> int:
+        """
+        Delete up to batch_size events sent more than retention seconds ago.
+        
+        Returns:
+            Number of rows deleted (a full batch means more may be waiting).
+        """
+        sent_before = datetime.utcnow() - timedelta(seconds=retention)
+        async with self.session_factory() as session:
+            deleted = await OutboxRepository(session).delete_sent(sent_before, batch_size)
+            await session.commit()
+        
+        if deleted:
+            logger.info(f"AUDIT | SUCCESS | Outbox purge deleted {deleted} sent events")
+        return deleted
@@ -0,0 +1,325 @@
+"""
+rabbitmq_consumer.py
+
+RabbitMQ consumer engine for domain events.
+Binds a durable queue to the event exchange and dispatches messages to handlers.
+"""
+
+import asyncio
+import json
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Set, Tuple
+from aio_pika import connect_robust, Message, ExchangeType, Channel, Queue
+from aio_pika.abc import AbstractIncomingMessage, AbstractRobustConnection
+from loguru import logger
+
+from src.constants import EventTypes
+
+EventHandler = Callable[[Dict[str, Any]], Awaitable[None]]
+
+
+class RabbitMQConsumer:
+    """
+    Consumer for domain events published by RabbitMQPublisher.
+
+    Features:
+    1. One durable queue bound to the topic exchange for every registered event type
+    2. Prefetch-limited delivery into a bounded pool of handler tasks
+    3. Batched acknowledgements (`multiple=True` up to the highest contiguous finished delivery),
+       flushed every ack_batch_size messages (at most half the prefetch window, so delivery
+       never stalls waiting for the timer), whenever nothing delivered is still being
+       handled, or every ack_interval
+    4. Failed messages are retried through per-delay TTL queues, then parked in a dead-letter queue
+    5. Graceful drain: stop() cancels delivery, finishes in-flight handlers and flushes acks
+    6. After the robust connection reconnects, deliveries from the lost channel are
+       forgotten (their tags mean nothing on the new channel; the broker redelivers them)
+
+    Scale out by running more workers; they share the queue.
+    """
+
+    RETRY_HEADER = "x-retry-count"
+
+    def __init__(
+        self,
+        rabbitmq_url: str,
+        queue_name: str = "order_worker",
+        exchange_name: str = "order_events",
+        prefetch_count: int = 10,
+        concurrency: int = 10,
+        ack_batch_size: int = 5,
+        ack_interval: float = 0.5,
+        retry_delays: Optional[List[float]] = None,
+    ):
+        """
+        Initialize RabbitMQ consumer.
+
+        Args:
+            rabbitmq_url: AMQP connection URL.
+            queue_name: Durable work queue shared by all workers.
+            exchange_name: Topic exchange events are published to.
+            prefetch_count: Maximum unacknowledged deliveries per worker.
+            concurrency: Number of handler tasks.
+            ack_batch_size: Finished messages that trigger an acknowledgement flush;
+                capped at half of prefetch_count.
+            ack_interval: Seconds between acknowledgement flushes when traffic is low.
+            retry_delays: Delay in seconds before each retry; a message is dead-lettered
+                after len(retry_delays) failed retries.
+        """
+        self.rabbitmq_url = rabbitmq_url
+        self.queue_name = queue_name
+        self.exchange_name = exchange_name
+        self.prefetch_count = prefetch_count
+        self.concurrency = max(1, concurrency)
+        if prefetch_count > 0:
+            # A batch as large as the prefetch window could never fill: the broker
+            # stops delivering once prefetch_count messages are unacknowledged
+            ack_batch_size = min(ack_batch_size, prefetch_count // 2)
+        self.ack_batch_size = max(1, ack_batch_size)
+        self.ack_interval = ack_interval
+        self.retry_delays = [1.0, 5.0, 30.0] if retry_delays is None else retry_delays
+        self.dead_letter_queue_name = f"{queue_name}.dead"
+        self.connection: AbstractRobustConnection | None = None
+        self.channel: Channel | None = None
+        self.queue: Queue | None = None
+        self._handlers: Dict[str, EventHandler] = {}
+        self._consumer_tag: Optional[str] = None
+        # Deliveries tagged with the channel generation they arrived on
+        self._deliveries: "asyncio.Queue[Tuple[int, AbstractIncomingMessage]]" = asyncio.Queue()
+        self._generation = 0
+        self._workers: List[asyncio.Task] = []
+        self._acker: Optional[asyncio.Task] = None
+        # Delivery tags in arrival order, and those whose handling has finished
+        self._unacked: Deque[int] = deque()
+        self._finished: Dict[int, AbstractIncomingMessage] = {}
+        self._settled: Set[int] = set()
+
+    def register(self, event_type: EventTypes | str, handler: EventHandler) -> None:
+        """Register the handler for an event type (routing key)."""
+        routing_key = event_type.value if isinstance(event_type, EventTypes) else event_type
+        self._handlers[routing_key] = handler
+
+    def _retry_queue_name(self, delay: float) -> str:
+        return f"{self.queue_name}.retry.{int(delay * 1000)}ms"
+
+    async def start(self) -> None:
+        """
+        Declare the topology and start consuming.
+
+        Raises if the broker is unreachable; start() may then be called again.
+        """
+        logger.info("AUDIT | Connecting consumer to RabbitMQ")
+        self.connection = await connect_robust(self.rabbitmq_url)
+        try:
+            await self._declare_and_consume()
+        except Exception:
+            await self.connection.close()
+            self.connection = None
+            raise
+        self.connection.reconnect_callbacks.add(self._on_reconnect)
+
+        logger.info(
+            f"AUDIT | SUCCESS | Consuming {self.queue_name} for {sorted(self._handlers)} "
+            f"(prefetch={self.prefetch_count}, concurrency={self.concurrency})"
+        )
+
+    async def _declare_and_consume(self) -> None:
+        """Open the channel, declare queues and bindings, start handlers and consume."""
+        self.channel = await self.connection.channel()
+        await self.channel.set_qos(prefetch_count=self.prefetch_count)
+
+        exchange = await self.channel.declare_exchange(
+            self.exchange_name, ExchangeType.TOPIC, durable=True
+        )
+        self.queue = await self.channel.declare_queue(self.queue_name, durable=True)
+        for routing_key in self._handlers:
+            await self.queue.bind(exchange, routing_key=routing_key)
+
+        # Retry queues hold a message for their TTL, then dead-letter it straight
+        # back to the work queue through the default exchange
+        for delay in self.retry_delays:
+            await self.channel.declare_queue(
+                self._retry_queue_name(delay),
+                durable=True,
+                arguments={
+                    "x-message-ttl": int(delay * 1000),
+                    "x-dead-letter-exchange": "",
+                    "x-dead-letter-routing-key": self.queue_name,
+                },
+            )
+        await self.channel.declare_queue(self.dead_letter_queue_name, durable=True)
+
+        if not self._workers:
+            self._workers = [
+                asyncio.create_task(self._work()) for _ in range(self.concurrency)
+            ]
+        if self._acker is None:
+            self._acker = asyncio.create_task(self._ack_periodically())
+        self._consumer_tag = await self.queue.consume(self._deliver)
+
+    async def _deliver(self, message: AbstractIncomingMessage) -> None:
+        await self._deliveries.put((self._generation, message))
+
+    def _on_reconnect(self, *args: Any) -> None:
+        """
+        Forget deliveries of the lost channel.
+
+        Their tags cannot be acknowledged on the restored channel (and may collide
+        with its new tags); the broker requeued them when the channel closed.
+        """
+        self._generation += 1
+        self._unacked.clear()
+        self._finished.clear()
+        self._settled.clear()
+        logger.warning(f"AUDIT | RECONNECTED | Consumer {self.queue_name}; unacked deliveries will be redelivered")
+
+    async def stop(self) -> None:
+        """Stop receiving, let in-flight handlers finish, flush acks and disconnect."""
+        logger.info(f"AUDIT | START | Draining consumer {self.queue_name}")
+
+        if self.queue is not None and self._consumer_tag is not None:
+            await self.queue.cancel(self._consumer_tag)
+            self._consumer_tag = None
+
+        # Everything already delivered is handled before shutting down
+        await self._deliveries.join()
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+        if self._acker is not None:
+            self._acker.cancel()
+            self._acker = None
+        await self._flush_acks()
+
+        if self.connection:
+            await self.connection.close()
+        logger.info(f"AUDIT | CLOSED | Consumer {self.queue_name}")
+
+    async def _work(self) -> None:
+        """
+        Handler task: process deliveries one at a time.
+
+        A failing ack or nack is logged and the task moves on to the next delivery;
+        the broker redelivers whatever was left unacknowledged.
+        """
+        while True:
+            generation, message = await self._deliveries.get()
+            try:
+                if generation != self._generation:
+                    # Arrived on a channel lost since; the broker redelivers it
+                    continue
+                self._unacked.append(message.delivery_tag)
+                await self._process(message, generation)
+                if (
+                    len(self._finished) >= self.ack_batch_size
+                    or len(self._finished) + len(self._settled) >= len(self._unacked)
+                ):
+                    # Batch full, or nothing delivered is still being handled
+                    await self._flush_acks()
+            except Exception as e:
+                logger.error(f"AUDIT | FAILED | Settling delivery {message.delivery_tag}: {e}")
+            finally:
+                self._deliveries.task_done()
+
+    @staticmethod
+    def _event_type(message: AbstractIncomingMessage) -> str:
+        """Event type of a delivery; retried messages arrive with the queue name as routing key."""
+        return message.type or message.routing_key or ""
+
+    async def _process(self, message: AbstractIncomingMessage, generation: Optional[int] = None) -> None:
+        """Run the handler; on failure schedule a retry or dead-letter the message."""
+        if generation is None:
+            generation = self._generation
+        event_type = self._event_type(message)
+        handler = self._handlers.get(event_type)
+
+        try:
+            try:
+                if handler is None:
+                    raise LookupError(f"No handler registered for {event_type}")
+                payload = json.loads(message.body)
+            except (LookupError, ValueError) as e:
+                # Retrying cannot fix an unknown event type or a malformed payload
+                await self._reroute_failed(message, e, retryable=False)
+            else:
+                try:
+                    await handler(payload)
+                except Exception as e:
+                    await self._reroute_failed(message, e, retryable=True)
+        except Exception as e:
+            # Could not park the message anywhere: hand it back to the broker
+            logger.error(f"AUDIT | FAILED | Rerouting {event_type}: {e}")
+            if generation == self._generation:
+                # Settled even if the nack fails, so later acks are not held back
+                self._settled.add(message.delivery_tag)
+                await message.nack(requeue=True)
+            return
+
+        if generation == self._generation:
+            self._finished[message.delivery_tag] = message
+
+    async def _reroute_failed(
+        self,
+        message: AbstractIncomingMessage,
+        error: Exception,
+        retryable: bool,
+    ) -> None:
+        """Publish a failed message to the next retry queue, or to the dead-letter queue."""
+        event_type = self._event_type(message)
+        headers = dict(message.headers or {})
+        attempt = int(headers.get(self.RETRY_HEADER, 0))
+
+        if retryable and attempt < len(self.retry_delays):
+            target = self._retry_queue_name(self.retry_delays[attempt])
+            headers[self.RETRY_HEADER] = attempt + 1
+            logger.warning(
+                f"AUDIT | RETRY | {event_type} attempt {attempt + 1} "
+                f"in {self.retry_delays[attempt]}s: {error}"
+            )
+        else:
+            target = self.dead_letter_queue_name
+            headers["x-error"] = str(error)
+            logger.error(f"AUDIT | DEAD_LETTER | {event_type}: {error}")
+
+        await self.channel.default_exchange.publish(
+            Message(
+                body=message.body,
+                headers=headers,
+                content_type=message.content_type,
+                delivery_mode=2,  # Persistent
+                message_id=message.message_id,
+                # Keep the event type so a retried message reaches the same handler
+                type=event_type,
+            ),
+            routing_key=target,
+        )
+
+    async def _ack_periodically(self) -> None:
+        """Flush acknowledgements when traffic is too low to fill a batch."""
+        while True:
+            await asyncio.sleep(self.ack_interval)
+            try:
+                await self._flush_acks()
+            except Exception as e:
+                logger.error(f"AUDIT | FAILED | Periodic ack flush for {self.queue_name}: {e}")
+
+    async def _flush_acks(self) -> None:
+        """
+        Acknowledge every finished delivery up to the first one still being handled,
+        with a single `multiple=True` ack.
+        """
+        last_message: Optional[AbstractIncomingMessage] = None
+
+        while self._unacked:
+            tag = self._unacked[0]
+            if tag in self._settled:
+                self._settled.discard(tag)
+            elif tag in self._finished:
+                last_message = self._finished.pop(tag)
+            else:
+                break
+            self._unacked.popleft()
+
+        if last_message is not None:
+            await last_message.ack(multiple=True)
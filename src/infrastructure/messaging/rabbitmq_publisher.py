@@ -5,11 +5,14 @@ RabbitMQ-based implementation of IEventPublisher.
 Publishes domain events to a topic exchange.
 """
 
+import asyncio
+import itertools
 import json
-from typing import Any
+from typing import Any, List, Optional, Set, Tuple
 from aio_pika import connect, Message, ExchangeType, Channel, Exchange
 from aio_pika.abc import AbstractRobustConnection
 from loguru import logger
+from configs.logging_config import hot_logger
 
 from src.interface.protocols.infrastructure import IEventPublisher
 
@@ -19,6 +22,16 @@ class RabbitMQPublisher(IEventPublisher):
     RabbitMQ publisher for domain events.
     
     Publishes events to topic exchange for downstream consumers.
+    
+    Every channel runs in confirm mode, so a publish completes once the broker
+    has acked it. With batch_size > 1 the publisher is buffered:
+    1. Events are queued and flushed every `linger` seconds or `batch_size` messages
+    2. Each flush is published without waiting for the previous one (pipelining),
+       spread round-robin over a pool of channels; its messages are all sent before
+       their confirms are awaited together, so a flush costs one broker round trip
+    3. Each caller's publish resolves on its own broker ack (or raises on nack)
+    4. At most `max_in_flight` events may be queued or unconfirmed; further
+       callers wait (backpressure)
     """
     
     def __init__(
@@ -26,32 +39,97 @@ class RabbitMQPublisher(IEventPublisher):
         rabbitmq_url: str,
         exchange_name: str = "order_events",
         exchange_type: ExchangeType = ExchangeType.TOPIC,
+        channel_pool_size: int = 1,
+        batch_size: int = 1,
+        linger: float = 0.005,
+        max_in_flight: int = 1000,
     ):
-        """Initialize RabbitMQ publisher."""
+        """
+        Initialize RabbitMQ publisher.
+        
+        Args:
+            rabbitmq_url: AMQP connection URL.
+            exchange_name: Name of the topic exchange.
+            exchange_type: Exchange type.
+            channel_pool_size: Number of confirm-mode channels to publish over.
+            batch_size: Maximum events per flush; 1 publishes each event directly.
+            linger: Seconds to wait for a batch to fill before flushing it.
+            max_in_flight: Maximum events queued or awaiting broker confirms.
+        """
         self.rabbitmq_url = rabbitmq_url
         self.exchange_name = exchange_name
         self.exchange_type = exchange_type
+        self.channel_pool_size = max(1, channel_pool_size)
+        self.batch_size = max(1, batch_size)
+        self.linger = linger
+        self.max_in_flight = max_in_flight
         self.connection: AbstractRobustConnection | None = None
         self.channel: Channel | None = None
         self.exchange: Exchange | None = None
+        self._exchanges: List[Exchange] = []
+        self._next_exchange = itertools.count()
+        self._buffer: "asyncio.Queue[Tuple[Message, str, asyncio.Future]]" = asyncio.Queue()
+        self._in_flight = asyncio.Semaphore(max_in_flight)
+        self._flusher: Optional[asyncio.Task] = None
+        self._confirms: Set[asyncio.Task] = set()
+    
+    @property
+    def is_buffered(self) -> bool:
+        """Whether events are batched instead of published one by one."""
+        return self.batch_size > 1
+    
+    @property
+    def is_connected(self) -> bool:
+        """Whether the connection is open; otherwise connect() must be called (again)."""
+        return self.connection is not None and not self.connection.is_closed
     
     async def connect(self) -> None:
-        """Establish connection to RabbitMQ."""
-        logger.info(f"AUDIT | Connecting to RabbitMQ")
+        """Establish connection to RabbitMQ (replacing a connection that was lost)."""
+        hot_logger.info("AUDIT | Connecting to RabbitMQ")
         self.connection = await connect(self.rabbitmq_url)
-        self.channel = await self.connection.channel()
-        self.exchange = await self.channel.declare_exchange(
-            self.exchange_name,
-            self.exchange_type,
-            durable=True,
+        
+        self._exchanges = []
+        for _ in range(self.channel_pool_size):
+            # Confirm mode: exchange.publish() returns once the broker has acked the message
+            channel = await self.connection.channel(publisher_confirms=True)
+            exchange = await channel.declare_exchange(
+                self.exchange_name,
+                self.exchange_type,
+                durable=True,
+            )
+            if not self._exchanges:
+                self.channel = channel
+                self.exchange = exchange
+            self._exchanges.append(exchange)
+        
+        if self.is_buffered and self._flusher is None:
+            self._flusher = asyncio.create_task(self._flush_loop())
+        
+        hot_logger.info(
+            "AUDIT | SUCCESS | Connected to RabbitMQ exchange: {} ({} channels)",
+            self.exchange_name, self.channel_pool_size,
         )
-        logger.info(f"AUDIT | SUCCESS | Connected to RabbitMQ exchange: {self.exchange_name}")
     
     async def close(self) -> None:
-        """Close RabbitMQ connection."""
+        """Close RabbitMQ connection, failing events that were never flushed."""
+        if self._flusher is not None:
+            flusher, self._flusher = self._flusher, None
+            flusher.cancel()
+            # Let the flusher fail the batch it was still collecting
+            await asyncio.gather(flusher, return_exceptions=True)
+        
+        pending = []
+        while not self._buffer.empty():
+            pending.append(self._buffer.get_nowait())
+        self._fail_unsent(pending)
+        
+        if self._confirms:
+            # Let already published events collect their confirms
+            await asyncio.gather(*self._confirms, return_exceptions=True)
+        
         if self.connection:
             await self.connection.close()
-            logger.info("AUDIT | CLOSED | RabbitMQ connection")
+            hot_logger.info("AUDIT | CLOSED | RabbitMQ connection")
     
     async def publish(self, event: Any) -> None:
         """Publish domain event to RabbitMQ."""
@@ -61,13 +139,106 @@ class RabbitMQPublisher(IEventPublisher):
         event_dict = event.to_dict()
         event_type = event_dict.get("event_type", "unknown")
         
-        message_body = json.dumps(event_dict).encode()
+        await self.publish_raw(event_type, json.dumps(event_dict).encode())
+    
+    async def publish_raw(
+        self,
+        routing_key: str,
+        body: bytes,
+        message_id: Optional[str] = None,
+    ) -> None:
+        """
+        Publish an already serialized JSON event (used by the outbox relay).
+        
+        Returns once the broker has confirmed the message.
+        """
+        if self.exchange is None:
+            raise RuntimeError("Publisher not connected. Call connect() first.")
+        
         message = Message(
-            body=message_body,
+            body=body,
             content_type="application/json",
             delivery_mode=2,  # Persistent
+            message_id=message_id,
         )
         
-        routing_key = event_type
-        await self.exchange.publish(message, routing_key=routing_key)
-        logger.info(f"AUDIT | SUCCESS | Published event: {event_type}")
+        if not self.is_buffered:
+            await self.exchange.publish(message, routing_key=routing_key)
+            hot_logger.info("AUDIT | SUCCESS | Published event: {}", routing_key)
+            return
+        
+        # Backpressure: wait for a slot in the in-flight window
+        await self._in_flight.acquire()
+        future = asyncio.get_running_loop().create_future()
+        self._buffer.put_nowait((message, routing_key, future))
+        await future
+    
+    def _fail_unsent(self, entries: List[Tuple[Message, str, asyncio.Future]]) -> None:
+        """Fail events that will never be published and return their in-flight slots."""
+        for _, _, future in entries:
+            self._in_flight.release()
+            if not future.done():
+                future.set_exception(RuntimeError("Publisher closed before event was sent"))
+    
+    async def _flush_loop(self) -> None:
+        """Collect queued events into batches and publish them without waiting for confirms."""
+        loop = asyncio.get_running_loop()
+        
+        while True:
+            batch: List[Tuple[Message, str, asyncio.Future]] = []
+            try:
+                batch.append(await self._buffer.get())
+                deadline = loop.time() + self.linger
+                
+                while len(batch) < self.batch_size:
+                    if not self._buffer.empty():
+                        batch.append(self._buffer.get_nowait())
+                        continue
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._buffer.get(), remaining))
+                    except asyncio.TimeoutError:
+                        break
+            except asyncio.CancelledError:
+                # close() only drains the queue; events already taken off it live here
+                self._fail_unsent(batch)
+                raise
+            
+            task = asyncio.create_task(self._publish_batch(batch))
+            self._confirms.add(task)
+            task.add_done_callback(self._confirms.discard)
+            
+            hot_logger.debug("AUDIT | Flushed {} events to RabbitMQ", len(batch))
+    
+    async def _publish_batch(self, batch: List[Tuple[Message, str, asyncio.Future]]) -> None:
+        """Send a whole flush round-robin over the channel pool, then await its confirms together."""
+        await asyncio.gather(
+            *[
+                self._publish_confirmed(
+                    self._exchanges[next(self._next_exchange) % len(self._exchanges)],
+                    message, routing_key, future,
+                )
+                for message, routing_key, future in batch
+            ]
+        )
+    
+    async def _publish_confirmed(
+        self,
+        exchange: Exchange,
+        message: Message,
+        routing_key: str,
+        future: asyncio.Future,
+    ) -> None:
+        """Publish one buffered event and resolve its caller's future on the broker's confirm."""
+        try:
+            await exchange.publish(message, routing_key=routing_key)
+            if not future.done():
+                future.set_result(None)
+        except Exception as e:
+            logger.error(f"AUDIT | FAILED | Publishing event {routing_key}: {e}")
+            if not future.done():
+                future.set_exception(e)
+        finally:
+            self._in_flight.release()
@@ -6,5 +6,7 @@ Export database models.
 
 from src.infrastructure.models.product_model import ProductModel
 from src.infrastructure.models.order_model import OrderModel, OrderItemModel
+from src.infrastructure.models.outbox_model import OutboxModel
+from src.infrastructure.models.inventory_sync_model import InventorySyncOffsetModel
 
-__all__ = ["ProductModel", "OrderModel", "OrderItemModel"]
+__all__ = ["ProductModel", "OrderModel", "OrderItemModel", "OutboxModel", "InventorySyncOffsetModel"]
@@ -0,0 +1,30 @@
+"""
+inventory_sync_model.py
+
+SQLAlchemy ORM model for inventory write-behind progress.
+"""
+
+from datetime import datetime
+from sqlalchemy import Column, String, DateTime
+from sqlalchemy.orm import declarative_base
+
+Base = declarative_base()
+
+
+class InventorySyncOffsetModel(Base):
+    """
+    Inventory sync offset ORM model for PostgreSQL.
+    
+    Stores the ID of the last stock journal entry applied to products, updated
+    in the same transaction as the stock itself so every entry is applied once.
+    """
+    
+    __tablename__ = "inventory_sync_offsets"
+    
+    stream = Column(String(100), primary_key=True)
+    last_id = Column(String(40), nullable=False, default="0-0")
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    def __repr__(self) -> str:
+        """String representation of InventorySyncOffsetModel."""
+        return f"<InventorySyncOffsetModel(stream='{self.stream}', last_id='{self.last_id}')>"
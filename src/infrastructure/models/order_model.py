@@ -39,7 +39,8 @@ class OrderModel(Base):
     
     # Indexes for common queries
     __table_args__ = (
-        Index("idx_order_customer", "customer_id"),
+        # Customer order history, newest first (keyset pagination)
+        Index("idx_order_customer_created", customer_id, created_at.desc(), id.desc()),
         Index("idx_order_status", "status"),
         Index("idx_order_created", "created_at"),
     )
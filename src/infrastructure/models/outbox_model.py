@@ -0,0 +1,46 @@
+"""
+outbox_model.py
+
+SQLAlchemy ORM model for the transactional outbox.
+"""
+
+from datetime import datetime
+from sqlalchemy import Column, Integer, String, Text, DateTime, Index
+from sqlalchemy.orm import declarative_base
+
+Base = declarative_base()
+
+
+class OutboxModel(Base):
+    """
+    Outbox ORM model for PostgreSQL.
+    
+    Domain events are inserted here in the same transaction as the state change
+    that produced them, then relayed to the broker by the worker.
+    """
+    
+    __tablename__ = "outbox"
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    event_type = Column(String(100), nullable=False)
+    payload = Column(Text, nullable=False)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    sent_at = Column(DateTime, nullable=True)
+    
+    # Partial indexes: the relay only ever scans unsent rows, the purge only sent ones
+    __table_args__ = (
+        Index(
+            "idx_outbox_unsent",
+            "id",
+            postgresql_where=sent_at.is_(None),
+        ),
+        Index(
+            "idx_outbox_sent_at",
+            "sent_at",
+            postgresql_where=sent_at.is_not(None),
+        ),
+    )
+    
+    def __repr__(self) -> str:
+        """String representation of OutboxModel."""
+        return f"<OutboxModel(id={self.id}, event_type='{self.event_type}', sent_at={self.sent_at})>"
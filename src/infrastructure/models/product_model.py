@@ -31,6 +31,13 @@ class ProductModel(Base):
     __table_args__ = (
         Index("idx_product_sku", "sku"),
         Index("idx_product_stock", "stock_quantity"),
+        # Trigram index for name search (similarity and ILIKE '%term%')
+        Index(
+            "idx_product_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
     )
     
     def __repr__(self) -> str:
@@ -6,5 +6,16 @@ Export repository implementations for the infrastructure layer.
 
 from src.infrastructure.repositories.product_repository import ProductRepository
 from src.infrastructure.repositories.order_repository import OrderRepository
+from src.infrastructure.repositories.cached_product_repository import CachedProductRepository
+from src.infrastructure.repositories.order_query_repository import OrderQueryRepository
+from src.infrastructure.repositories.inventory_sync_repository import InventorySyncRepository
+from src.infrastructure.repositories.transactional_session import TransactionalSession
 
-__all__ = ["ProductRepository", "OrderRepository"]
+__all__ = [
+    "ProductRepository",
+    "OrderRepository",
+    "CachedProductRepository",
+    "OrderQueryRepository",
+    "InventorySyncRepository",
+    "TransactionalSession",
+]
@@ -0,0 +1,163 @@
+"""
+cached_product_repository.py
+
+Caching decorator around ProductRepository.
+Serves product lookups by ID from the in-process ProductCatalogCache,
+then the shared Redis tier, and only then PostgreSQL.
+"""
+
+from functools import partial
+from typing import Awaitable, Callable, Dict, Optional, List, Tuple
+from configs.logging_config import hot_logger
+
+from src.domain.entities import Product
+from src.interface.protocols.repositories import IProductRepository
+from src.infrastructure.caching.product_catalog_cache import ProductCatalogCache
+from src.infrastructure.caching.redis_product_cache import RedisProductCache
+
+
+class CachedProductRepository(IProductRepository):
+    """
+    Product repository with a read-through catalog cache.
+    
+    Lookups by ID are served from memory, then from Redis, and only what both
+    tiers miss reaches PostgreSQL. Every write invalidates the affected
+    products in Redis and on all replicas once its transaction commits:
+    invalidating earlier would let a concurrent reader cache the old row
+    again before the new one is visible. Rolled-back writes invalidate nothing.
+    """
+    
+    def __init__(
+        self,
+        repository: IProductRepository,
+        cache: ProductCatalogCache,
+        after_commit: Callable[[Callable[[], Awaitable[None]]], None],
+        shared_cache: Optional[RedisProductCache] = None,
+    ):
+        """
+        Initialize repository.
+        
+        Args:
+            repository: Underlying database-backed product repository.
+            cache: Shared in-process product cache.
+            after_commit: Registers work to run once the repository's session
+                commits (TransactionalSession.after_commit).
+            shared_cache: Optional Redis tier shared across replicas.
+        """
+        self.repository = repository
+        self.cache = cache
+        self.after_commit = after_commit
+        self.shared_cache = shared_cache
+    
+    async def get_by_id(self, product_id: int) -> Optional[Product]:
+        """Get product by ID (cached)."""
+        products = await self.get_many_by_ids([product_id])
+        return products[0] if products else None
+    
+    async def get_by_sku(self, sku: str) -> Optional[Product]:
+        """Get product by SKU (not cached)."""
+        return await self.repository.get_by_sku(sku)
+    
+    async def get_many_by_ids(self, product_ids: List[int]) -> List[Product]:
+        """Get multiple products by IDs, loading only cache misses from the database."""
+        cached = self.cache.get_many(product_ids)
+        missing = [product_id for product_id in dict.fromkeys(product_ids) if product_id not in cached]
+        
+        if missing:
+            version = self.cache.version
+            loaded = await self._load_misses(missing)
+            self.cache.put_many(loaded, version)
+            cached.update((product.id, product) for product in loaded)
+        
+        return [cached[product_id] for product_id in dict.fromkeys(product_ids) if product_id in cached]
+    
+    async def _load_misses(self, product_ids: List[int]) -> List[Product]:
+        """
+        Load products missing from memory: Redis first, database for the rest.
+        
+        Rows read from the database are written back to Redis only if their
+        Redis-side versions did not move during the load (checked in Redis, so
+        writes on other replicas count even before their invalidation arrives
+        here); otherwise they may predate a write that was just committed.
+        """
+        shared, versions = await self.shared_cache.get_many(product_ids) if self.shared_cache else ({}, {})
+        missing = [product_id for product_id in product_ids if product_id not in shared]
+        
+        loaded: List[Product] = []
+        if missing:
+            loaded = await self.repository.get_many_by_ids(missing)
+            if self.shared_cache and loaded:
+                await self.shared_cache.set_many(loaded, versions)
+        
+        hot_logger.debug(
+            "Product cache | Memory misses: {} | Redis hits: {} | Database: {}",
+            len(product_ids), len(shared), len(loaded),
+        )
+        return list(shared.values()) + loaded
+    
+    def _invalidate_after_commit(self, product_ids: List[int]) -> None:
+        """Invalidate products once the transaction that wrote them commits."""
+        if product_ids:
+            self.after_commit(partial(self._invalidate_many, product_ids))
+    
+    async def _invalidate_many(self, product_ids: List[int]) -> None:
+        """Drop products from both cache tiers (Redis first, then every replica's memory)."""
+        if not product_ids:
+            return
+        if self.shared_cache:
+            await self.shared_cache.delete_many(product_ids)
+        await self.cache.invalidate(product_ids)
+    
+    async def get_stock_levels(self, after_id: int = 0, limit: int = 1000) -> List[tuple[int, int]]:
+        """Get a keyset page of (product_id, stock_quantity) pairs."""
+        return await self.repository.get_stock_levels(after_id=after_id, limit=limit)
+    
+    async def list_products(self, limit: int = 10, after_id: int = 0) -> List[Product]:
+        """List a keyset page of products (not cached)."""
+        return await self.repository.list_products(limit=limit, after_id=after_id)
+    
+    async def search_products(
+        self,
+        term: str,
+        limit: int = 10,
+        after: Optional[Tuple[float, int]] = None,
+    ) -> List[Tuple[Product, float]]:
+        """Search products by name (not cached)."""
+        return await self.repository.search_products(term, limit=limit, after=after)
+    
+    async def save(self, product: Product) -> Product:
+        """Save product and invalidate its cache entry after commit."""
+        saved = await self.repository.save(product)
+        self._invalidate_after_commit([saved.id])
+        return saved
+    
+    async def delete(self, product_id: int) -> bool:
+        """Delete product and invalidate its cache entry after commit."""
+        deleted = await self.repository.delete(product_id)
+        if deleted:
+            self._invalidate_after_commit([product_id])
+        return deleted
+    
+    async def upsert_many(self, products: List[Product]) -> List[Tuple[int, bool]]:
+        """Upsert products and invalidate the cache entries of updated ones after commit."""
+        results = await self.repository.upsert_many(products)
+        self._invalidate_after_commit([product_id for product_id, created in results if not created])
+        return results
+    
+    async def copy_upsert_many(self, products: List[Product]) -> List[Tuple[int, bool]]:
+        """COPY-upsert products and invalidate the cache entries of updated ones after commit."""
+        results = await self.repository.copy_upsert_many(products)
+        self._invalidate_after_commit([product_id for product_id, created in results if not created])
+        return results
+    
+    async def update_stock(self, product_id: int, quantity_delta: int) -> int:
+        """Update product stock quantity and invalidate its cache entry after commit."""
+        stock = await self.repository.update_stock(product_id, quantity_delta)
+        self._invalidate_after_commit([product_id])
+        return stock
+    
+    async def update_stock_many(self, quantity_deltas: Dict[int, int]) -> Dict[int, int]:
+        """Update the stock of many products and invalidate the adjusted ones after commit."""
+        stock = await self.repository.update_stock_many(quantity_deltas)
+        self._invalidate_after_commit(list(stock))
+        return stock
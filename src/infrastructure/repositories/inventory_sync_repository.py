@@ -0,0 +1,63 @@
+"""
+inventory_sync_repository.py
+
+Inventory sync offset repository implementation using SQLAlchemy.
+Tracks how far the stock journal has been written behind to PostgreSQL.
+"""
+
+from datetime import datetime
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update
+
+from src.infrastructure.models import InventorySyncOffsetModel
+
+
+class InventorySyncRepository:
+    """
+    Inventory sync offset repository implementation.
+    
+    Offsets are Redis stream entry IDs; "0-0" means nothing has been applied yet.
+    """
+    
+    INITIAL_OFFSET = "0-0"
+    
+    def __init__(self, session: AsyncSession):
+        """
+        Initialize repository.
+        
+        Args:
+            session: SQLAlchemy async session.
+        """
+        self.session = session
+    
+    async def get_offset(self, stream: str) -> str:
+        """Get the last applied entry ID of a stream."""
+        offset = await self.session.scalar(
+            select(InventorySyncOffsetModel.last_id).where(InventorySyncOffsetModel.stream == stream)
+        )
+        return offset or self.INITIAL_OFFSET
+    
+    async def lock_offset(self, stream: str) -> str:
+        """
+        Get the last applied entry ID of a stream and lock it (FOR UPDATE) until the
+        transaction ends, so concurrent workers apply each entry only once.
+        """
+        stmt = (
+            select(InventorySyncOffsetModel.last_id)
+            .where(InventorySyncOffsetModel.stream == stream)
+            .with_for_update()
+        )
+        offset = await self.session.scalar(stmt)
+        if offset is None:
+            self.session.add(InventorySyncOffsetModel(stream=stream, last_id=self.INITIAL_OFFSET))
+            await self.session.flush()
+            offset = await self.session.scalar(stmt)
+        return offset
+    
+    async def set_offset(self, stream: str, last_id: str) -> None:
+        """Record the last applied entry ID (committed with the stock updates)."""
+        await self.session.execute(
+            update(InventorySyncOffsetModel)
+            .where(InventorySyncOffsetModel.stream == stream)
+            .values(last_id=last_id, updated_at=datetime.utcnow())
+        )
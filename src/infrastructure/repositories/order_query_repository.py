@@ -0,0 +1,200 @@
+"""
+order_query_repository.py
+
+Read-only order projections using SQLAlchemy Core.
+Maps result rows straight to response DTOs, bypassing ORM entities.
+"""
+
+from datetime import datetime
+from decimal import Decimal
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import Select, select, tuple_
+from configs.logging_config import hot_logger
+
+from src.application.dtos import OrderResponseDTO, OrderItemResponseDTO
+from src.interface.protocols.repositories import IOrderReadRepository
+from src.infrastructure.models import OrderModel, OrderItemModel
+
+
+class OrderQueryRepository(IOrderReadRepository):
+    """
+    Fast read path for order status polling and history.
+
+    Each query is a single round trip selecting only the columns the response
+    needs (orders joined to their items). Rows are plain tuples: no identity
+    map, no relationship loading and no domain entity construction.
+    """
+
+    def __init__(self, session: AsyncSession):
+        """
+        Initialize repository.
+
+        Args:
+            session: SQLAlchemy async session.
+        """
+        self.session = session
+
+    async def get_by_id(self, order_id: int) -> Optional[OrderResponseDTO]:
+        """Get the response projection of one order."""
+        page = (
+            select(*self._order_columns())
+            .where(OrderModel.id == order_id)
+            .subquery()
+        )
+        views = await self._fetch_with_items(page)
+        return views[0] if views else None
+
+    async def get_by_customer_id(
+        self,
+        customer_id: int,
+        limit: int = 10,
+        after: Optional[Tuple[datetime, int]] = None,
+    ) -> List[OrderResponseDTO]:
+        """Get a page of a customer's orders, newest first, after a (created_at, id) position."""
+        hot_logger.debug(
+            "AUDIT | Reading orders for customer: {} | After: {} | Limit: {}", customer_id, after, limit
+        )
+
+        stmt = (
+            select(*self._order_columns())
+            .where(OrderModel.customer_id == customer_id)
+            .order_by(OrderModel.created_at.desc(), OrderModel.id.desc())
+            .limit(limit)
+        )
+        if after is not None:
+            stmt = stmt.where(tuple_(OrderModel.created_at, OrderModel.id) < tuple_(*after))
+
+        return await self._fetch_with_items(stmt.subquery())
+
+    async def stream_orders(
+        self,
+        status: Optional[str] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[OrderResponseDTO]:
+        """
+        Stream matching orders with their items in ID order.
+
+        Rows come from a server-side cursor, fetched batch_size at a time, and each
+        order is yielded as soon as its last item row has been read, so memory use
+        does not grow with the size of the result.
+
+        Args:
+            status: Only orders in this status.
+            created_from: Only orders created at or after this time.
+            created_to: Only orders created before this time.
+            batch_size: Rows fetched from the cursor per round trip.
+        """
+        hot_logger.info(
+            "AUDIT | START | Streaming orders | Status: {} | From: {} | To: {}",
+            status, created_from, created_to,
+        )
+
+        stmt = (
+            select(*self._order_columns(), *self._item_columns())
+            .outerjoin(OrderItemModel, OrderItemModel.order_id == OrderModel.id)
+            .order_by(OrderModel.id, OrderItemModel.id)
+            .execution_options(yield_per=batch_size)
+        )
+        if status is not None:
+            stmt = stmt.where(OrderModel.status == status)
+        if created_from is not None:
+            stmt = stmt.where(OrderModel.created_at >= created_from)
+        if created_to is not None:
+            stmt = stmt.where(OrderModel.created_at < created_to)
+
+        result = await self.session.stream(stmt)
+        view: Optional[OrderResponseDTO] = None
+        count = 0
+        try:
+            async for row in result:
+                # Item rows of one order are adjacent, so an order is complete
+                # once a row of the next one arrives
+                if view is None or row.id != view.id:
+                    if view is not None:
+                        yield view
+                        count += 1
+                    view = self._new_view(row)
+                self._add_item(view, row)
+            if view is not None:
+                yield view
+                count += 1
+        finally:
+            await result.close()
+
+        hot_logger.info("AUDIT | SUCCESS | Streamed {} orders", count)
+
+    @staticmethod
+    def _order_columns() -> tuple:
+        return (
+            OrderModel.id,
+            OrderModel.customer_id,
+            OrderModel.status,
+            OrderModel.created_at,
+            OrderModel.updated_at,
+        )
+
+    @staticmethod
+    def _item_columns() -> tuple:
+        return (
+            OrderItemModel.product_id,
+            OrderItemModel.product_sku,
+            OrderItemModel.product_name,
+            OrderItemModel.quantity,
+            OrderItemModel.unit_price,
+        )
+
+    async def _fetch_with_items(self, page) -> List[OrderResponseDTO]:
+        """Join the selected orders to their items and fold the rows into DTOs, keeping page order."""
+        stmt: Select = (
+            select(page, *self._item_columns())
+            .outerjoin(OrderItemModel, OrderItemModel.order_id == page.c.id)
+            .order_by(page.c.created_at.desc(), page.c.id.desc(), OrderItemModel.id)
+        )
+        result = await self.session.execute(stmt)
+
+        views: Dict[int, OrderResponseDTO] = {}
+        for row in result:
+            view = views.get(row.id)
+            if view is None:
+                view = views[row.id] = self._new_view(row)
+            self._add_item(view, row)
+
+        return list(views.values())
+
+    @staticmethod
+    def _new_view(row) -> OrderResponseDTO:
+        """Start an order DTO from the order columns of a row."""
+        return OrderResponseDTO(
+            id=row.id,
+            customer_id=row.customer_id,
+            items=[],
+            total_amount=Decimal("0"),
+            total_items=0,
+            status=row.status,
+            created_at=row.created_at,
+            updated_at=row.updated_at,
+        )
+
+    @staticmethod
+    def _add_item(view: OrderResponseDTO, row) -> None:
+        """Append the item columns of a row to its order; outer-joined orders without items have none."""
+        if row.product_id is None:
+            return
+
+        # Numeric columns already come back as Decimal
+        subtotal = row.unit_price * row.quantity
+        view.items.append(
+            OrderItemResponseDTO(
+                product_id=row.product_id,
+                product_sku=row.product_sku,
+                product_name=row.product_name,
+                quantity=row.quantity,
+                unit_price=row.unit_price,
+                subtotal=subtotal,
+            )
+        )
+        view.total_amount += subtotal
+        view.total_items += row.quantity
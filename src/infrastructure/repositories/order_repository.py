@@ -8,9 +8,10 @@ Maps between Order domain entity and OrderModel ORM.
 from typing import Optional, List
 from decimal import Decimal
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, insert
 from sqlalchemy.orm import selectinload
 from loguru import logger
+from configs.logging_config import hot_logger
 
 from src.domain.entities import Order, OrderItem, OrderStatus
 from src.interface.protocols.repositories import IOrderRepository
@@ -35,7 +36,7 @@ class OrderRepository(IOrderRepository):
     
     async def get_by_id(self, order_id: int) -> Optional[Order]:
         """Get order by ID with items eagerly loaded."""
-        logger.debug(f"Fetching order by ID: {order_id}")
+        hot_logger.debug("Fetching order by ID: {}", order_id)
         
         stmt = (
             select(OrderModel)
@@ -46,36 +47,11 @@ class OrderRepository(IOrderRepository):
         model = result.scalar_one_or_none()
         
         if model is None:
-            logger.debug(f"Order {order_id} not found")
+            hot_logger.debug("Order {} not found", order_id)
             return None
         
         return self._to_entity(model)
     
-    async def get_by_customer_id(
-        self, 
-        customer_id: int, 
-        skip: int = 0, 
-        limit: int = 10
-    ) -> List[Order]:
-        """
-        Get paged orders for a customer.
-        Fulfills 'Filtering & Pagination' responsibility.
-        """
-        logger.debug(f"AUDIT | Fetching orders for customer: {customer_id} | Skip: {skip} | Limit: {limit}")
-        
-        stmt = (
-            select(OrderModel)
-            .options(selectinload(OrderModel.items))
-            .where(OrderModel.customer_id == customer_id)
-            .offset(skip)
-            .limit(limit)
-            .order_by(OrderModel.created_at.desc())
-        )
-        result = await self.session.execute(stmt)
-        models = result.scalars().all()
-        
-        return [self._to_entity(model) for model in models]
-    
     async def delete(self, order_id: int) -> bool:
         """
         Delete order by ID.
@@ -87,7 +63,7 @@ class OrderRepository(IOrderRepository):
         if model:
             await self.session.delete(model)
             await self.session.flush()
-            logger.info(f"AUDIT | SUCCESS | Deleted order ID: {order_id}")
+            hot_logger.info("AUDIT | SUCCESS | Deleted order ID: {}", order_id)
             return True
             
         logger.warning(f"AUDIT | FAILED | Order {order_id} not found for deletion")
@@ -101,24 +77,84 @@ class OrderRepository(IOrderRepository):
         Fulfills 'Create/Update' operations and 'Data Abstraction' responsibilities.
         """
         if order.id is None:
-            # Create new
-            logger.debug(f"AUDIT | Creating new order for customer {order.customer_id}")
-            model = self._to_model(order)
-            self.session.add(model)
-        else:
-            # Update existing
-            logger.debug(f"AUDIT | Updating order ID: {order.id}")
-            model = await self._get_model_by_id(order.id)
-            if model is None:
-                raise ValueError(f"Order {order.id} not found for update")
-            
-            self._update_model_from_entity(model, order)
+            # Create new: INSERT ... RETURNING for the order, one INSERT for all items, no refresh
+            hot_logger.debug("AUDIT | Creating new order for customer {}", order.customer_id)
+            return (await self.save_many([order]))[0]
+        
+        # Update existing
+        hot_logger.debug("AUDIT | Updating order ID: {}", order.id)
+        model = await self._get_model_by_id(order.id)
+        if model is None:
+            raise ValueError(f"Order {order.id} not found for update")
+        
+        self._update_model_from_entity(model, order)
         
         await self.session.flush()
         await self.session.refresh(model, ["items"])
         
         return self._to_entity(model)
     
+    async def save_many(self, orders: List[Order]) -> List[Order]:
+        """
+        Create several new orders with two multi-row INSERTs.
+        
+        Orders are inserted with RETURNING id and timestamps (in parameter order),
+        then every item of every order in a single statement. Entities are built
+        from the returned rows, so nothing is read back with a refresh.
+        """
+        if not orders:
+            return []
+        
+        hot_logger.debug("AUDIT | Creating {} orders in bulk", len(orders))
+        
+        result = await self.session.execute(
+            insert(OrderModel).returning(
+                OrderModel.id,
+                OrderModel.created_at,
+                OrderModel.updated_at,
+                sort_by_parameter_order=True,
+            ),
+            [
+                {
+                    "customer_id": order.customer_id,
+                    "status": order.status.value,
+                    "created_at": order.created_at,
+                    "updated_at": order.updated_at,
+                }
+                for order in orders
+            ],
+        )
+        rows = result.all()
+        order_ids = [row.id for row in rows]
+        
+        await self.session.execute(
+            insert(OrderItemModel),
+            [
+                {
+                    "order_id": order_id,
+                    "product_id": item.product_id,
+                    "product_sku": item.product_sku,
+                    "product_name": item.product_name,
+                    "quantity": item.quantity,
+                    "unit_price": item.unit_price,
+                }
+                for order_id, order in zip(order_ids, orders)
+                for item in order.items
+            ],
+        )
+        
+        return [
+            Order(
+                id=row.id,
+                customer_id=order.customer_id,
+                items=list(order.items),
+                status=order.status,
+                created_at=row.created_at,
+                updated_at=row.updated_at,
+            )
+            for row, order in zip(rows, orders)
+        ]
+    
     async def update_status(self, order_id: int, status: str) -> None:
         """
         Update order status.
@@ -126,7 +162,7 @@ class OrderRepository(IOrderRepository):
         Directly updates the status field of an existing order.
         Fulfills 'Query Encapsulation' responsibility.
         """
-        logger.debug(f"AUDIT | Updating order {order_id} status to: {status}")
+        hot_logger.debug("AUDIT | Updating order {} status to: {}", order_id, status)
         
         model = await self._get_model_by_id(order_id)
         if model is None:
@@ -170,29 +206,6 @@ class OrderRepository(IOrderRepository):
             updated_at=model.updated_at,
         )
     
-    def _to_model(self, entity: Order) -> OrderModel:
-        """Convert domain entity to ORM model."""
-        order_model = OrderModel(
-            id=entity.id,
-            customer_id=entity.customer_id,
-            status=entity.status.value,
-            created_at=entity.created_at,
-            updated_at=entity.updated_at,
-        )
-        
-        # Add order items
-        for item in entity.items:
-            item_model = OrderItemModel(
-                product_id=item.product_id,
-                product_sku=item.product_sku,
-                product_name=item.product_name,
-                quantity=item.quantity,
-                unit_price=float(item.unit_price),
-            )
-            order_model.items.append(item_model)
-        
-        return order_model
-    
     def _update_model_from_entity(self, model: OrderModel, entity: Order) -> None:
         """Update ORM model fields from domain entity."""
         model.customer_id = entity.customer_id
@@ -0,0 +1,81 @@
+"""
+outbox_repository.py
+
+Outbox repository implementation using SQLAlchemy.
+Stores serialized domain events until the relay has published them.
+"""
+
+import json
+from datetime import datetime
+from typing import Any, List, Sequence
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import delete, select, update
+from configs.logging_config import hot_logger
+
+from src.infrastructure.models import OutboxModel
+
+
+class OutboxRepository:
+    """
+    Outbox repository implementation.
+    
+    Writes join the caller's session, so an event is committed (or rolled back)
+    together with the state change that produced it.
+    """
+    
+    def __init__(self, session: AsyncSession):
+        """
+        Initialize repository.
+        
+        Args:
+            session: SQLAlchemy async session.
+        """
+        self.session = session
+    
+    async def add(self, event: Any) -> None:
+        """Stage a domain event in the outbox (no flush; committed with the session)."""
+        event_dict = event.to_dict()
+        event_type = event_dict.get("event_type", "unknown")
+        
+        self.session.add(OutboxModel(event_type=event_type, payload=json.dumps(event_dict)))
+        hot_logger.debug("AUDIT | Outbox | Staged event: {}", event_type)
+    
+    async def fetch_unsent(self, limit: int = 100) -> List[OutboxModel]:
+        """
+        Lock and return the oldest unsent events.
+        
+        Uses FOR UPDATE SKIP LOCKED so several relays can drain the outbox
+        concurrently without handing out the same row twice.
+        """
+        stmt = (
+            select(OutboxModel)
+            .where(OutboxModel.sent_at.is_(None))
+            .order_by(OutboxModel.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+    
+    async def mark_sent(self, outbox_ids: Sequence[int]) -> None:
+        """Mark events as published in a single UPDATE."""
+        if not outbox_ids:
+            return
+        
+        stmt = (
+            update(OutboxModel)
+            .where(OutboxModel.id.in_(outbox_ids))
+            .values(sent_at=datetime.utcnow())
+        )
+        await self.session.execute(stmt)
+    
+    async def delete_sent(self, sent_before: datetime, limit: int = 1000) -> int:
+        """Delete up to limit events published before sent_before; return how many were deleted."""
+        oldest = (
+            select(OutboxModel.id)
+            .where(OutboxModel.sent_at < sent_before)
+            .order_by(OutboxModel.sent_at)
+            .limit(limit)
+        )
+        result = await self.session.execute(delete(OutboxModel).where(OutboxModel.id.in_(oldest)))
+        return result.rowcount
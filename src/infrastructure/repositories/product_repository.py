@@ -5,13 +5,16 @@ Product repository implementation using SQLAlchemy.
 Maps between Product domain entity and ProductModel ORM.
 """
 
-from typing import Optional, List
+from typing import Dict, Optional, List, Tuple
 from decimal import Decimal
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import Integer, Select, and_, column, func, literal_column, or_, select, text, update, values
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from loguru import logger
+from configs.logging_config import hot_logger
 
 from src.domain.entities import Product
+from src.domain.exceptions import ProductNotFoundError, InsufficientStockError
 from src.interface.protocols.repositories import IProductRepository
 from src.infrastructure.models import ProductModel
 
@@ -23,6 +26,10 @@ class ProductRepository(IProductRepository):
     Handles persistence of Product entities using PostgreSQL.
     """
     
+    # Columns written by bulk upserts, and the staging table used by COPY
+    UPSERT_COLUMNS = ("sku", "name", "description", "price", "stock_quantity")
+    STAGING_TABLE = "products_import"
+    
     def __init__(self, session: AsyncSession):
         """
         Initialize repository.
@@ -34,35 +41,35 @@ class ProductRepository(IProductRepository):
     
     async def get_by_id(self, product_id: int) -> Optional[Product]:
         """Get product by ID."""
-        logger.debug(f"Fetching product by ID: {product_id}")
+        hot_logger.debug("Fetching product by ID: {}", product_id)
         
         stmt = select(ProductModel).where(ProductModel.id == product_id)
         result = await self.session.execute(stmt)
         model = result.scalar_one_or_none()
         
         if model is None:
-            logger.debug(f"Product {product_id} not found")
+            hot_logger.debug("Product {} not found", product_id)
             return None
         
         return self._to_entity(model)
     
     async def get_by_sku(self, sku: str) -> Optional[Product]:
         """Get product by SKU."""
-        logger.debug(f"Fetching product by SKU: {sku}")
+        hot_logger.debug("Fetching product by SKU: {}", sku)
         
         stmt = select(ProductModel).where(ProductModel.sku == sku)
         result = await self.session.execute(stmt)
         model = result.scalar_one_or_none()
         
         if model is None:
-            logger.debug(f"Product with SKU '{sku}' not found")
+            hot_logger.debug("Product with SKU '{}' not found", sku)
             return None
         
         return self._to_entity(model)
     
     async def get_many_by_ids(self, product_ids: List[int]) -> List[Product]:
         """Get multiple products by IDs."""
-        logger.debug(f"Fetching {len(product_ids)} products")
+        hot_logger.debug("Fetching {} products", len(product_ids))
         
         stmt = select(ProductModel).where(ProductModel.id.in_(product_ids))
         result = await self.session.execute(stmt)
@@ -70,27 +77,88 @@ class ProductRepository(IProductRepository):
         
         return [self._to_entity(model) for model in models]
     
-    async def list_products(
-        self, 
-        skip: int = 0, 
-        limit: int = 10, 
-        search: Optional[str] = None
-    ) -> List[Product]:
+    async def get_stock_levels(self, after_id: int = 0, limit: int = 1000) -> List[tuple[int, int]]:
         """
-        List products with pagination and search.
-        Fulfills 'Filtering & Pagination' core responsibility.
+        Get (product_id, stock_quantity) pairs ordered by ID, one keyset page at a time.
+        Selects only the two columns needed for cache warm-up, without ORM entities.
         """
-        logger.debug(f"AUDIT | Fetching product page | Skip: {skip} | Limit: {limit} | Search: {search}")
+        hot_logger.debug("AUDIT | Fetching stock levels | After ID: {} | Limit: {}", after_id, limit)
         
-        stmt = select(ProductModel).offset(skip).limit(limit)
+        stmt = (
+            select(ProductModel.id, ProductModel.stock_quantity)
+            .where(ProductModel.id > after_id)
+            .order_by(ProductModel.id)
+            .limit(limit)
+        )
+        result = await self.session.execute(stmt)
         
-        if search:
-            stmt = stmt.where(ProductModel.name.ilike(f"%{search}%"))
-            
+        return [(row.id, row.stock_quantity) for row in result]
+    
+    async def list_products(self, limit: int = 10, after_id: int = 0) -> List[Product]:
+        """
+        List products ordered by ID, one keyset page at a time.
+        Fulfills 'Filtering & Pagination' core responsibility.
+        """
+        hot_logger.debug("AUDIT | Fetching product page | After ID: {} | Limit: {}", after_id, limit)
+        
+        stmt = (
+            select(ProductModel)
+            .where(ProductModel.id > after_id)
+            .order_by(ProductModel.id)
+            .limit(limit)
+        )
         result = await self.session.execute(stmt)
         models = result.scalars().all()
         
         return [self._to_entity(model) for model in models]
+    
+    async def search_products(
+        self,
+        term: str,
+        limit: int = 10,
+        after: Optional[Tuple[float, int]] = None,
+    ) -> List[Tuple[Product, float]]:
+        """
+        Search products by name, best matches first.
+        
+        Matches names similar to the term (pg_trgm `%`) or containing it (ILIKE);
+        both predicates are served by the idx_product_name_trgm GIN index.
+        Ranked by trigram similarity, ties broken by ID, with keyset pagination
+        on (rank, id).
+        
+        Returns:
+            (product, rank) pairs; pass the last pair's (rank, id) as `after` for the next page.
+        """
+        hot_logger.debug(
+            "AUDIT | Searching products | Term: {} | After: {} | Limit: {}", term, after, limit
+        )
+        
+        result = await self.session.execute(self._search_statement(term, limit, after))
+        
+        return [(self._to_entity(row.ProductModel), row.rank) for row in result]
+    
+    @staticmethod
+    def _search_statement(term: str, limit: int, after: Optional[Tuple[float, int]]) -> Select:
+        """Build the ranked trigram search query (PostgreSQL only)."""
+        rank = func.similarity(ProductModel.name, term).label("rank")
+        pattern = "%" + term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+        
+        stmt = (
+            select(ProductModel, rank)
+            .where(or_(ProductModel.name.op("%")(term), ProductModel.name.ilike(pattern, escape="\\")))
+            .order_by(rank.desc(), ProductModel.id)
+            .limit(limit)
+        )
+        if after is not None:
+            last_rank, last_id = after
+            similarity = func.similarity(ProductModel.name, term)
+            stmt = stmt.where(
+                or_(
+                    similarity < last_rank,
+                    and_(similarity == last_rank, ProductModel.id > last_id),
+                )
+            )
+        return stmt
 
     async def delete(self, product_id: int) -> bool:
         """
@@ -103,7 +171,7 @@ class ProductRepository(IProductRepository):
         if model:
             await self.session.delete(model)
             await self.session.flush()
-            logger.info(f"AUDIT | SUCCESS | Deleted product ID: {product_id}")
+            hot_logger.info("AUDIT | SUCCESS | Deleted product ID: {}", product_id)
             return True
             
         logger.warning(f"AUDIT | FAILED | Product {product_id} not found for deletion")
@@ -118,12 +186,12 @@ class ProductRepository(IProductRepository):
         """
         if product.id is None:
             # Create new
-            logger.debug(f"AUDIT | Creating new product: {product.sku}")
+            hot_logger.debug("AUDIT | Creating new product: {}", product.sku)
             model = self._to_model(product)
             self.session.add(model)
         else:
             # Update existing
-            logger.debug(f"AUDIT | Updating product ID: {product.id}")
+            hot_logger.debug("AUDIT | Updating product ID: {}", product.id)
             model = await self._get_model_by_id(product.id)
             if model is None:
                 raise ValueError(f"Product {product.id} not found for update")
@@ -135,21 +203,170 @@ class ProductRepository(IProductRepository):
         
         return self._to_entity(model)
     
-    async def update_stock(self, product_id: int, quantity_delta: int) -> None:
+    async def upsert_many(self, products: List[Product]) -> List[Tuple[int, bool]]:
+        """
+        Insert products, or update the existing rows with the same SKU, in one statement.
+        
+        `INSERT ... ON CONFLICT (sku) DO UPDATE` replaces the get_by_sku + save round
+        trips per product; SQLAlchemy batches the rows into multi-row VALUES.
+        SKUs must be unique within one call.
+        
+        Returns:
+            (product_id, created) for every row; created is False for updated products.
+        """
+        if not products:
+            return []
+        
+        hot_logger.debug("AUDIT | Upserting {} products", len(products))
+        
+        result = await self.session.execute(
+            self._upsert_statement(),
+            [self._to_row(product) for product in products],
+        )
+        return [(row.id, row.created) for row in result]
+    
+    async def copy_upsert_many(self, products: List[Product]) -> List[Tuple[int, bool]]:
+        """
+        Upsert products through a COPY into a temporary staging table (asyncpg only).
+        
+        COPY streams rows in the binary protocol without per-row parameters, then a
+        single `INSERT ... SELECT ... ON CONFLICT (sku) DO UPDATE` merges the staging
+        rows. Faster than upsert_many for very large imports. SKUs must be unique
+        within one call.
+        
+        Returns:
+            (product_id, created) for every row; created is False for updated products.
+        """
+        if not products:
+            return []
+        
+        hot_logger.debug("AUDIT | COPY-upserting {} products", len(products))
+        
+        connection = await self.session.connection()
+        # Same column types as products, no constraints; dropped when the transaction ends
+        await connection.execute(text(
+            f"CREATE TEMP TABLE IF NOT EXISTS {self.STAGING_TABLE} ON COMMIT DROP AS "
+            f"SELECT {', '.join(self.UPSERT_COLUMNS)} FROM {ProductModel.__tablename__} WITH NO DATA"
+        ))
+        await connection.execute(text(f"TRUNCATE {self.STAGING_TABLE}"))
+        
+        raw = await connection.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(
+            self.STAGING_TABLE,
+            records=[
+                (product.sku, product.name, product.description, Decimal(str(product.price)), product.stock_quantity)
+                for product in products
+            ],
+            columns=list(self.UPSERT_COLUMNS),
+        )
+        
+        columns = ", ".join(self.UPSERT_COLUMNS)
+        updates = ", ".join(f"{column} = EXCLUDED.{column}" for column in self.UPSERT_COLUMNS if column != "sku")
+        result = await connection.execute(text(
+            f"INSERT INTO {ProductModel.__tablename__} ({columns}) "
+            f"SELECT {columns} FROM {self.STAGING_TABLE} "
+            f"ON CONFLICT (sku) DO UPDATE SET {updates} "
+            f"RETURNING id, (xmax = 0) AS created"
+        ))
+        return [(row.id, row.created) for row in result]
+    
+    @classmethod
+    def _upsert_statement(cls):
+        """Build the ON CONFLICT (sku) upsert (PostgreSQL only)."""
+        stmt = pg_insert(ProductModel)
+        return stmt.on_conflict_do_update(
+            index_elements=[ProductModel.sku],
+            set_={column: stmt.excluded[column] for column in cls.UPSERT_COLUMNS if column != "sku"},
+        ).returning(
+            ProductModel.id,
+            # xmax is 0 only for a row version created by this INSERT
+            literal_column("xmax = 0").label("created"),
+        )
+    
+    def _to_row(self, entity: Product) -> dict:
+        """Convert domain entity to an insert parameter row."""
+        return {
+            "sku": entity.sku,
+            "name": entity.name,
+            "description": entity.description,
+            "price": float(entity.price),
+            "stock_quantity": entity.stock_quantity,
+        }
+    
+    async def update_stock(self, product_id: int, quantity_delta: int) -> int:
         """
         Update product stock quantity.
         
-        Atomically adjusts stock level in the database.
-        Fulfills 'Atomic Operations' and 'Query Encapsulation' responsibilities.
+        Adjusts the stock level in the database with one conditional UPDATE, so
+        concurrent adjustments cannot overwrite each other and stock never goes
+        negative. Fulfills 'Atomic Operations' and 'Query Encapsulation' responsibilities.
+        
+        Returns:
+            The new stock quantity.
+        
+        Raises:
+            ProductNotFoundError: If the product does not exist.
+            InsufficientStockError: If the adjustment would make stock negative.
         """
-        logger.debug(f"AUDIT | Updating stock | Product: {product_id} | Delta: {quantity_delta}")
+        hot_logger.debug("AUDIT | Updating stock | Product: {} | Delta: {}", product_id, quantity_delta)
         
-        model = await self._get_model_by_id(product_id)
-        if model is None:
-            raise ValueError(f"Product {product_id} not found")
+        new_quantity = ProductModel.stock_quantity + quantity_delta
+        stmt = (
+            update(ProductModel)
+            .where(ProductModel.id == product_id, new_quantity >= 0)
+            .values(stock_quantity=new_quantity)
+            .returning(ProductModel.stock_quantity)
+        )
+        stock = (await self.session.execute(stmt)).scalar_one_or_none()
+        if stock is not None:
+            return stock
         
-        model.stock_quantity += quantity_delta
-        await self.session.flush()
+        # Nothing matched: tell a missing product from a short one
+        available = await self.session.scalar(
+            select(ProductModel.stock_quantity).where(ProductModel.id == product_id)
+        )
+        if available is None:
+            raise ProductNotFoundError(product_id=product_id)
+        raise InsufficientStockError(product_id=product_id, requested=-quantity_delta, available=available)
+    
+    async def update_stock_many(self, quantity_deltas: Dict[int, int]) -> Dict[int, int]:
+        """
+        Apply stock adjustments to many products in one statement.
+        
+        `UPDATE ... FROM (VALUES (id, delta), ...)` with the same non-negative
+        guard as update_stock, per product: adjustments that would make stock
+        negative, and unknown product IDs, are left out rather than failing the batch.
+        
+        Args:
+            quantity_deltas: Stock delta per product ID.
+        
+        Returns:
+            New stock quantity per product ID that was adjusted.
+        """
+        if not quantity_deltas:
+            return {}
+        
+        hot_logger.debug("AUDIT | Updating stock of {} products", len(quantity_deltas))
+        
+        result = await self.session.execute(
+            self._update_stock_many_statement(quantity_deltas),
+            execution_options={"synchronize_session": "fetch"},
+        )
+        return {row.id: row.stock_quantity for row in result}
+    
+    @staticmethod
+    def _update_stock_many_statement(quantity_deltas: Dict[int, int]):
+        """Build the batched conditional stock UPDATE (PostgreSQL only)."""
+        deltas = values(
+            column("id", Integer), column("delta", Integer), name="deltas"
+        ).data(list(quantity_deltas.items()))
+        new_quantity = ProductModel.stock_quantity + deltas.c.delta
+        return (
+            update(ProductModel)
+            .where(ProductModel.id == deltas.c.id, new_quantity >= 0)
+            .values(stock_quantity=new_quantity)
+            .returning(ProductModel.id, ProductModel.stock_quantity)
+        )
     
     async def _get_model_by_id(self, product_id: int) -> Optional[ProductModel]:
         """Get ProductModel by ID."""
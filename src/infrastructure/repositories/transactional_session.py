@@ -0,0 +1,53 @@
+"""
+transactional_session.py
+
+AsyncSession with after-commit callbacks.
+Lets repositories and services defer side effects outside the database
+(confirming inventory holds, invalidating caches) until their writes are durable.
+"""
+
+from typing import Any, Awaitable, Callable, List
+from sqlalchemy.ext.asyncio import AsyncSession
+from loguru import logger
+
+AfterCommitCallback = Callable[[], Awaitable[None]]
+
+
+class TransactionalSession(AsyncSession):
+    """
+    Async session that runs registered callbacks once its transaction commits.
+
+    Callbacks registered with after_commit() run in order right after a
+    successful commit(). A rollback, a failed commit or closing the session
+    without committing drops them, so side effects never fire for writes that
+    did not happen.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._after_commit: List[AfterCommitCallback] = []
+
+    def after_commit(self, callback: AfterCommitCallback) -> None:
+        """Run callback after the current transaction commits."""
+        self._after_commit.append(callback)
+
+    async def commit(self) -> None:
+        """Commit, then run the after-commit callbacks (their errors are logged, not raised)."""
+        await super().commit()
+        callbacks, self._after_commit = self._after_commit, []
+        for callback in callbacks:
+            try:
+                await callback()
+            except Exception as e:
+                # The transaction is committed; failing the caller now would misreport it
+                logger.error(f"AUDIT | FAILED | After-commit callback error: {e}")
+
+    async def rollback(self) -> None:
+        """Roll back and drop the after-commit callbacks."""
+        self._after_commit.clear()
+        await super().rollback()
+
+    async def close(self) -> None:
+        """Close the session; callbacks of an uncommitted transaction are dropped."""
+        self._after_commit.clear()
+        await super().close()
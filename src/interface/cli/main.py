@@ -58,9 +58,16 @@ async def _check_rabbitmq(container) -> str:
 
 
 @app.command()
-def seed_data():
+def seed_data(
+    file: str = typer.Option(
+        os.path.join("seed", "products.json"),
+        help="Product file to import: JSON array, NDJSON (.ndjson/.jsonl) or CSV.",
+    ),
+    chunk_size: int = typer.Option(1000, min=1, help="Products upserted per statement."),
+    copy: bool = typer.Option(False, help="Load chunks with COPY through a staging table (faster for large catalogs)."),
+):
     """
-    Seed initial product data into the database.
+    Seed or bulk-import product data into the database.
     """
     from configs.logging_config import setup_logging
     setup_logging(settings)
@@ -72,16 +79,17 @@ def seed_data():
         try:
             async with container.session_factory() as session:
                 service = container.seed_service(session)
-                seed_file = os.path.join(os.getcwd(), "seed", "products.json")
-                result = await service.seed_products_from_json(seed_file)
-                return result
+                seed_file = os.path.join(os.getcwd(), file)
+                # Commits each chunk as it is written
+                return await service.import_products(seed_file, chunk_size=chunk_size, use_copy=copy)
         finally:
             await container.dispose()
             
     try:
         result = asyncio.run(run_seed())
         typer.secho(
-            f"✅ Seeding Successful: Created {result['created']}, Updated {result['updated']}",
+            f"✅ Seeding Successful: Created {result['created']}, Updated {result['updated']}, "
+            f"Skipped {result['skipped']} in {result['seconds']:.1f}s ({result['rate']:.0f} products/s)",
             fg=typer.colors.GREEN,
             bold=True
         )
@@ -91,6 +99,121 @@ def seed_data():
         logger.error(f"AUDIT | FAILED | COMMAND: seed-data | Error: {e}")
 
 
+@app.command()
+def warm_cache(
+    chunk_size: int = typer.Option(1000, help="Products loaded and written per round trip."),
+    overwrite: bool = typer.Option(
+        False,
+        help="Replace existing Redis counters with database stock net of open reservations and unflushed sales.",
+    ),
+):
+    """
+    Bulk-load product stock from the database into the Redis inventory cache.
+    Only products without a counter are loaded unless --overwrite is given.
+    Units held by open reservations or sold but not yet flushed are subtracted.
+    """
+    from configs.logging_config import setup_logging
+    setup_logging(settings)
+    
+    logger.info("AUDIT | START | COMMAND: warm-cache")
+    
+    async def run_warm_up():
+        container = get_container()
+        warmed = 0
+        last_id = 0
+        try:
+            async with container.session_factory() as session:
+                repo = container.product_repository(session)
+                while True:
+                    chunk = await repo.get_stock_levels(after_id=last_id, limit=chunk_size)
+                    if not chunk:
+                        break
+                    # Re-read net of in-flight units; the chunk itself only pages product IDs
+                    stocks = await container.inventory_write_behind.available_stocks(
+                        [product_id for product_id, _ in chunk]
+                    )
+                    await container.inventory_cache.warm_up(stocks, overwrite=overwrite)
+                    warmed += len(chunk)
+                    last_id = chunk[-1][0]
+                    logger.debug(f"AUDIT | warm-cache | {warmed} products loaded")
+            return warmed
+        finally:
+            await container.dispose()
+    
+    try:
+        warmed = asyncio.run(run_warm_up())
+        typer.secho(f"✅ Cache Warm-up Successful: {warmed} products", fg=typer.colors.GREEN, bold=True)
+        logger.info(f"AUDIT | SUCCESS | COMMAND: warm-cache | Products: {warmed}")
+    except Exception as e:
+        typer.secho(f"❌ Cache Warm-up Failed: {e}", fg=typer.colors.RED, bold=True)
+        logger.error(f"AUDIT | FAILED | COMMAND: warm-cache | Error: {e}")
+
+
+@app.command()
+def inventory_drift(
+    chunk_size: int = typer.Option(1000, help="Products compared per round trip."),
+    show: int = typer.Option(20, help="Maximum number of drifting products listed."),
+):
+    """
+    Compare product stock in PostgreSQL with the Redis inventory counters.
+    """
+    from configs.logging_config import setup_logging
+    setup_logging(settings)
+    
+    logger.info("AUDIT | START | COMMAND: inventory-drift")
+    
+    async def run_report():
+        container = get_container()
+        write_behind = container.inventory_write_behind
+        compared = uncached = 0
+        drifting = []
+        last_id = 0
+        try:
+            async with container.session_factory() as session:
+                repo = container.product_repository(session)
+                while True:
+                    chunk = await repo.get_stock_levels(after_id=last_id, limit=chunk_size)
+                    if not chunk:
+                        break
+                    # Units held or not yet written behind explain part of the difference
+                    in_flight = await write_behind.in_flight_quantities(
+                        [product_id for product_id, _ in chunk]
+                    )
+                    for entry in await write_behind.compare(dict(chunk), in_flight):
+                        if entry.redis is None:
+                            uncached += 1
+                        elif entry.drift:
+                            drifting.append(entry)
+                    compared += len(chunk)
+                    last_id = chunk[-1][0]
+            return compared, uncached, drifting
+        finally:
+            await container.dispose()
+    
+    try:
+        compared, uncached, drifting = asyncio.run(run_report())
+        
+        typer.secho(
+            f"\n🔍 Inventory drift: {len(drifting)} of {compared} products "
+            f"({uncached} not cached in Redis)",
+            fg=typer.colors.CYAN,
+        )
+        if drifting:
+            typer.echo(f"  {'PRODUCT':>10} {'DATABASE':>10} {'REDIS':>10} {'IN FLIGHT':>10} {'DRIFT':>10}")
+            for entry in sorted(drifting, key=lambda e: abs(e.drift), reverse=True)[:show]:
+                typer.echo(
+                    f"  {entry.product_id:>10} {entry.database:>10} {entry.redis:>10} "
+                    f"{entry.in_flight:>10} {entry.drift:>+10}"
+                )
+            logger.warning(f"AUDIT | WARNING | COMMAND: inventory-drift | {len(drifting)} products drifting")
+        else:
+            typer.secho("✅ Redis and PostgreSQL agree", fg=typer.colors.GREEN, bold=True)
+            logger.info(f"AUDIT | SUCCESS | COMMAND: inventory-drift | {compared} products compared")
+    except Exception as e:
+        typer.secho(f"❌ Drift report failed: {e}", fg=typer.colors.RED, bold=True)
+        logger.error(f"AUDIT | FAILED | COMMAND: inventory-drift | Error: {e}")
+
+
 @app.command()
 def check_status():
     """
@@ -5,34 +5,127 @@ FastAPI routes for Order Management System.
 Connects external HTTP requests to internal application services.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from typing import List
+import csv
+import hashlib
+import io
+from datetime import datetime
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
+from typing import AsyncIterator, Optional
 from loguru import logger
 
-from src.interface.schemas import PlaceOrderRequest, OrderResponse
-from src.application.dtos import PlaceOrderRequestDTO, OrderItemDTO
-from src.application.service import PlaceOrderService
-from src.domain.exceptions import (
-    ProductNotFoundError,
-    InsufficientStockError,
-    OrderValidationError,
+from src.interface.schemas import (
+    PlaceOrderRequest,
+    OrderResponse,
+    BatchPlaceOrderRequest,
+    BatchOrderResult,
+    BatchPlaceOrderResponse,
+    OrderPageResponse,
+    ExportFormat,
+)
+from src.application.dtos import PlaceOrderRequestDTO, OrderItemDTO, OrderResponseDTO
+from src.application.service import PlaceOrderService, OrderQueryService
+from src.domain.entities import OrderStatus
+from src.constants import PAGE_SIZE_DEFAULT, PAGE_SIZE_MAX
+from src.dependencies import (
+    get_session,
+    get_place_order_service,
+    get_order_query_service,
+    get_auth_payload,
+    get_idempotency_store,
+    require_permission,
 )
-from src.dependencies import get_place_order_service, get_auth_payload
 
 router = APIRouter(prefix="/orders", tags=["Orders"])
 
 
+def _to_dto(request: PlaceOrderRequest) -> PlaceOrderRequestDTO:
+    """Map interface schema to application DTO."""
+    return PlaceOrderRequestDTO(
+        customer_id=request.customer_id,
+        items=[
+            OrderItemDTO(product_id=item.product_id, quantity=item.quantity)
+            for item in request.items
+        ]
+    )
+
+
+def _json_response(body: str, replayed: bool) -> Response:
+    """Wrap a serialized OrderResponse as the 201 response of place_order."""
+    return Response(
+        content=body,
+        status_code=status.HTTP_201_CREATED,
+        media_type="application/json",
+        headers={"Idempotent-Replayed": "true" if replayed else "false"},
+    )
+
+
+CSV_COLUMNS = [
+    "order_id", "customer_id", "status", "created_at", "updated_at",
+    "total_amount", "total_items",
+    "product_id", "product_sku", "product_name", "quantity", "unit_price", "subtotal",
+]
+
+
+async def _ndjson_lines(orders: AsyncIterator[OrderResponseDTO]) -> AsyncIterator[str]:
+    """Serialize each order as one JSON line, in the same shape as GET /orders/{id}."""
+    async for order in orders:
+        yield OrderResponse.model_validate(order).model_dump_json() + "\n"
+
+
+async def _csv_lines(orders: AsyncIterator[OrderResponseDTO]) -> AsyncIterator[str]:
+    """Serialize orders as CSV, one row per item."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    def drain() -> str:
+        chunk = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return chunk
+
+    writer.writerow(CSV_COLUMNS)
+    yield drain()
+
+    async for order in orders:
+        head = [
+            order.id, order.customer_id, order.status,
+            order.created_at.isoformat(), order.updated_at.isoformat(),
+            order.total_amount, order.total_items,
+        ]
+        for item in order.items or [None]:
+            tail = (
+                [item.product_id, item.product_sku, item.product_name,
+                 item.quantity, item.unit_price, item.subtotal]
+                if item is not None else [""] * 6
+            )
+            writer.writerow(head + tail)
+        yield drain()
+
+
 @router.post(
     "",
     response_model=OrderResponse,
     status_code=status.HTTP_201_CREATED,
     summary="Place a new order",
-    description="Creates a new order, reserves inventory in Redis, and persists to PostgreSQL.",
+    description=(
+        "Creates a new order, reserves inventory in Redis, and persists to PostgreSQL. "
+        "With an Idempotency-Key header, retries of the same request return the first "
+        "response (marked Idempotent-Replayed) without placing another order."
+    ),
 )
 async def place_order(
     request: PlaceOrderRequest,
+    idempotency_key: Optional[str] = Header(
+        None,
+        alias="Idempotency-Key",
+        max_length=255,
+        description="Client-chosen key that makes retries of this request safe",
+    ),
     current_user: dict = Depends(get_auth_payload),
+    session=Depends(get_session),
     service: PlaceOrderService = Depends(get_place_order_service),
+    idempotency_store=Depends(get_idempotency_store),
 ):
     """
     Endpoint to place a new order.
@@ -41,15 +134,169 @@ async def place_order(
     Leverages global exception handlers for domain-specific errors.
     """
     # Map interface schema to application DTO
-    dto = PlaceOrderRequestDTO(
-        customer_id=request.customer_id,
-        items=[
-            OrderItemDTO(product_id=item.product_id, quantity=item.quantity)
-            for item in request.items
-        ]
-    )
+    dto = _to_dto(request)
     
-    # Execute use case
-    result = await service.execute(dto)
+    if idempotency_key is None:
+        # Execute use case; commit before responding so the hold is confirmed
+        # (after commit) and a failed commit is reported to the client
+        result = await service.execute(dto)
+        await session.commit()
+        return result
+
+    # Keys are scoped to the caller, so clients cannot replay each other's orders
+    scope = f"orders:{current_user.get('sub')}"
+    fingerprint = hashlib.sha256(request.model_dump_json().encode()).hexdigest()
+
+    stored = await idempotency_store.begin(scope, idempotency_key, fingerprint)
+    if stored is not None:
+        return _json_response(stored, replayed=True)
+
+    try:
+        result = await service.execute(dto)
+        # Commit before recording the response: a replay must never refer to an
+        # order that was rolled back
+        await session.commit()
+    except BaseException:
+        await idempotency_store.release(scope, idempotency_key, fingerprint)
+        raise
+
+    body = OrderResponse.model_validate(result).model_dump_json()
+    try:
+        await idempotency_store.complete(scope, idempotency_key, fingerprint, body)
+    except Exception as e:
+        # The order is committed: report it. Retries wait on the in-flight marker
+        # until it expires, then may place the order again
+        logger.warning(
+            f"AUDIT | FAILED | Recording idempotent response for order {result.id}: {e}"
+        )
+    return _json_response(body, replayed=False)
+
+
+@router.post(
+    ":batch",
+    response_model=BatchPlaceOrderResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Place many orders",
+    description=(
+        "Places up to 500 orders in one call with shared product lookup, inventory "
+        "reservation and bulk inserts. Each order succeeds or fails on its own."
+    ),
+)
+async def place_orders_batch(
+    request: BatchPlaceOrderRequest,
+    current_user: dict = Depends(get_auth_payload),
+    session=Depends(get_session),
+    service: PlaceOrderService = Depends(get_place_order_service),
+):
+    """
+    Endpoint to place a batch of orders (B2B bulk submission).
+    
+    Business failures are reported per order; a system failure fails the
+    whole batch through the global exception handlers.
+    """
+    results = await service.execute_many([_to_dto(order) for order in request.orders])
+    # Commit before responding so the holds are confirmed (after commit) and a
+    # failed commit is reported to the client
+    await session.commit()
     
-    return result
+    succeeded = sum(result.succeeded for result in results)
+    return BatchPlaceOrderResponse(
+        results=[
+            BatchOrderResult(
+                index=result.index,
+                success=result.succeeded,
+                order=result.order,
+                error=result.error,
+            )
+            for result in results
+        ],
+        succeeded=succeeded,
+        failed=len(results) - succeeded,
+    )
+
+
+@router.get(
+    "",
+    response_model=OrderPageResponse,
+    summary="List a customer's orders",
+    description="Returns the customer's orders newest first, paginated with an opaque cursor.",
+)
+async def list_orders(
+    customer_id: int = Query(..., gt=0, description="The ID of the customer"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    limit: int = Query(PAGE_SIZE_DEFAULT, ge=1, le=PAGE_SIZE_MAX, description="Orders per page"),
+    current_user: dict = Depends(get_auth_payload),
+    service: OrderQueryService = Depends(get_order_query_service),
+):
+    """Endpoint to page through a customer's order history."""
+    return await service.list_customer_orders(customer_id, limit=limit, cursor=cursor)
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    summary="Export orders",
+    description=(
+        "Streams every matching order with its items as NDJSON (one order per line) "
+        "or CSV (one row per item). The response is produced while the database is "
+        "read, so exports of any size use constant memory. Requires the "
+        "orders:export permission."
+    ),
+    responses={
+        200: {"content": {"application/x-ndjson": {}, "text/csv": {}}},
+        403: {"description": "Caller lacks the orders:export permission"},
+    },
+)
+async def export_orders(
+    format: ExportFormat = Query(ExportFormat.NDJSON, description="ndjson or csv"),
+    order_status: Optional[OrderStatus] = Query(None, alias="status", description="Only orders in this status"),
+    created_from: Optional[datetime] = Query(None, description="Only orders created at or after this time"),
+    created_to: Optional[datetime] = Query(None, description="Only orders created before this time"),
+    current_user: dict = Depends(require_permission("orders:export")),
+    service: OrderQueryService = Depends(get_order_query_service),
+):
+    """
+    Endpoint to export order history for reporting.
+    
+    Exports span every customer, so they are limited to callers granted
+    orders:export. The session from get_session stays open until the stream
+    is finished.
+    """
+    if created_from and created_to and created_from >= created_to:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="created_from must be earlier than created_to",
+        )
+
+    logger.info(f"AUDIT | Order export requested by {current_user.get('sub')} | Format: {format.value}")
+
+    orders = service.export_orders(
+        status=order_status.value if order_status else None,
+        created_from=created_from,
+        created_to=created_to,
+    )
+    if format == ExportFormat.CSV:
+        body, media_type = _csv_lines(orders), "text/csv"
+    else:
+        body, media_type = _ndjson_lines(orders), "application/x-ndjson"
+
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="orders.{format.value}"'},
+    )
+
+
+@router.get(
+    "/{order_id}",
+    response_model=OrderResponse,
+    summary="Get an order",
+    description="Returns one order with its items (e.g. for order status polling).",
+)
+async def get_order(
+    order_id: int,
+    current_user: dict = Depends(get_auth_payload),
+    service: OrderQueryService = Depends(get_order_query_service),
+):
+    """Endpoint to fetch a single order by ID."""
+    return await service.get_order(order_id)
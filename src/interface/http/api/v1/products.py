@@ -0,0 +1,39 @@
+"""
+products.py
+
+FastAPI routes for the product catalog.
+Connects external HTTP requests to internal application services.
+"""
+
+from fastapi import APIRouter, Depends, Query
+from typing import Optional
+
+from src.interface.schemas import ProductPageResponse
+from src.application.service import ProductQueryService
+from src.constants import PAGE_SIZE_DEFAULT, PAGE_SIZE_MAX
+from src.dependencies import get_product_query_service, get_auth_payload
+
+router = APIRouter(prefix="/products", tags=["Products"])
+
+
+@router.get(
+    "",
+    response_model=ProductPageResponse,
+    summary="List or search products",
+    description=(
+        "Lists the catalog by ID, or with `search` returns products whose names are "
+        "similar to or contain the term, best matches first. Paginated with an opaque cursor."
+    ),
+)
+async def list_products(
+    search: Optional[str] = Query(
+        None, min_length=3, max_length=100,
+        description="Name search term (at least 3 characters, the trigram size)",
+    ),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    limit: int = Query(PAGE_SIZE_DEFAULT, ge=1, le=PAGE_SIZE_MAX, description="Products per page"),
+    current_user: dict = Depends(get_auth_payload),
+    service: ProductQueryService = Depends(get_product_query_service),
+):
+    """Endpoint to browse and search the product catalog."""
+    return await service.list_products(search=search, limit=limit, cursor=cursor)
@@ -11,8 +11,12 @@ from loguru import logger
 
 from src.domain.exceptions import (
     ProductNotFoundError,
+    OrderNotFoundError,
     InsufficientStockError,
     OrderValidationError,
+    InvalidCursorError,
+    IdempotencyKeyInUseError,
+    IdempotencyKeyMismatchError,
     DomainException,
 )
 
@@ -40,12 +44,24 @@ async def domain_exception_handler(request: Request, exc: DomainException):
     if isinstance(exc, ProductNotFoundError):
         status_code = status.HTTP_404_NOT_FOUND
         error_type = "product_not_found"
+    elif isinstance(exc, OrderNotFoundError):
+        status_code = status.HTTP_404_NOT_FOUND
+        error_type = "order_not_found"
     elif isinstance(exc, InsufficientStockError):
         status_code = status.HTTP_400_BAD_REQUEST
         error_type = "insufficient_stock"
     elif isinstance(exc, OrderValidationError):
         status_code = status.HTTP_422_UNPROCESSABLE_ENTITY
         error_type = "order_validation_error"
+    elif isinstance(exc, InvalidCursorError):
+        status_code = status.HTTP_400_BAD_REQUEST
+        error_type = "invalid_cursor"
+    elif isinstance(exc, IdempotencyKeyInUseError):
+        status_code = status.HTTP_409_CONFLICT
+        error_type = "idempotency_key_in_use"
+    elif isinstance(exc, IdempotencyKeyMismatchError):
+        status_code = status.HTTP_422_UNPROCESSABLE_ENTITY
+        error_type = "idempotency_key_mismatch"
     else:
         status_code = status.HTTP_400_BAD_REQUEST
         error_type = "domain_error"
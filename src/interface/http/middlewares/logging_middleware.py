@@ -6,27 +6,29 @@ Provides observability into API traffic.
 """
 
 import time
-from fastapi import Request
+from typing import Any
+from urllib.parse import parse_qsl
 from loguru import logger
-from starlette.middleware.base import BaseHTTPMiddleware
+from configs.logging_config import hot_logger
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 
-import time
-import json
-from typing import Any, Dict
-from fastapi import Request
-from loguru import logger
-from starlette.middleware.base import BaseHTTPMiddleware
-
-
-class LoggingMiddleware(BaseHTTPMiddleware):
+class LoggingMiddleware:
     """
     Middleware for logging HTTP requests and responses.
     Features PII masking for sensitive data.
+
+    Implemented as plain ASGI rather than BaseHTTPMiddleware: messages pass
+    straight through to the server, with no extra task or memory stream per
+    request, so streamed responses keep their backpressure. Query parameters are
+    only parsed and masked, and log lines only formatted, when INFO logging is enabled.
     """
-    
+
     SENSITIVE_FIELDS = {"email", "customer_id", "credit_card", "password", "token"}
 
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
     def _mask_pii(self, data: Any) -> Any:
         """
         Recursively mask PII in dictionary or list.
@@ -40,29 +42,45 @@ class LoggingMiddleware(BaseHTTPMiddleware):
             return [self._mask_pii(item) for item in data]
         return data
 
-    async def dispatch(self, request: Request, call_next):
+    def _masked_query(self, scope: Scope) -> Any:
+        """Query parameters of the request with sensitive values masked."""
+        query = dict(parse_qsl(scope.get("query_string", b"").decode("latin-1"), keep_blank_values=True))
+        return self._mask_pii(query)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Intercepts the request/response cycle to log vital traffic information.
         """
-        start_time = time.time()
-        
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter()
+
         # Capture basic info
-        method = request.method
-        path = request.url.path
-        query_params = dict(request.query_params)
-        
-        # Mask sensitive query params
-        masked_query = self._mask_pii(query_params)
-        
-        logger.info(f"HTTP | REQUEST | {method} {path} | Params: {masked_query}")
-        
-        response = await call_next(request)
-        
-        process_time = (time.time() - start_time) * 1000
-        
-        logger.info(
-            f"HTTP | RESPONSE | {method} {path} | Status: {response.status_code} | "
-            f"Duration: {process_time:.2f}ms"
+        method = scope["method"]
+        path = scope["path"]
+
+        # Masking runs only if the record is emitted
+        logger.opt(lazy=True).info(
+            "HTTP | REQUEST | {} {} | Params: {}",
+            lambda: method, lambda: path, lambda: self._masked_query(scope),
         )
-        
-        return response
+
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            process_time = (time.perf_counter() - start_time) * 1000
+            # Formatted only if INFO is enabled
+            hot_logger.info(
+                "HTTP | RESPONSE | {} {} | Status: {} | Duration: {:.2f}ms",
+                method, path, status_code, process_time,
+            )
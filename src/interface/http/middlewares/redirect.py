@@ -1,30 +1,42 @@
 """
 redirect.py
 
-FastAPI middleware to enforce HTTPS by redirecting HTTP requests.
+ASGI middleware to enforce HTTPS by redirecting HTTP requests.
 """
 
-from fastapi import Request
-from fastapi.responses import RedirectResponse
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.datastructures import Headers, URL
+from starlette.responses import RedirectResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
 from loguru import logger
 
 
-class HTTPSRedirectMiddleware(BaseHTTPMiddleware):
+class HTTPSRedirectMiddleware:
     """
     Middleware to redirect all HTTP requests to HTTPS.
+
+    Plain ASGI: requests that are already secure are passed on untouched.
     """
 
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint):
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Check request scheme and redirect if it's HTTP.
         """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         # In production environments (behind proxy), check X-Forwarded-Proto
-        x_forwarded_proto = request.headers.get("x-forwarded-proto")
-        
-        if request.url.scheme == "http" or x_forwarded_proto == "http":
-            url = request.url.replace(scheme="https")
-            logger.info(f"AUDIT | HTTP | REDIRECT | {request.url} -> {url}")
-            return RedirectResponse(url, status_code=301)
-            
-        return await call_next(request)
+        x_forwarded_proto = Headers(scope=scope).get("x-forwarded-proto")
+
+        if scope.get("scheme") == "http" or x_forwarded_proto == "http":
+            request_url = URL(scope=scope)
+            url = request_url.replace(scheme="https")
+            logger.info(f"AUDIT | HTTP | REDIRECT | {request_url} -> {url}")
+            response = RedirectResponse(url, status_code=301)
+            await response(scope, receive, send)
+            return
+
+        await self.app(scope, receive, send)
@@ -5,16 +5,46 @@ Protocols for infrastructure services (Caching, Messaging).
 These interfaces define the contracts for technical services used by the application.
 """
 
-from typing import Protocol
+from typing import Dict, List, Optional, Protocol, Sequence
 
 
 class IInventoryCache(Protocol):
     """Protocol for inventory caching service."""
     
-    async def check_and_reserve_stock(
-        self, product_id: int, quantity: int
-    ) -> bool:
-        """Check stock availability and reserve if available."""
+    async def reserve_many(
+        self, items: Sequence[tuple[int, int]], reservation_id: Optional[str] = None
+    ) -> Optional[int]:
+        """Reserve all (product_id, quantity) pairs atomically; return the failing product ID, if any."""
+        ...
+    
+    async def reserve_batch(
+        self, orders: Sequence[tuple[str, Sequence[tuple[int, int]]]]
+    ) -> List[Optional[int]]:
+        """Reserve (reservation_id, items) orders independently; return each order's failing product ID."""
+        ...
+    
+    async def renew_reservation(self, reservation_id: str) -> bool:
+        """Extend a reservation hold's deadline; False if it is no longer held."""
+        ...
+    
+    async def confirm_reservation(self, reservation_id: str) -> bool:
+        """Confirm a reservation hold so it does not expire."""
+        ...
+    
+    async def renew_reservations(self, reservation_ids: Sequence[str]) -> List[bool]:
+        """Extend several holds' deadlines; False for each one no longer held."""
+        ...
+    
+    async def confirm_reservations(self, reservation_ids: Sequence[str]) -> List[bool]:
+        """Confirm several reservation holds at once; False for each one no longer held."""
+        ...
+    
+    async def cancel_reservation(self, reservation_id: str) -> bool:
+        """Cancel a reservation hold and release its stock."""
+        ...
+    
+    async def cancel_reservations(self, reservation_ids: Sequence[str]) -> int:
+        """Cancel several reservation holds and release their stock."""
         ...
     
     async def release_stock(self, product_id: int, quantity: int) -> None:
@@ -33,10 +63,14 @@ class IEventPublisher(Protocol):
 class IAuthProvider(Protocol):
     """Protocol for authentication provider."""
     
-    async def verify_token(self, token: str) -> dict:
-        """Verify a JWT token and return the payload."""
+    async def verify_token(self, token: str) -> Optional[dict]:
+        """Verify a JWT token and return the payload, or None if it is invalid."""
         ...
 
     async def authorize(self, token: str, required_permission: str) -> bool:
         """Check if a user has a specific permission via central Auth Service."""
         ...
+
+    async def authorize_many(self, token: str, permissions: Sequence[str]) -> Dict[str, bool]:
+        """Check several permissions at once; return the decision per permission."""
+        ...
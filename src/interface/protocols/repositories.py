@@ -5,8 +5,10 @@ Abstract repository interfaces for the application.
 These interfaces define the data access contracts that the application expects.
 """
 
-from typing import Protocol, List, Optional
+from datetime import datetime
+from typing import AsyncIterator, Dict, Protocol, List, Optional, Tuple
 from src.domain.entities import Order, Product
+from src.application.dtos import OrderResponseDTO
 
 
 class IProductRepository(Protocol):
@@ -24,13 +26,21 @@ class IProductRepository(Protocol):
         """Get multiple products by IDs."""
         ...
     
-    async def list_products(
-        self, 
-        skip: int = 0, 
-        limit: int = 10, 
-        search: Optional[str] = None
-    ) -> List[Product]:
-        """List products with pagination and search."""
+    async def get_stock_levels(self, after_id: int = 0, limit: int = 1000) -> List[tuple[int, int]]:
+        """Get a keyset page of (product_id, stock_quantity) pairs."""
+        ...
+    
+    async def list_products(self, limit: int = 10, after_id: int = 0) -> List[Product]:
+        """List products ordered by ID, one keyset page at a time."""
+        ...
+    
+    async def search_products(
+        self,
+        term: str,
+        limit: int = 10,
+        after: Optional[Tuple[float, int]] = None,
+    ) -> List[Tuple[Product, float]]:
+        """Search products by name; (product, rank) pairs, best first, after a (rank, id) position."""
         ...
     
     async def save(self, product: Product) -> Product:
@@ -41,8 +51,20 @@ class IProductRepository(Protocol):
         """Delete product by ID."""
         ...
     
-    async def update_stock(self, product_id: int, quantity_delta: int) -> None:
-        """Update product stock quantity."""
+    async def upsert_many(self, products: List[Product]) -> List[Tuple[int, bool]]:
+        """Insert or update products by SKU; returns (product_id, created) pairs."""
+        ...
+    
+    async def copy_upsert_many(self, products: List[Product]) -> List[Tuple[int, bool]]:
+        """Like upsert_many, loading the rows with COPY through a staging table."""
+        ...
+    
+    async def update_stock(self, product_id: int, quantity_delta: int) -> int:
+        """Atomically adjust stock (never below zero); returns the new quantity."""
+        ...
+    
+    async def update_stock_many(self, quantity_deltas: Dict[int, int]) -> Dict[int, int]:
+        """Atomically adjust the stock of many products; returns the new quantity of each adjusted one."""
         ...
 
 
@@ -53,19 +75,14 @@ class IOrderRepository(Protocol):
         """Get order by ID."""
         ...
     
-    async def get_by_customer_id(
-        self, 
-        customer_id: int, 
-        skip: int = 0, 
-        limit: int = 10
-    ) -> List[Order]:
-        """Get paged orders for a customer."""
-        ...
-    
     async def save(self, order: Order) -> Order:
         """Save order (create or update)."""
         ...
     
+    async def save_many(self, orders: List[Order]) -> List[Order]:
+        """Create several new orders in bulk."""
+        ...
+    
     async def delete(self, order_id: int) -> bool:
         """Delete order by ID."""
         ...
@@ -73,3 +90,30 @@ class IOrderRepository(Protocol):
     async def update_status(self, order_id: int, status: str) -> None:
         """Update order status."""
         ...
+
+
+class IOrderReadRepository(Protocol):
+    """Protocol for read-only order projections (query side)."""
+    
+    async def get_by_id(self, order_id: int) -> Optional[OrderResponseDTO]:
+        """Get the response projection of an order."""
+        ...
+    
+    async def get_by_customer_id(
+        self,
+        customer_id: int,
+        limit: int = 10,
+        after: Optional[Tuple[datetime, int]] = None,
+    ) -> List[OrderResponseDTO]:
+        """Get a page of a customer's order projections, newest first, after a (created_at, id) position."""
+        ...
+    
+    def stream_orders(
+        self,
+        status: Optional[str] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[OrderResponseDTO]:
+        """Stream matching order projections in ID order without loading the whole result."""
+        ...
@@ -7,6 +7,7 @@ Defines the external contract for the Order Management System.
 
 from datetime import datetime
 from decimal import Decimal
+from enum import Enum
 from typing import List, Optional
 from pydantic import BaseModel, Field, ConfigDict
 
@@ -53,6 +54,43 @@ class OrderResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class OrderPageResponse(BaseModel):
+    """Schema for one page of orders."""
+    
+    items: List[OrderResponse]
+    next_cursor: Optional[str] = Field(None, description="Pass as `cursor` to fetch the next page; null on the last page")
+
+
+class ExportFormat(str, Enum):
+    """Wire formats of the order export."""
+    
+    NDJSON = "ndjson"  # One OrderResponse JSON object per line
+    CSV = "csv"  # One row per order item, order columns repeated
+
+
+class BatchPlaceOrderRequest(BaseModel):
+    """Schema for placing many orders in one request."""
+    
+    orders: List[PlaceOrderRequest] = Field(..., min_length=1, max_length=500, description="Orders to place")
+
+
+class BatchOrderResult(BaseModel):
+    """Schema for the outcome of one order in a batch."""
+    
+    index: int = Field(..., description="Position of the order in the request")
+    success: bool
+    order: Optional[OrderResponse] = None
+    error: Optional[str] = None
+
+
+class BatchPlaceOrderResponse(BaseModel):
+    """Schema for batch order placement response."""
+    
+    results: List[BatchOrderResult]
+    succeeded: int
+    failed: int
+
+
 class ProductResponse(BaseModel):
     """Schema for product response."""
     
@@ -66,6 +104,13 @@ class ProductResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class ProductPageResponse(BaseModel):
+    """Schema for one page of products."""
+    
+    items: List[ProductResponse]
+    next_cursor: Optional[str] = Field(None, description="Pass as `cursor` to fetch the next page; null on the last page")
+
+
 class ErrorDetail(BaseModel):
     """Schema for error details."""
     
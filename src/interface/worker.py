@@ -3,31 +3,180 @@ worker.py
 
 Background worker for processing asynchronous tasks.
 Consumes events from RabbitMQ and triggers downstream actions (e.g., sending emails).
+Also relays the event outbox to RabbitMQ (purging sent events after a retention
+period) and runs periodic inventory maintenance
+(expired hold reaping, stock write-behind to PostgreSQL).
 """
 
 import asyncio
+import signal
+from typing import Any, Dict
 from loguru import logger
+from src.constants import EventTypes
 from src.container import get_container
+from src.infrastructure.messaging.rabbitmq_consumer import RabbitMQConsumer
+from src.infrastructure.messaging.outbox_relay import OutboxRelay
+from configs.service_config import settings
+
+
+async def handle_order_placed(payload: Dict[str, Any]) -> None:
+    """Send the order confirmation notification."""
+    logger.info(
+        f"AUDIT | NOTIFY | Order {payload['order_id']} confirmation for customer "
+        f"{payload['customer_id']} (total {payload['total_amount']})"
+    )
+
+
+async def handle_order_failed(payload: Dict[str, Any]) -> None:
+    """Notify the customer that their order could not be placed."""
+    logger.info(
+        f"AUDIT | NOTIFY | Order failure for customer {payload['customer_id']}: {payload['reason']}"
+    )
 
 
 async def process_messages():
     """
-    Skeleton logic for background message processing.
-    In a real system, this would listen to RabbitMQ queues for order events.
+    Consume order events from RabbitMQ and dispatch them to their handlers.
+    Retries connecting until the broker is reachable, runs until cancelled,
+    then drains in-flight messages before disconnecting.
     """
     logger.info("AUDIT | START | Background worker starting...")
     
-    # Example logic for consuming events
+    consumer = RabbitMQConsumer(
+        settings.RABBITMQ_URL,
+        queue_name=settings.WORKER_QUEUE_NAME,
+        prefetch_count=settings.RABBITMQ_PREFETCH_COUNT,
+        concurrency=settings.WORKER_CONCURRENCY,
+        ack_batch_size=settings.WORKER_ACK_BATCH_SIZE,
+        ack_interval=settings.WORKER_ACK_INTERVAL,
+        retry_delays=settings.WORKER_RETRY_DELAYS,
+    )
+    consumer.register(EventTypes.ORDER_PLACED, handle_order_placed)
+    consumer.register(EventTypes.ORDER_FAILED, handle_order_failed)
+    
+    while True:
+        try:
+            await consumer.start()
+            break
+        except Exception as e:
+            logger.error(f"AUDIT | FAILED | Consumer start error: {e}")
+            await asyncio.sleep(settings.WORKER_START_RETRY_INTERVAL)
+    
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await consumer.stop()
+
+
+async def reap_expired_reservations():
+    """
+    Periodically return the stock of reservation holds that were never confirmed
+    (e.g. the API process died between reserving and saving the order).
+    """
+    inventory_cache = get_container().inventory_cache
+    batch_size = settings.INVENTORY_REAPER_BATCH_SIZE
+    
+    logger.info("AUDIT | START | Reservation reaper starting...")
+    
+    while True:
+        try:
+            # Drain full batches back to back, then wait for the next interval
+            while await inventory_cache.reap_expired_reservations(batch_size) == batch_size:
+                pass
+        except Exception as e:
+            logger.error(f"AUDIT | FAILED | Reservation reaper error: {e}")
+        await asyncio.sleep(settings.INVENTORY_REAPER_INTERVAL)
+
+
+async def relay_outbox():
+    """
+    Publish events written to the outbox by request handlers.
+    Full batches are relayed back to back; otherwise, or when publishing fails,
+    wait for the next poll. The broker connection is (re)opened inside the loop,
+    so a broker outage delays events instead of stopping the worker.
+    """
+    container = get_container()
+    publisher = container.event_publisher
+    relay = OutboxRelay(container.session_factory, publisher)
+    batch_size = settings.OUTBOX_BATCH_SIZE
+    
+    logger.info("AUDIT | START | Outbox relay starting...")
+    
     while True:
         try:
-            # Here you would listen to RabbitMQ
-            # await consume_events()
-            await asyncio.sleep(60)
-            logger.debug("AUDIT | HEARTBEAT | Worker is alive")
+            if not publisher.is_connected:
+                await publisher.connect()
+            while await relay.relay_batch(batch_size) == batch_size:
+                pass
         except Exception as e:
-            logger.error(f"AUDIT | FAILED | Worker processing error: {e}")
-            await asyncio.sleep(5)
+            logger.error(f"AUDIT | FAILED | Outbox relay error: {e}")
+        await asyncio.sleep(settings.OUTBOX_POLL_INTERVAL)
+
+
+async def purge_outbox():
+    """
+    Periodically delete outbox events sent more than OUTBOX_RETENTION seconds ago,
+    so the table only grows with unsent events and the retention window.
+    """
+    container = get_container()
+    relay = OutboxRelay(container.session_factory, container.event_publisher)
+    batch_size = settings.OUTBOX_BATCH_SIZE * 10
+    
+    logger.info("AUDIT | START | Outbox purge starting...")
+    
+    while True:
+        try:
+            while await relay.purge_sent(settings.OUTBOX_RETENTION, batch_size) == batch_size:
+                pass
+        except Exception as e:
+            logger.error(f"AUDIT | FAILED | Outbox purge error: {e}")
+        await asyncio.sleep(settings.OUTBOX_PURGE_INTERVAL)
+
+
+async def sync_inventory():
+    """
+    Write stock sold in Redis behind to PostgreSQL.
+    Full batches are applied back to back; otherwise wait for the next interval.
+    """
+    if not settings.INVENTORY_SYNC_ENABLED:
+        return
+    
+    container = get_container()
+    write_behind = container.inventory_write_behind
+    batch_size = settings.INVENTORY_SYNC_BATCH_SIZE
+    
+    logger.info("AUDIT | START | Inventory write-behind starting...")
+    
+    while True:
+        try:
+            while await write_behind.flush(batch_size) == batch_size:
+                pass
+        except Exception as e:
+            logger.error(f"AUDIT | FAILED | Inventory write-behind error: {e}")
+        await asyncio.sleep(settings.INVENTORY_SYNC_INTERVAL)
+
+
+async def main():
+    """Run all background tasks concurrently until SIGINT/SIGTERM, then shut down gracefully."""
+    tasks = asyncio.gather(
+        process_messages(),
+        relay_outbox(),
+        purge_outbox(),
+        reap_expired_reservations(),
+        sync_inventory(),
+    )
+    
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, tasks.cancel)
+    
+    try:
+        await tasks
+    except asyncio.CancelledError:
+        logger.info("AUDIT | SHUTDOWN | Background worker stopped")
+    finally:
+        await get_container().dispose()
 
 
 if __name__ == "__main__":
-    asyncio.run(process_messages())
+    asyncio.run(main())
@@ -5,6 +5,7 @@ Main entry point for the FastAPI application.
 Configures middleware, routes, and startup/shutdown lifecycle events.
 """
 
+import asyncio
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -13,7 +14,7 @@ from loguru import logger
 from configs.service_config import settings
 from configs.logging_config import setup_logging
 from src.container import get_container
-from src.interface.http.api.v1 import orders
+from src.interface.http.api.v1 import orders, products
 
 
 @asynccontextmanager
@@ -36,10 +37,18 @@ async def lifespan(app: FastAPI):
         except Exception as e:
             logger.error(f"SYSTEM | FAILED | RabbitMQ connection: {e}")
         
-        yield
+        # 3. Keep the in-process product cache coherent across replicas
+        invalidation_listener = asyncio.create_task(
+            container.product_cache.listen_for_invalidations()
+        )
+        
+        try:
+            yield
+        finally:
+            invalidation_listener.cancel()
         
     finally:
-        # 3. Defensive Cleanup (Execution guaranteed on Ctrl+C)
+        # 4. Defensive Cleanup (Execution guaranteed on Ctrl+C)
         logger.info(f"SYSTEM | SHUTDOWN | {settings.PROJECT_NAME} stopping...")
         try:
             # Centralized disposal of DB, Redis, Messaging, and Logger
@@ -84,6 +93,7 @@ def create_app() -> FastAPI:
     
     # Register API Routes
     app.include_router(orders.router, prefix="/api/v1")
+    app.include_router(products.router, prefix="/api/v1")
     
     @app.get("/health", tags=["Health"])
     async def health_check():
@@ -10,13 +10,15 @@ import pytest
 import pytest_asyncio
 from httpx import AsyncClient
 from decimal import Decimal
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlalchemy.pool import StaticPool
 
 from src.main import app
 from src.dependencies import get_session, get_place_order_service, get_auth_payload
 from src.infrastructure.models.product_model import Base as ProductBase, ProductModel
 from src.infrastructure.models.order_model import Base as OrderBase
+from src.infrastructure.models.outbox_model import Base as OutboxBase
+from src.infrastructure.repositories import TransactionalSession
 from src.container import get_container
 
 
@@ -31,8 +33,9 @@ async def test_db_session():
     async with engine.begin() as conn:
         await conn.run_sync(ProductBase.metadata.create_all)
         await conn.run_sync(OrderBase.metadata.create_all)
+        await conn.run_sync(OutboxBase.metadata.create_all)
     
-    Session = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+    Session = async_sessionmaker(engine, expire_on_commit=False, class_=TransactionalSession)
     async with Session() as session:
         yield session
     await engine.dispose()
@@ -47,7 +50,7 @@ async def async_client(test_db_session):
     # Mock infrastructure in the container
     container = get_container()
     container.inventory_cache = AsyncMock()
-    container.inventory_cache.check_and_reserve_stock.return_value = True
+    container.inventory_cache.reserve_many.return_value = None
     container.event_publisher = AsyncMock()
     
     from httpx import ASGITransport
@@ -111,3 +114,15 @@ async def test_successful_order_placement_flow(async_client, test_db_session):
     assert order_in_db.customer_id == 1
     assert len(order_in_db.items) == 1
     assert order_in_db.items[0].product_sku == "PROD-123"
+
+    # 5. OrderPlaced was written to the outbox in the same transaction
+    from src.infrastructure.models.outbox_model import OutboxModel
+    
+    outbox_rows = (await test_db_session.execute(select(OutboxModel))).scalars().all()
+    assert len(outbox_rows) == 1
+    assert outbox_rows[0].event_type == "order.placed"
+    assert outbox_rows[0].sent_at is None
+
+    # 6. The reservation hold was confirmed once the order was committed
+    reservation_id = get_container().inventory_cache.reserve_many.call_args.kwargs["reservation_id"]
+    get_container().inventory_cache.confirm_reservation.assert_awaited_once_with(reservation_id)
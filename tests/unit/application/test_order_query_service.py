@@ -0,0 +1,98 @@
+"""
+test_order_query_service.py
+
+Unit tests for OrderQueryService.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from decimal import Decimal
+from datetime import datetime
+
+from src.application.service.order_query_service import OrderQueryService
+from src.constants import EXPORT_BATCH_SIZE
+from src.application.dtos import OrderResponseDTO
+from src.domain.exceptions import OrderNotFoundError, InvalidCursorError
+
+
+def make_order(order_id, created_at):
+    return OrderResponseDTO(
+        id=order_id,
+        customer_id=1,
+        items=[],
+        total_amount=Decimal("0"),
+        total_items=0,
+        status="pending",
+        created_at=created_at,
+        updated_at=created_at,
+    )
+
+
+@pytest.fixture
+def mock_order_repo():
+    return AsyncMock()
+
+
+@pytest.fixture
+def query_service(mock_order_repo):
+    return OrderQueryService(order_read_repository=mock_order_repo)
+
+
+@pytest.mark.asyncio
+class TestOrderQueryService:
+    """Tests for order lookups and cursor-paginated order listing."""
+
+    async def test_get_order(self, query_service, mock_order_repo):
+        order = make_order(5, datetime(2026, 1, 1))
+        mock_order_repo.get_by_id.return_value = order
+
+        assert await query_service.get_order(5) is order
+
+    async def test_get_order_not_found(self, query_service, mock_order_repo):
+        mock_order_repo.get_by_id.return_value = None
+
+        with pytest.raises(OrderNotFoundError):
+            await query_service.get_order(5)
+
+    async def test_first_page_has_next_cursor(self, query_service, mock_order_repo):
+        orders = [make_order(order_id, datetime(2026, 1, order_id)) for order_id in (3, 2, 1)]
+        mock_order_repo.get_by_customer_id.return_value = orders
+
+        page = await query_service.list_customer_orders(1, limit=2)
+
+        mock_order_repo.get_by_customer_id.assert_called_once_with(1, limit=3, after=None)
+        assert [order.id for order in page.items] == [3, 2]
+        assert page.next_cursor is not None
+
+        # The cursor points at the last order of the page
+        await query_service.list_customer_orders(1, limit=2, cursor=page.next_cursor)
+        assert mock_order_repo.get_by_customer_id.call_args.kwargs["after"] == (datetime(2026, 1, 2), 2)
+
+    async def test_last_page_has_no_cursor(self, query_service, mock_order_repo):
+        mock_order_repo.get_by_customer_id.return_value = [make_order(1, datetime(2026, 1, 1))]
+
+        page = await query_service.list_customer_orders(1, limit=2)
+
+        assert page.next_cursor is None
+
+    async def test_invalid_cursor(self, query_service):
+        with pytest.raises(InvalidCursorError, match="Invalid pagination cursor"):
+            await query_service.list_customer_orders(1, cursor="not-a-cursor")
+
+    async def test_export_streams_from_repository(self, query_service, mock_order_repo):
+        orders = [make_order(1, datetime(2026, 1, 1)), make_order(2, datetime(2026, 1, 2))]
+
+        async def stream(**filters):
+            for order in orders:
+                yield order
+
+        mock_order_repo.stream_orders = MagicMock(side_effect=stream)
+
+        exported = [
+            order async for order in query_service.export_orders(status="pending", created_from=datetime(2026, 1, 1))
+        ]
+
+        assert [order.id for order in exported] == [1, 2]
+        mock_order_repo.stream_orders.assert_called_once_with(
+            status="pending", created_from=datetime(2026, 1, 1), created_to=None, batch_size=EXPORT_BATCH_SIZE
+        )
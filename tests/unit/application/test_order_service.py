@@ -5,16 +5,17 @@ Unit tests for PlaceOrderService.
 """
 
 import pytest
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import ANY, AsyncMock, MagicMock
 from decimal import Decimal
 from datetime import datetime, timezone
 
 from src.application.service.order_service import PlaceOrderService
 from src.application.dtos import PlaceOrderRequestDTO, OrderItemDTO
-from src.domain.entities import Product, Order, OrderStatus
+from src.domain.entities import Product, Order, OrderItem, OrderStatus
 from src.domain.exceptions import (
     ProductNotFoundError,
     InsufficientStockError,
+    OrderValidationError,
 )
 
 
@@ -39,15 +40,37 @@ def mock_event_publisher():
 
 
 @pytest.fixture
-def order_service(mock_product_repo, mock_order_repo, mock_inventory_cache, mock_event_publisher):
+def after_commit():
+    """After-commit callbacks registered by the service; run_commit() fires them."""
+    return []
+
+
+async def run_commit(callbacks):
+    """Simulate a successful commit of the request's session."""
+    for callback in callbacks:
+        await callback()
+    callbacks.clear()
+
+
+@pytest.fixture
+def order_service(mock_product_repo, mock_order_repo, mock_inventory_cache, mock_event_publisher, after_commit):
     return PlaceOrderService(
         product_repository=mock_product_repo,
         order_repository=mock_order_repo,
         inventory_cache=mock_inventory_cache,
         event_publisher=mock_event_publisher,
+        after_commit=after_commit.append,
     )
 
 
+@pytest.fixture
+def saved_order():
+    return Order(id=123, customer_id=1, items=[
+        OrderItem(product_id=1, product_sku="SKU-001", product_name="Test Product",
+                  quantity=2, unit_price=Decimal("100.00")),
+    ])
+
+
 @pytest.fixture
 def sample_product():
     return Product(
@@ -66,7 +89,7 @@ class TestPlaceOrderService:
 
     async def test_execute_success(
         self, order_service, mock_product_repo, mock_order_repo, 
-        mock_inventory_cache, mock_event_publisher, sample_product
+        mock_inventory_cache, mock_event_publisher, sample_product, after_commit
     ):
         """Should successfully place an order when all conditions are met."""
         # Arrange
@@ -76,7 +99,7 @@ class TestPlaceOrderService:
         )
         
         mock_product_repo.get_many_by_ids.return_value = [sample_product]
-        mock_inventory_cache.check_and_reserve_stock.return_value = True
+        mock_inventory_cache.reserve_many.return_value = None
         
         # Mock saved order
         saved_order = MagicMock(spec=Order)
@@ -98,9 +121,16 @@ class TestPlaceOrderService:
         assert response.id == 123
         assert response.status == "pending"
         mock_product_repo.get_many_by_ids.assert_called_once_with([1])
-        mock_inventory_cache.check_and_reserve_stock.assert_called_once_with(product_id=1, quantity=2)
+        mock_inventory_cache.reserve_many.assert_called_once_with([(1, 2)], reservation_id=ANY)
         mock_order_repo.save.assert_called_once()
+        reservation_id = mock_inventory_cache.reserve_many.call_args.kwargs["reservation_id"]
+        mock_inventory_cache.renew_reservation.assert_called_once_with(reservation_id)
         mock_event_publisher.publish.assert_called()
+        
+        # The hold is only confirmed once the transaction commits
+        mock_inventory_cache.confirm_reservation.assert_not_called()
+        await run_commit(after_commit)
+        mock_inventory_cache.confirm_reservation.assert_called_once_with(reservation_id)
 
     async def test_raise_product_not_found(self, order_service, mock_product_repo):
         """Should raise ProductNotFoundError if a product does not exist."""
@@ -123,14 +153,14 @@ class TestPlaceOrderService:
             items=[OrderItemDTO(product_id=1, quantity=100)]
         )
         mock_product_repo.get_many_by_ids.return_value = [sample_product]
-        mock_inventory_cache.check_and_reserve_stock.return_value = False
+        mock_inventory_cache.reserve_many.return_value = 1
 
         # Act & Assert
         with pytest.raises(InsufficientStockError):
             await order_service.execute(request)
         
-        # Verify rollback wasn't called because first reservation failed
-        mock_inventory_cache.release_stock.assert_not_called()
+        # Verify rollback wasn't called because the reservation is all-or-nothing
+        mock_inventory_cache.cancel_reservation.assert_not_called()
 
     async def test_rollback_on_persistence_failure(
         self, order_service, mock_product_repo, mock_inventory_cache, 
@@ -143,12 +173,229 @@ class TestPlaceOrderService:
             items=[OrderItemDTO(product_id=1, quantity=2)]
         )
         mock_product_repo.get_many_by_ids.return_value = [sample_product]
-        mock_inventory_cache.check_and_reserve_stock.return_value = True
+        mock_inventory_cache.reserve_many.return_value = None
         mock_order_repo.save.side_effect = Exception("DB Error")
 
         # Act & Assert
         with pytest.raises(Exception, match="DB Error"):
             await order_service.execute(request)
         
-        # Verify rollback
-        mock_inventory_cache.release_stock.assert_called_once_with(1, 2)
+        # Verify rollback cancels the hold that was reserved
+        reservation_id = mock_inventory_cache.reserve_many.call_args.kwargs["reservation_id"]
+        mock_inventory_cache.cancel_reservation.assert_called_once_with(reservation_id)
+        mock_inventory_cache.confirm_reservation.assert_not_called()
+
+    async def test_order_failed_uses_failure_publisher(
+        self, mock_product_repo, mock_order_repo, mock_inventory_cache,
+        mock_event_publisher, sample_product
+    ):
+        """Should publish OrderFailed through the failure publisher, not the transactional one."""
+        # Arrange
+        failure_publisher = AsyncMock()
+        service = PlaceOrderService(
+            product_repository=mock_product_repo,
+            order_repository=mock_order_repo,
+            inventory_cache=mock_inventory_cache,
+            event_publisher=mock_event_publisher,
+            after_commit=[].append,
+            failure_event_publisher=failure_publisher,
+        )
+        request = PlaceOrderRequestDTO(
+            customer_id=1,
+            items=[OrderItemDTO(product_id=1, quantity=2)]
+        )
+        mock_product_repo.get_many_by_ids.return_value = [sample_product]
+        mock_inventory_cache.reserve_many.return_value = None
+        mock_order_repo.save.side_effect = Exception("DB Error")
+
+        # Act
+        with pytest.raises(Exception, match="DB Error"):
+            await service.execute(request)
+
+        # Assert
+        failure_publisher.publish.assert_called_once()
+        assert failure_publisher.publish.call_args.args[0].to_dict()["event_type"] == "order.failed"
+        mock_event_publisher.publish.assert_not_called()
+
+
+    async def test_expired_hold_is_reserved_again_before_commit(
+        self, order_service, mock_product_repo, mock_order_repo,
+        mock_inventory_cache, sample_product, saved_order, after_commit
+    ):
+        """A hold reaped before commit should be replaced by a new one."""
+        request = PlaceOrderRequestDTO(customer_id=1, items=[OrderItemDTO(product_id=1, quantity=2)])
+        mock_product_repo.get_many_by_ids.return_value = [sample_product]
+        mock_inventory_cache.reserve_many.return_value = None
+        mock_inventory_cache.renew_reservation.return_value = False
+        mock_order_repo.save.return_value = saved_order
+
+        await order_service.execute(request)
+        await run_commit(after_commit)
+
+        first, second = [c.kwargs["reservation_id"] for c in mock_inventory_cache.reserve_many.call_args_list]
+        assert first != second
+        mock_inventory_cache.confirm_reservation.assert_called_once_with(second)
+
+    async def test_expired_hold_without_stock_fails_before_commit(
+        self, order_service, mock_product_repo, mock_order_repo,
+        mock_inventory_cache, sample_product, saved_order, after_commit
+    ):
+        """If the stock of a reaped hold was sold meanwhile, the order must not be committed."""
+        request = PlaceOrderRequestDTO(customer_id=1, items=[OrderItemDTO(product_id=1, quantity=2)])
+        mock_product_repo.get_many_by_ids.return_value = [sample_product]
+        mock_inventory_cache.reserve_many.side_effect = [None, 1]
+        mock_inventory_cache.renew_reservation.return_value = False
+        mock_order_repo.save.return_value = saved_order
+
+        with pytest.raises(InsufficientStockError):
+            await order_service.execute(request)
+        assert after_commit == []
+
+    async def test_hold_lost_during_commit_is_reserved_again(
+        self, order_service, mock_product_repo, mock_order_repo,
+        mock_inventory_cache, sample_product, saved_order, after_commit
+    ):
+        """A hold reaped while the commit ran should be taken again and confirmed."""
+        request = PlaceOrderRequestDTO(customer_id=1, items=[OrderItemDTO(product_id=1, quantity=2)])
+        mock_product_repo.get_many_by_ids.return_value = [sample_product]
+        mock_inventory_cache.reserve_many.return_value = None
+        mock_inventory_cache.confirm_reservation.side_effect = [False, True]
+        mock_order_repo.save.return_value = saved_order
+
+        await order_service.execute(request)
+        await run_commit(after_commit)
+
+        assert mock_inventory_cache.reserve_many.call_count == 2
+        assert mock_inventory_cache.reserve_many.call_args.args[0] == [(1, 2)]
+        new_hold = mock_inventory_cache.reserve_many.call_args.kwargs["reservation_id"]
+        mock_inventory_cache.confirm_reservation.assert_called_with(new_hold)
+
+
+@pytest.mark.asyncio
+class TestPlaceOrderServiceBatch:
+    """Tests for PlaceOrderService.execute_many."""
+
+    async def test_execute_many_partial_failure(
+        self, order_service, mock_product_repo, mock_order_repo,
+        mock_inventory_cache, mock_event_publisher, sample_product, after_commit
+    ):
+        """Business failures should be reported per order while the rest are placed."""
+        # Arrange
+        requests = [
+            PlaceOrderRequestDTO(customer_id=1, items=[OrderItemDTO(product_id=1, quantity=2)]),
+            PlaceOrderRequestDTO(customer_id=2, items=[OrderItemDTO(product_id=999, quantity=1)]),
+            PlaceOrderRequestDTO(customer_id=3, items=[OrderItemDTO(product_id=1, quantity=50)]),
+        ]
+        mock_product_repo.get_many_by_ids.return_value = [sample_product]
+        mock_inventory_cache.reserve_batch.return_value = [None, 1]
+        mock_inventory_cache.renew_reservations.return_value = [True]
+        mock_inventory_cache.confirm_reservations.return_value = [True]
+        mock_order_repo.save_many.side_effect = lambda orders: [
+            Order(id=100 + i, customer_id=o.customer_id, items=o.items) for i, o in enumerate(orders)
+        ]
+
+        # Act
+        results = await order_service.execute_many(requests)
+        mock_inventory_cache.confirm_reservations.assert_not_called()
+        await run_commit(after_commit)
+
+        # Assert
+        mock_product_repo.get_many_by_ids.assert_called_once_with([1, 999])
+        assert [r.succeeded for r in results] == [True, False, False]
+        assert results[0].order.id == 100
+        assert "not found" in results[1].error
+        assert "Insufficient stock" in results[2].error
+        
+        batch = mock_inventory_cache.reserve_batch.call_args.args[0]
+        assert [items for _, items in batch] == [[(1, 2)], [(1, 50)]]
+        mock_inventory_cache.renew_reservations.assert_called_once_with([batch[0][0]])
+        mock_inventory_cache.confirm_reservations.assert_called_once_with([batch[0][0]])
+        assert len(mock_order_repo.save_many.call_args.args[0]) == 1
+        mock_event_publisher.publish.assert_called_once()
+
+    async def test_execute_many_system_error_cancels_all(
+        self, order_service, mock_product_repo, mock_order_repo,
+        mock_inventory_cache, sample_product
+    ):
+        """A persistence failure should cancel every hold and fail the batch."""
+        requests = [
+            PlaceOrderRequestDTO(customer_id=c, items=[OrderItemDTO(product_id=1, quantity=1)])
+            for c in (1, 2)
+        ]
+        mock_product_repo.get_many_by_ids.return_value = [sample_product]
+        mock_inventory_cache.reserve_batch.return_value = [None, None]
+        mock_order_repo.save_many.side_effect = Exception("DB Error")
+
+        with pytest.raises(OrderValidationError, match="DB Error"):
+            await order_service.execute_many(requests)
+
+        batch = mock_inventory_cache.reserve_batch.call_args.args[0]
+        mock_inventory_cache.cancel_reservations.assert_called_once_with([rid for rid, _ in batch])
+
+    async def test_execute_many_reserves_expired_holds_again_before_commit(
+        self, order_service, mock_product_repo, mock_order_repo,
+        mock_inventory_cache, sample_product, after_commit
+    ):
+        requests = [
+            PlaceOrderRequestDTO(customer_id=c, items=[OrderItemDTO(product_id=1, quantity=1)])
+            for c in (1, 2)
+        ]
+        mock_product_repo.get_many_by_ids.return_value = [sample_product]
+        mock_inventory_cache.reserve_batch.side_effect = [[None, None], [None]]
+        mock_inventory_cache.renew_reservations.return_value = [True, False]
+        mock_inventory_cache.confirm_reservations.return_value = [True, True]
+        mock_order_repo.save_many.side_effect = lambda orders: [
+            Order(id=100 + i, customer_id=o.customer_id, items=o.items) for i, o in enumerate(orders)
+        ]
+
+        results = await order_service.execute_many(requests)
+        await run_commit(after_commit)
+
+        assert all(r.succeeded for r in results)
+        first, second = [call.args[0] for call in mock_inventory_cache.reserve_batch.call_args_list]
+        assert second == [(ANY, [(1, 1)])]
+        # The order whose hold was reaped is confirmed under its new hold
+        mock_inventory_cache.confirm_reservations.assert_called_once_with([first[0][0], second[0][0]])
+
+    async def test_execute_many_fails_when_expired_stock_is_gone(
+        self, order_service, mock_product_repo, mock_order_repo,
+        mock_inventory_cache, sample_product, after_commit
+    ):
+        requests = [PlaceOrderRequestDTO(customer_id=1, items=[OrderItemDTO(product_id=1, quantity=1)])]
+        mock_product_repo.get_many_by_ids.return_value = [sample_product]
+        mock_inventory_cache.reserve_batch.side_effect = [[None], [1]]
+        mock_inventory_cache.renew_reservations.return_value = [False]
+        mock_order_repo.save_many.side_effect = lambda orders: [
+            Order(id=100, customer_id=o.customer_id, items=o.items) for o in orders
+        ]
+
+        with pytest.raises(OrderValidationError, match="Insufficient stock"):
+            await order_service.execute_many(requests)
+
+        assert after_commit == []
+        mock_inventory_cache.cancel_reservations.assert_called_once()
+
+    async def test_execute_many_reserves_again_when_confirm_fails_after_commit(
+        self, order_service, mock_product_repo, mock_order_repo,
+        mock_inventory_cache, sample_product, after_commit
+    ):
+        requests = [
+            PlaceOrderRequestDTO(customer_id=c, items=[OrderItemDTO(product_id=1, quantity=1)])
+            for c in (1, 2)
+        ]
+        mock_product_repo.get_many_by_ids.return_value = [sample_product]
+        mock_inventory_cache.reserve_batch.return_value = [None, None]
+        mock_inventory_cache.renew_reservations.return_value = [True, True]
+        mock_inventory_cache.confirm_reservations.return_value = [True, False]
+        mock_inventory_cache.reserve_many.return_value = None
+        mock_inventory_cache.confirm_reservation.return_value = True
+        mock_order_repo.save_many.side_effect = lambda orders: [
+            Order(id=100 + i, customer_id=o.customer_id, items=o.items) for i, o in enumerate(orders)
+        ]
+
+        await order_service.execute_many(requests)
+        await run_commit(after_commit)
+
+        # Only the order whose hold was lost takes its stock again
+        mock_inventory_cache.reserve_many.assert_called_once_with([(1, 1)], reservation_id=ANY)
+        mock_inventory_cache.confirm_reservation.assert_called_once()
@@ -0,0 +1,75 @@
+"""
+test_product_query_service.py
+
+Unit tests for ProductQueryService.
+"""
+
+import pytest
+from unittest.mock import AsyncMock
+from decimal import Decimal
+
+from src.application.service.product_query_service import ProductQueryService
+from src.application.service.pagination import encode_cursor
+from src.domain.entities import Product
+from src.domain.exceptions import InvalidCursorError
+
+
+def make_product(product_id):
+    return Product(
+        id=product_id,
+        sku=f"SKU-{product_id}",
+        name=f"Product {product_id}",
+        description="",
+        price=Decimal("10.00"),
+        stock_quantity=5,
+    )
+
+
+@pytest.fixture
+def mock_product_repo():
+    return AsyncMock()
+
+
+@pytest.fixture
+def query_service(mock_product_repo):
+    return ProductQueryService(product_repository=mock_product_repo)
+
+
+@pytest.mark.asyncio
+class TestProductQueryService:
+    """Tests for catalog listing and ranked search."""
+
+    async def test_list_pages_by_id(self, query_service, mock_product_repo):
+        mock_product_repo.list_products.return_value = [make_product(i) for i in (1, 2, 3)]
+
+        page = await query_service.list_products(limit=2)
+
+        mock_product_repo.list_products.assert_called_once_with(limit=3, after_id=0)
+        assert [p.id for p in page.items] == [1, 2]
+
+        await query_service.list_products(limit=2, cursor=page.next_cursor)
+        assert mock_product_repo.list_products.call_args.kwargs["after_id"] == 2
+
+    async def test_search_pages_by_rank(self, query_service, mock_product_repo):
+        mock_product_repo.search_products.return_value = [
+            (make_product(7), 0.9), (make_product(3), 0.4), (make_product(5), 0.4),
+        ]
+
+        page = await query_service.list_products(search="widget", limit=2)
+
+        mock_product_repo.search_products.assert_called_once_with("widget", limit=3, after=None)
+        assert [p.id for p in page.items] == [7, 3]
+
+        await query_service.list_products(search="widget", limit=2, cursor=page.next_cursor)
+        assert mock_product_repo.search_products.call_args.kwargs["after"] == (0.4, 3)
+
+    async def test_last_search_page_has_no_cursor(self, query_service, mock_product_repo):
+        mock_product_repo.search_products.return_value = [(make_product(7), 0.9)]
+
+        page = await query_service.list_products(search="widget", limit=2)
+
+        assert page.next_cursor is None
+
+    async def test_list_cursor_rejected_for_search(self, query_service):
+        with pytest.raises(InvalidCursorError):
+            await query_service.list_products(search="widget", cursor=encode_cursor([2]))
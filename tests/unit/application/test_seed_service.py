@@ -0,0 +1,131 @@
+"""
+test_seed_service.py
+
+Unit tests for SeedService bulk product imports.
+"""
+
+import io
+import json
+import pytest
+from unittest.mock import AsyncMock
+from decimal import Decimal
+
+from src.application.service.seed_service import SeedService, _iter_json_array
+
+
+def upsert_result(products):
+    # Pretend SKUs ending in "1" already existed
+    return [(index, not product.sku.endswith("1")) for index, product in enumerate(products)]
+
+
+@pytest.fixture
+def mock_product_repo():
+    repo = AsyncMock()
+    repo.upsert_many.side_effect = upsert_result
+    repo.copy_upsert_many.side_effect = upsert_result
+    return repo
+
+
+@pytest.fixture
+def mock_commit():
+    return AsyncMock()
+
+
+@pytest.fixture
+def seed_service(mock_product_repo, mock_commit):
+    return SeedService(product_repository=mock_product_repo, commit=mock_commit)
+
+
+def product_record(i, **overrides):
+    record = {"sku": f"SKU-{i}", "name": f"Product {i}", "description": "", "price": 9.99, "stock_quantity": i}
+    record.update(overrides)
+    return record
+
+
+@pytest.mark.asyncio
+class TestSeedService:
+    """Tests for streaming, chunked product imports."""
+
+    async def test_json_import_upserts_in_chunks(self, seed_service, mock_product_repo, mock_commit, tmp_path):
+        path = tmp_path / "products.json"
+        path.write_text(json.dumps([product_record(i) for i in range(5)], indent=2))
+
+        result = await seed_service.import_products(str(path), chunk_size=2)
+
+        chunks = [call.args[0] for call in mock_product_repo.upsert_many.call_args_list]
+        assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+        # One transaction per chunk
+        assert mock_commit.await_count == 3
+        assert chunks[0][0].price == Decimal("9.99")
+        assert result["created"] == 4
+        assert result["updated"] == 1
+        assert result["skipped"] == 0
+
+    async def test_duplicate_sku_in_chunk_keeps_last(self, seed_service, mock_product_repo, tmp_path):
+        path = tmp_path / "products.ndjson"
+        path.write_text(
+            "\n".join(json.dumps(record) for record in (product_record(1), product_record(1, name="Renamed")))
+        )
+
+        await seed_service.import_products(str(path))
+
+        (chunk,) = mock_product_repo.upsert_many.call_args.args
+        assert [product.name for product in chunk] == ["Renamed"]
+
+    async def test_csv_import_skips_invalid_records(self, seed_service, mock_product_repo, tmp_path):
+        path = tmp_path / "products.csv"
+        path.write_text(
+            "sku,name,description,price,stock_quantity\n"
+            "SKU-1,Widget,\"Blue, large\",4.50,3\n"
+            "SKU-2,Bolt,,-1,5\n"
+            "SKU-3,Nut,,abc,5\n"
+        )
+
+        result = await seed_service.import_products(str(path))
+
+        (chunk,) = mock_product_repo.upsert_many.call_args.args
+        assert [(p.sku, p.description, p.price, p.stock_quantity) for p in chunk] == [
+            ("SKU-1", "Blue, large", Decimal("4.50"), 3)
+        ]
+        assert result["skipped"] == 2
+
+    async def test_copy_import(self, seed_service, mock_product_repo, tmp_path):
+        path = tmp_path / "products.json"
+        path.write_text(json.dumps([product_record(2)]))
+
+        result = await seed_service.import_products(str(path), use_copy=True)
+
+        mock_product_repo.copy_upsert_many.assert_awaited_once()
+        mock_product_repo.upsert_many.assert_not_called()
+        assert result["created"] == 1
+
+    async def test_unsupported_format(self, seed_service, tmp_path):
+        path = tmp_path / "products.xml"
+        path.write_text("<products/>")
+
+        with pytest.raises(ValueError, match="Unsupported seed file format"):
+            await seed_service.import_products(str(path))
+
+    async def test_missing_file(self, seed_service):
+        with pytest.raises(FileNotFoundError):
+            await seed_service.import_products("/nonexistent/products.json")
+
+
+class TestJsonArrayReader:
+    """Tests for the incremental JSON array reader."""
+
+    def test_reads_elements_across_blocks(self):
+        records = [product_record(i) for i in range(20)]
+        
+        assert list(_iter_json_array(io.StringIO(json.dumps(records)), read_size=7)) == records
+
+    def test_malformed_element_fails_without_reading_to_eof(self):
+        # A broken first element followed by a large (valid) remainder
+        text = '[{"sku": "SKU-1", "price": oops}, ' + ", ".join(
+            json.dumps(product_record(i)) for i in range(1000)
+        ) + "]"
+        file = io.StringIO(text)
+        
+        with pytest.raises(ValueError, match="Malformed JSON array element"):
+            list(_iter_json_array(file, read_size=64, max_element_size=256))
+        assert file.tell() < len(text) // 10
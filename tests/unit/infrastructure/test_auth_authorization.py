@@ -0,0 +1,224 @@
+"""
+test_auth_authorization.py
+
+Unit tests for remote authorization in AuthProvider (pooling, decision cache, coalescing).
+"""
+
+import asyncio
+import json
+import time
+import httpx
+import pytest
+from jose import jwt
+
+from src.infrastructure.clients.auth_provider import AuthProvider
+
+SECRET = "test-secret"
+
+
+def make_token(sub="user-1"):
+    return jwt.encode(
+        {"sub": sub, "aud": "authenticated", "exp": int(time.time()) + 3600}, SECRET, algorithm="HS256"
+    )
+
+
+class FakeAuthService:
+    """Auth Service stand-in that counts calls and grants listed permissions."""
+
+    def __init__(self, granted=("orders:write",), status_code=200, delay=0.0):
+        self.granted = set(granted)
+        self.status_code = status_code
+        self.delay = delay
+        self.calls = 0
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        body = json.loads(request.content)
+        assert request.headers["X-Internal-API-Key"] == "key"
+        return httpx.Response(
+            self.status_code, json={"is_authorized": body["required_permission"] in self.granted}
+        )
+
+
+def make_provider(service, **kwargs):
+    client = httpx.AsyncClient(transport=httpx.MockTransport(service))
+    return AuthProvider("http://auth", "key", SECRET, http_client=client, **kwargs)
+
+
+@pytest.mark.asyncio
+class TestAuthProviderAuthorize:
+    """Tests for cached and coalesced authorization checks."""
+
+    async def test_decisions_are_cached_per_token_and_permission(self):
+        service = FakeAuthService()
+        provider = make_provider(service)
+        token = make_token()
+
+        assert await provider.authorize(token, "orders:write") is True
+        assert await provider.authorize(token, "orders:write") is True
+        assert await provider.authorize(token, "orders:admin") is False
+        assert await provider.authorize(token, "orders:admin") is False
+
+        assert service.calls == 2
+
+    async def test_decisions_are_not_shared_between_tokens_of_a_subject(self):
+        service = FakeAuthService()
+        provider = make_provider(service)
+        first, second = make_token(), jwt.encode(
+            {"sub": "user-1", "aud": "authenticated", "exp": int(time.time()) + 7200}, SECRET, algorithm="HS256"
+        )
+
+        await provider.authorize(first, "orders:write")
+        await provider.authorize(second, "orders:write")
+
+        assert service.calls == 2
+        assert first not in str(list(provider._decisions))
+
+    async def test_concurrent_checks_share_one_call(self):
+        service = FakeAuthService(delay=0.01)
+        provider = make_provider(service)
+        token = make_token()
+
+        results = await asyncio.gather(*(provider.authorize(token, "orders:write") for _ in range(10)))
+
+        assert results == [True] * 10
+        assert service.calls == 1
+        assert not provider._decisions_in_flight
+
+    async def test_expired_decision_is_refetched(self):
+        service = FakeAuthService()
+        provider = make_provider(service, decision_cache_ttl=0.01)
+        token = make_token()
+
+        await provider.authorize(token, "orders:write")
+        await asyncio.sleep(0.02)
+        await provider.authorize(token, "orders:write")
+
+        assert service.calls == 2
+
+    async def test_errors_deny_and_are_not_cached(self):
+        service = FakeAuthService(status_code=503)
+        provider = make_provider(service)
+        token = make_token()
+
+        assert await provider.authorize(token, "orders:write") is False
+        assert await provider.authorize(token, "orders:write") is False
+        assert service.calls == 2
+
+    async def test_unverifiable_token_is_checked_remotely_without_caching(self):
+        service = FakeAuthService()
+        provider = make_provider(service)
+        token = jwt.encode({"sub": "u1", "aud": "authenticated"}, "other-secret", algorithm="HS256")
+
+        await provider.authorize(token, "orders:write")
+        await provider.authorize(token, "orders:write")
+
+        assert service.calls == 2
+        assert not provider._decisions
+
+
+class LocalAuthServer:
+    """
+    Minimal HTTP/1.1 keep-alive server standing in for the Auth Service.
+    Answers every authorize call after a fixed latency.
+    """
+
+    def __init__(self, latency: float, granted=("orders:read", "orders:write")):
+        self.latency = latency
+        self.granted = set(granted)
+        self.calls = 0
+        self.server = None
+
+    async def start(self) -> str:
+        self.server = await asyncio.start_server(self._serve, "127.0.0.1", 0)
+        host, port = self.server.sockets[0].getsockname()[:2]
+        return f"http://{host}:{port}"
+
+    async def stop(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while head := await reader.readuntil(b"\r\n\r\n"):
+                length = next(
+                    int(line.split(b":", 1)[1])
+                    for line in head.split(b"\r\n")
+                    if line.lower().startswith(b"content-length:")
+                )
+                body = json.loads(await reader.readexactly(length))
+                self.calls += 1
+                await asyncio.sleep(self.latency)
+                reply = json.dumps({"is_authorized": body["required_permission"] in self.granted}).encode()
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                    + f"Content-Length: {len(reply)}\r\n\r\n".encode()
+                    + reply
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+@pytest.mark.asyncio
+class TestAuthProviderAuthorizeMany:
+    """Tests and a small benchmark of multi-permission checks against a local server."""
+
+    PERMISSIONS = ["orders:read", "orders:write", "orders:export", "products:read", "products:write"]
+
+    async def test_returns_permission_map_and_checks_duplicates_once(self):
+        service = FakeAuthService(granted=("orders:read",))
+        provider = make_provider(service)
+
+        decisions = await provider.authorize_many(make_token(), ["orders:read", "orders:write", "orders:read"])
+
+        assert decisions == {"orders:read": True, "orders:write": False}
+        assert service.calls == 2
+
+    async def test_concurrency_is_bounded(self):
+        active = peak = 0
+
+        async def service(request):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.005)
+            active -= 1
+            return httpx.Response(200, json={"is_authorized": True})
+
+        provider = make_provider(service, max_concurrency=2)
+
+        await provider.authorize_many(make_token(), self.PERMISSIONS)
+
+        assert peak == 2
+
+    async def test_faster_than_sequential_checks(self):
+        server = LocalAuthServer(latency=0.02)
+        base_url = await server.start()
+        try:
+            async with httpx.AsyncClient() as client:
+                # Separate providers so neither run is served from the other's decision cache
+                sequential = AuthProvider(base_url, "key", SECRET, http_client=client)
+                batched = AuthProvider(base_url, "key", SECRET, http_client=client)
+                token = make_token()
+
+                started = time.perf_counter()
+                expected = {
+                    permission: await sequential.authorize(token, permission)
+                    for permission in self.PERMISSIONS
+                }
+                sequential_seconds = time.perf_counter() - started
+
+                started = time.perf_counter()
+                decisions = await batched.authorize_many(token, self.PERMISSIONS)
+                batched_seconds = time.perf_counter() - started
+        finally:
+            await server.stop()
+
+        assert decisions == expected
+        assert server.calls == 2 * len(self.PERMISSIONS)
+        # Five 20ms calls back to back versus about one round trip
+        assert batched_seconds < sequential_seconds / 2
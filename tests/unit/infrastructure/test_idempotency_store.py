@@ -0,0 +1,87 @@
+"""
+test_idempotency_store.py
+
+Unit tests for the Redis Idempotency-Key store.
+"""
+
+import json
+import pytest
+from unittest.mock import AsyncMock
+
+from src.domain.exceptions import IdempotencyKeyInUseError, IdempotencyKeyMismatchError
+from src.infrastructure.caching.idempotency_store import RedisIdempotencyStore
+
+
+@pytest.fixture
+def mock_redis():
+    return AsyncMock()
+
+
+@pytest.fixture
+def store(mock_redis):
+    return RedisIdempotencyStore(
+        redis_client=mock_redis, in_flight_ttl=30, result_ttl=600, wait_timeout=0.05, poll_interval=0.01
+    )
+
+
+@pytest.mark.asyncio
+class TestRedisIdempotencyStore:
+    """Tests for claiming, replaying and releasing idempotency keys."""
+
+    async def test_first_request_claims_key(self, store, mock_redis):
+        mock_redis.set.return_value = True
+
+        assert await store.begin("orders:u1", "k1", "fp") is None
+
+        mock_redis.set.assert_called_once_with(
+            "idempotency:orders:u1:k1", json.dumps({"fingerprint": "fp"}), ex=30, nx=True
+        )
+
+    async def test_completed_request_is_replayed(self, store, mock_redis):
+        mock_redis.set.return_value = None
+        mock_redis.get.return_value = json.dumps({"fingerprint": "fp", "body": '{"id": 1}'})
+
+        assert await store.begin("orders:u1", "k1", "fp") == '{"id": 1}'
+
+    async def test_different_payload_is_rejected(self, store, mock_redis):
+        mock_redis.set.return_value = None
+        mock_redis.get.return_value = json.dumps({"fingerprint": "other", "body": "{}"})
+
+        with pytest.raises(IdempotencyKeyMismatchError):
+            await store.begin("orders:u1", "k1", "fp")
+
+    async def test_duplicate_waits_for_in_flight_response(self, store, mock_redis):
+        mock_redis.set.return_value = None
+        mock_redis.get.side_effect = [
+            json.dumps({"fingerprint": "fp"}),
+            json.dumps({"fingerprint": "fp", "body": '{"id": 1}'}),
+        ]
+
+        assert await store.begin("orders:u1", "k1", "fp") == '{"id": 1}'
+
+    async def test_duplicate_times_out_while_in_flight(self, store, mock_redis):
+        mock_redis.set.return_value = None
+        mock_redis.get.return_value = json.dumps({"fingerprint": "fp"})
+
+        with pytest.raises(IdempotencyKeyInUseError):
+            await store.begin("orders:u1", "k1", "fp")
+
+    async def test_released_key_is_claimed_again(self, store, mock_redis):
+        mock_redis.set.side_effect = [None, True]
+        mock_redis.get.return_value = None
+
+        assert await store.begin("orders:u1", "k1", "fp") is None
+        assert mock_redis.set.call_count == 2
+
+    async def test_complete_stores_body_with_result_ttl(self, store, mock_redis):
+        await store.complete("orders:u1", "k1", "fp", '{"id": 1}')
+
+        mock_redis.set.assert_called_once_with(
+            "idempotency:orders:u1:k1", json.dumps({"fingerprint": "fp", "body": '{"id": 1}'}), ex=600
+        )
+
+    async def test_release_deletes_only_own_marker(self, store, mock_redis):
+        await store.release("orders:u1", "k1", "fp")
+
+        args = mock_redis.eval.call_args.args
+        assert args[1:] == (1, "idempotency:orders:u1:k1", json.dumps({"fingerprint": "fp"}))
@@ -0,0 +1,152 @@
+"""
+test_inventory_write_behind.py
+
+Unit tests for InventoryWriteBehind using mocks.
+"""
+
+import json
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.infrastructure.caching.inventory_write_behind import InventoryWriteBehind, StockDrift
+from src.infrastructure.caching.redis_inventory_cache import RedisInventoryCache
+
+
+def journal_entry(entry_id, items):
+    return (entry_id, {"reservation_id": f"r-{entry_id}", "items": json.dumps(items)})
+
+
+@pytest.fixture
+def mock_redis():
+    return AsyncMock()
+
+
+@pytest.fixture
+def mock_session():
+    session = AsyncMock()
+    session.__aenter__.return_value = session
+    return session
+
+
+@pytest.fixture
+def write_behind(mock_redis, mock_session):
+    inventory_cache = RedisInventoryCache(redis_client=mock_redis, journal=True)
+    return InventoryWriteBehind(mock_redis, inventory_cache, MagicMock(return_value=mock_session))
+
+
+@pytest.mark.asyncio
+@patch("src.infrastructure.caching.inventory_write_behind.ProductRepository")
+@patch("src.infrastructure.caching.inventory_write_behind.InventorySyncRepository")
+class TestInventoryWriteBehind:
+    """Tests for draining the stock journal into PostgreSQL."""
+
+    async def test_flush_coalesces_and_advances_offset(
+        self, mock_offsets_cls, mock_products_cls, write_behind, mock_redis, mock_session
+    ):
+        # Arrange
+        offsets = mock_offsets_cls.return_value
+        offsets.lock_offset = AsyncMock(return_value="5-0")
+        offsets.set_offset = AsyncMock()
+        products = mock_products_cls.return_value
+        products.update_stock_many = AsyncMock(return_value={1: 7, 2: 9})
+        mock_redis.get.return_value = "5-0"  # Everything up to the offset already settled
+        mock_redis.evalsha.return_value = 1
+        mock_redis.xrange.return_value = [
+            journal_entry("6-0", [[1, 2], [2, 1]]),
+            journal_entry("7-0", [[1, 1]]),
+        ]
+        
+        # Act
+        applied = await write_behind.flush(batch_size=10)
+        
+        # Assert
+        assert applied == 2
+        mock_redis.xrange.assert_awaited_once_with("inventory:stock_journal", min="(5-0", count=10)
+        products.update_stock_many.assert_awaited_once_with({1: -3, 2: -1})
+        offsets.set_offset.assert_awaited_once_with("inventory:stock_journal", "7-0")
+        mock_session.commit.assert_awaited_once()
+        mock_redis.xadd.assert_not_called()
+        # Applied entries leave the pending counters and the journal in one script
+        assert mock_redis.evalsha.call_args.args[1:] == (
+            3, "inventory:pending_units", "inventory:stock_journal:settled", "inventory:stock_journal",
+            "5-0", "7-0", 1, 3, 2, 1,
+        )
+
+    async def test_flush_dead_letters_rejected_deltas(
+        self, mock_offsets_cls, mock_products_cls, write_behind, mock_redis, mock_session
+    ):
+        offsets = mock_offsets_cls.return_value
+        offsets.lock_offset = AsyncMock(return_value="5-0")
+        offsets.set_offset = AsyncMock()
+        # Product 2 is unknown, or its database stock cannot cover the sale
+        mock_products_cls.return_value.update_stock_many = AsyncMock(return_value={1: 7})
+        mock_redis.get.return_value = "5-0"
+        mock_redis.evalsha.return_value = 1
+        mock_redis.xrange.return_value = [journal_entry("6-0", [[1, 2], [2, 1]])]
+        
+        assert await write_behind.flush() == 1
+        
+        # The rejected delta survives the offset moving past (and trimming) its entry
+        mock_redis.xadd.assert_awaited_once()
+        stream, fields = mock_redis.xadd.call_args.args
+        assert stream == "inventory:stock_journal:rejected"
+        assert fields["through"] == "6-0"
+        assert json.loads(fields["deltas"]) == {"2": -1}
+        offsets.set_offset.assert_awaited_once_with("inventory:stock_journal", "6-0")
+
+    async def test_flush_settles_entries_committed_by_a_crashed_flush(
+        self, mock_offsets_cls, mock_products_cls, write_behind, mock_redis, mock_session
+    ):
+        mock_offsets_cls.return_value.lock_offset = AsyncMock(return_value="7-0")
+        mock_redis.get.return_value = "5-0"  # Offset committed up to 7-0, settled only up to 5-0
+        mock_redis.evalsha.return_value = 1
+        mock_redis.xrange.side_effect = [[journal_entry("6-0", [[1, 2]]), journal_entry("7-0", [[1, 1]])], []]
+        
+        assert await write_behind.flush() == 0
+        
+        assert mock_redis.xrange.await_args_list[0].kwargs == {"min": "(5-0", "max": "7-0", "count": 1000}
+        assert mock_redis.evalsha.call_args.args[5:] == ("5-0", "7-0", 1, 3)
+
+    async def test_flush_empty_journal(
+        self, mock_offsets_cls, mock_products_cls, write_behind, mock_redis, mock_session
+    ):
+        mock_offsets_cls.return_value.lock_offset = AsyncMock(return_value="0-0")
+        mock_redis.get.return_value = None
+        mock_redis.xrange.return_value = []
+        
+        assert await write_behind.flush() == 0
+        mock_session.commit.assert_not_called()
+        # The settled marker starts at the committed offset
+        mock_redis.set.assert_awaited_once_with("inventory:stock_journal:settled", "0-0", nx=True)
+        mock_redis.evalsha.assert_not_called()
+
+    async def test_available_stocks_subtract_in_flight_units(
+        self, mock_offsets_cls, mock_products_cls, write_behind, mock_redis
+    ):
+        write_behind.inventory_cache.in_flight_quantities = AsyncMock(return_value={1: 5, 3: 9})
+        mock_products_cls.return_value.get_many_by_ids = AsyncMock(return_value=[
+            MagicMock(id=1, stock_quantity=12),
+            MagicMock(id=2, stock_quantity=4),
+            MagicMock(id=3, stock_quantity=6),
+        ])
+        
+        stocks = await write_behind.available_stocks([1, 2, 3])
+        
+        # Never below zero, even when a flush raced the read
+        assert stocks == {1: 7, 2: 4, 3: 0}
+        mock_products_cls.return_value.get_many_by_ids.assert_awaited_once_with([1, 2, 3])
+        # Only the requested products' counters are read
+        write_behind.inventory_cache.in_flight_quantities.assert_awaited_once_with([1, 2, 3])
+
+    async def test_compare_reports_drift(self, mock_offsets_cls, mock_products_cls, write_behind, mock_redis):
+        mock_redis.mget.return_value = ["6", None]
+        
+        drift = await write_behind.compare({1: 10, 2: 3}, in_flight={1: 3})
+        
+        assert drift == [
+            StockDrift(product_id=1, database=10, redis=6, in_flight=3),
+            StockDrift(product_id=2, database=3, redis=None, in_flight=0),
+        ]
+        # 10 in the database, 3 in flight: Redis should hold 7
+        assert drift[0].drift == -1
+        assert drift[1].drift is None
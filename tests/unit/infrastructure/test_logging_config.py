@@ -0,0 +1,89 @@
+"""
+test_logging_config.py
+
+Unit tests for PII masking and the level-aware hot-path logger.
+"""
+
+from loguru import logger
+
+from configs.logging_config import HotPathLogger, _discard, mask_filter, mask_message
+
+
+class TestMasking:
+    """Tests for message masking and the masking sink filter."""
+
+    def test_masks_email_and_credentials(self):
+        masked = mask_message("Login for john@example.com with token=abc123")
+        assert "john@example.com" not in masked
+        assert "abc123" not in masked
+        assert "[EMAIL_MASKED]" in masked
+
+    def test_clean_message_is_returned_unchanged(self):
+        message = "Order 42 placed for customer 7"
+        assert mask_message(message) is message
+
+    def test_filter_masks_record_and_accepts_it(self):
+        record = {"message": "password: hunter2"}
+        assert mask_filter(record) is True
+        assert "hunter2" not in record["message"]
+
+    def test_masked_sink_never_sees_raw_message(self):
+        messages = []
+        sink_id = logger.add(messages.append, format="{message}", filter=mask_filter)
+        try:
+            logger.info("Customer email: {}", "jane@example.com")
+        finally:
+            logger.remove(sink_id)
+        assert messages == ["Customer email: [EMAIL_MASKED]\n"]
+
+    def test_record_is_masked_once_across_sinks(self, monkeypatch):
+        masked = []
+        monkeypatch.setattr(
+            "configs.logging_config.mask_message", lambda message: masked.append(message) or "[MASKED]"
+        )
+        messages = []
+        sink_ids = [
+            logger.add(messages.append, format="{message}", filter=mask_filter) for _ in range(2)
+        ]
+        try:
+            logger.info("token=abc")
+        finally:
+            for sink_id in sink_ids:
+                logger.remove(sink_id)
+        assert masked == ["token=abc"]
+        assert messages == ["[MASKED]\n", "[MASKED]\n"]
+
+
+class TestHotPathLogger:
+    """Tests for level binding of the hot-path logger."""
+
+    def test_levels_below_minimum_are_discarded(self):
+        hot = HotPathLogger()
+        hot.configure("INFO")
+        assert hot.debug is _discard
+        assert hot.info == logger.info
+        assert hot.success == logger.success
+
+    def test_unconfigured_logger_passes_everything_through(self):
+        hot = HotPathLogger()
+        assert hot.debug == logger.debug
+
+    def test_enabled_reflects_configured_level(self):
+        hot = HotPathLogger()
+        hot.configure("WARNING")
+        assert not hot.enabled("SUCCESS")
+        assert hot.enabled("ERROR")
+        hot.configure("DEBUG")
+        assert hot.enabled("DEBUG")
+
+    def test_arguments_are_formatted_only_when_emitted(self):
+        messages = []
+        sink_id = logger.add(messages.append, format="{message}", level="INFO")
+        hot = HotPathLogger()
+        hot.configure("INFO")
+        try:
+            hot.debug("Skipped {}", 1)
+            hot.info("Order {} placed", 42)
+        finally:
+            logger.remove(sink_id)
+        assert messages == ["Order 42 placed\n"]
@@ -0,0 +1,132 @@
+"""
+test_outbox_relay.py
+
+Unit tests for OutboxRelay and the outbox event publishers using mocks.
+"""
+
+import pytest
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.infrastructure.messaging.outbox_relay import OutboxRelay
+from src.infrastructure.messaging.outbox_publisher import OutboxEventPublisher, DetachedOutboxPublisher
+
+
+def make_row(row_id):
+    row = MagicMock()
+    row.id = row_id
+    row.event_type = "order.placed"
+    row.payload = f'{{"order_id": {row_id}}}'
+    return row
+
+
+@pytest.fixture
+def mock_session():
+    session = AsyncMock()
+    session.__aenter__.return_value = session
+    return session
+
+
+@pytest.fixture
+def session_factory(mock_session):
+    return MagicMock(return_value=mock_session)
+
+
+@pytest.mark.asyncio
+class TestOutboxRelay:
+    """Tests for relaying outbox rows to RabbitMQ."""
+
+    @patch("src.infrastructure.messaging.outbox_relay.OutboxRepository")
+    async def test_relay_marks_only_confirmed_rows(self, mock_repo_cls, session_factory, mock_session):
+        # Arrange
+        repo = mock_repo_cls.return_value
+        repo.fetch_unsent = AsyncMock(return_value=[make_row(1), make_row(2)])
+        repo.mark_sent = AsyncMock()
+        publisher = AsyncMock()
+        publisher.publish_raw.side_effect = [None, Exception("nack")]
+        relay = OutboxRelay(session_factory, publisher)
+        
+        # Act
+        published = await relay.relay_batch(batch_size=10)
+        
+        # Assert
+        assert published == 1
+        repo.fetch_unsent.assert_called_once_with(10)
+        publisher.publish_raw.assert_any_call("order.placed", b'{"order_id": 1}', message_id="1")
+        repo.mark_sent.assert_called_once_with([1])
+        mock_session.commit.assert_called_once()
+
+    @patch("src.infrastructure.messaging.outbox_relay.OutboxRepository")
+    async def test_relay_empty_outbox(self, mock_repo_cls, session_factory, mock_session):
+        # Arrange
+        repo = mock_repo_cls.return_value
+        repo.fetch_unsent = AsyncMock(return_value=[])
+        publisher = AsyncMock()
+        relay = OutboxRelay(session_factory, publisher)
+        
+        # Act
+        fetched = await relay.relay_batch()
+        
+        # Assert
+        assert fetched == 0
+        publisher.publish_raw.assert_not_called()
+        mock_session.commit.assert_not_called()
+
+    @patch("src.infrastructure.messaging.outbox_relay.OutboxRepository")
+    async def test_relay_all_failed_reports_nothing_published(
+        self, mock_repo_cls, session_factory, mock_session
+    ):
+        # A full batch of failures must not look like a full batch to the worker loop
+        repo = mock_repo_cls.return_value
+        repo.fetch_unsent = AsyncMock(return_value=[make_row(1), make_row(2)])
+        repo.mark_sent = AsyncMock()
+        publisher = AsyncMock()
+        publisher.publish_raw.side_effect = Exception("broker down")
+        relay = OutboxRelay(session_factory, publisher)
+        
+        published = await relay.relay_batch(batch_size=2)
+        
+        assert published == 0
+        repo.mark_sent.assert_called_once_with([])
+
+    @patch("src.infrastructure.messaging.outbox_relay.OutboxRepository")
+    async def test_purge_sent_deletes_rows_past_retention(
+        self, mock_repo_cls, session_factory, mock_session
+    ):
+        repo = mock_repo_cls.return_value
+        repo.delete_sent = AsyncMock(return_value=3)
+        relay = OutboxRelay(session_factory, AsyncMock())
+        
+        deleted = await relay.purge_sent(retention=3600, batch_size=500)
+        
+        assert deleted == 3
+        sent_before, limit = repo.delete_sent.call_args.args
+        assert limit == 500
+        assert (datetime.utcnow() - sent_before).total_seconds() >= 3600
+        mock_session.commit.assert_called_once()
+
+
+@pytest.mark.asyncio
+class TestOutboxPublishers:
+    """Tests for the IEventPublisher implementations backed by the outbox."""
+
+    async def test_outbox_publisher_stages_event(self):
+        repo = AsyncMock()
+        event = MagicMock()
+        
+        await OutboxEventPublisher(repo).publish(event)
+        
+        repo.add.assert_called_once_with(event)
+
+    @patch("src.infrastructure.messaging.outbox_publisher.OutboxRepository")
+    async def test_detached_publisher_commits_own_transaction(
+        self, mock_repo_cls, session_factory, mock_session
+    ):
+        mock_repo_cls.return_value.add = AsyncMock()
+        event = MagicMock()
+        
+        await DetachedOutboxPublisher(session_factory).publish(event)
+        
+        mock_repo_cls.assert_called_once_with(mock_session)
+        mock_repo_cls.return_value.add.assert_called_once_with(event)
+        mock_session.commit.assert_called_once()
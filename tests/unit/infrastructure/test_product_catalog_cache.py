@@ -0,0 +1,163 @@
+"""
+test_product_catalog_cache.py
+
+Unit tests for ProductCatalogCache and CachedProductRepository.
+"""
+
+import pytest
+from decimal import Decimal
+from unittest.mock import AsyncMock, patch
+
+from src.domain.entities import Product
+from src.infrastructure.caching.product_catalog_cache import ProductCatalogCache
+from src.infrastructure.repositories.cached_product_repository import CachedProductRepository
+
+
+def make_product(product_id: int, price: str = "10.00") -> Product:
+    return Product(
+        id=product_id,
+        sku=f"SKU-{product_id}",
+        name=f"Product {product_id}",
+        description="",
+        price=Decimal(price),
+        stock_quantity=10,
+    )
+
+
+@pytest.fixture
+def mock_redis():
+    return AsyncMock()
+
+
+@pytest.fixture
+def cache(mock_redis):
+    return ProductCatalogCache(redis_client=mock_redis, max_size=2, ttl=60)
+
+
+@pytest.fixture
+def inner_repo():
+    return AsyncMock()
+
+
+@pytest.fixture
+def after_commit():
+    """After-commit callbacks registered by the repository; run_commit() fires them."""
+    return []
+
+
+async def run_commit(callbacks):
+    """Simulate a successful commit of the repository's session."""
+    for callback in callbacks:
+        await callback()
+    callbacks.clear()
+
+
+@pytest.fixture
+def repo(inner_repo, cache, after_commit):
+    return CachedProductRepository(inner_repo, cache, after_commit=after_commit.append)
+
+
+class TestProductCatalogCache:
+    """Tests for LRU/TTL behaviour and counters."""
+
+    def test_hit_and_miss_counters(self, cache):
+        cache.put_many([make_product(1)], cache.version)
+        
+        found = cache.get_many([1, 2])
+        
+        assert list(found) == [1]
+        assert cache.stats() == {"size": 1, "hits": 1, "misses": 1, "evictions": 0}
+
+    def test_lru_eviction(self, cache):
+        cache.put_many([make_product(1), make_product(2)], cache.version)
+        cache.get_many([1])  # 2 becomes least recently used
+        cache.put_many([make_product(3)], cache.version)
+        
+        assert set(cache.get_many([1, 2, 3])) == {1, 3}
+        assert cache.evictions == 1
+
+    def test_ttl_expiry(self, cache):
+        with patch("src.infrastructure.caching.product_catalog_cache.time.monotonic", return_value=0):
+            cache.put_many([make_product(1)], cache.version)
+        with patch("src.infrastructure.caching.product_catalog_cache.time.monotonic", return_value=61):
+            assert cache.get_many([1]) == {}
+
+    def test_stale_fill_is_discarded(self, cache):
+        """A load that started before an invalidation must not be cached."""
+        version = cache.version
+        cache.evict([1])
+        cache.put_many([make_product(1)], version)
+        
+        assert cache.get_many([1]) == {}
+
+    def test_returns_copies(self, cache):
+        cache.put_many([make_product(1)], cache.version)
+        cache.get_many([1])[1].name = "Mutated"
+        
+        assert cache.get_many([1])[1].name == "Product 1"
+
+    @pytest.mark.asyncio
+    async def test_invalidate_publishes(self, cache, mock_redis):
+        cache.put_many([make_product(1)], cache.version)
+        
+        await cache.invalidate([1, 2])
+        
+        assert cache.get_many([1]) == {}
+        mock_redis.publish.assert_awaited_once_with(ProductCatalogCache.INVALIDATION_CHANNEL, "1,2")
+
+
+@pytest.mark.asyncio
+class TestCachedProductRepository:
+    """Tests for the caching repository decorator."""
+
+    async def test_only_misses_reach_database(self, repo, inner_repo):
+        inner_repo.get_many_by_ids.return_value = [make_product(1)]
+        await repo.get_many_by_ids([1])
+        
+        inner_repo.get_many_by_ids.return_value = [make_product(2)]
+        products = await repo.get_many_by_ids([1, 2])
+        
+        assert [p.id for p in products] == [1, 2]
+        inner_repo.get_many_by_ids.assert_awaited_with([2])
+
+    async def test_save_invalidates_after_commit(self, repo, inner_repo, cache, mock_redis, after_commit):
+        cache.put_many([make_product(1)], cache.version)
+        inner_repo.save.return_value = make_product(1, price="20.00")
+        
+        await repo.save(make_product(1, price="20.00"))
+        
+        # Until the commit, readers keep the committed (old) row
+        assert list(cache.get_many([1])) == [1]
+        mock_redis.publish.assert_not_called()
+        
+        await run_commit(after_commit)
+        assert cache.get_many([1]) == {}
+        mock_redis.publish.assert_awaited_once()
+
+    async def test_delete_invalidates(self, repo, inner_repo, cache, after_commit):
+        cache.put_many([make_product(1)], cache.version)
+        inner_repo.delete.return_value = True
+        
+        assert await repo.delete(1) is True
+        await run_commit(after_commit)
+        assert cache.get_many([1]) == {}
+
+    async def test_upsert_invalidates_only_updated(self, repo, inner_repo, cache, after_commit):
+        cache.put_many([make_product(1), make_product(2)], cache.version)
+        inner_repo.upsert_many.return_value = [(1, False), (3, True)]
+        
+        await repo.upsert_many([make_product(1), make_product(3)])
+        await run_commit(after_commit)
+        
+        assert list(cache.get_many([1, 2])) == [2]
+
+    async def test_uncommitted_write_invalidates_nothing(self, repo, inner_repo, cache, mock_redis, after_commit):
+        """A rolled-back write never runs its callbacks, so the cache is left alone."""
+        cache.put_many([make_product(1)], cache.version)
+        inner_repo.update_stock.return_value = 5
+        
+        await repo.update_stock(1, -5)
+        
+        assert len(after_commit) == 1
+        assert list(cache.get_many([1])) == [1]
+        mock_redis.publish.assert_not_called()
@@ -0,0 +1,259 @@
+"""
+test_rabbitmq_consumer.py
+
+Unit tests for RabbitMQConsumer using mocks.
+"""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from src.constants import EventTypes
+from src.infrastructure.messaging.rabbitmq_consumer import RabbitMQConsumer
+
+
+def make_message(tag, routing_key="order.placed", body=b'{"order_id": 1}', headers=None, type=None):
+    message = MagicMock()
+    message.delivery_tag = tag
+    message.routing_key = routing_key
+    message.type = type
+    message.body = body
+    message.headers = headers or {}
+    message.content_type = "application/json"
+    message.message_id = str(tag)
+    message.ack = AsyncMock()
+    message.nack = AsyncMock()
+    return message
+
+
+@pytest.fixture
+def consumer():
+    consumer = RabbitMQConsumer(
+        rabbitmq_url="amqp://test", ack_batch_size=100, retry_delays=[1.0, 5.0]
+    )
+    consumer.channel = MagicMock()
+    consumer.channel.default_exchange.publish = AsyncMock()
+    return consumer
+
+
+@pytest.mark.asyncio
+class TestRabbitMQConsumer:
+    """Tests for dispatch, retries and batched acknowledgements."""
+
+    async def test_dispatches_to_registered_handler(self, consumer):
+        handler = AsyncMock()
+        consumer.register(EventTypes.ORDER_PLACED, handler)
+        message = make_message(1)
+
+        await consumer._process(message)
+
+        handler.assert_called_once_with({"order_id": 1})
+        assert 1 in consumer._finished
+
+    async def test_failure_goes_to_first_retry_queue(self, consumer):
+        consumer.register(EventTypes.ORDER_PLACED, AsyncMock(side_effect=Exception("boom")))
+
+        await consumer._process(make_message(1))
+
+        args, kwargs = consumer.channel.default_exchange.publish.call_args
+        assert kwargs["routing_key"] == "order_worker.retry.1000ms"
+        assert args[0].headers["x-retry-count"] == 1
+        assert args[0].type == "order.placed"
+        # The original delivery is acknowledged once the retry is parked
+        assert 1 in consumer._finished
+
+    async def test_retried_message_is_routed_by_type(self, consumer):
+        handler = AsyncMock()
+        consumer.register(EventTypes.ORDER_PLACED, handler)
+        message = make_message(1, routing_key="order_worker", type="order.placed")
+
+        await consumer._process(message)
+
+        handler.assert_called_once()
+
+    async def test_exhausted_retries_are_dead_lettered(self, consumer):
+        consumer.register(EventTypes.ORDER_PLACED, AsyncMock(side_effect=Exception("boom")))
+
+        await consumer._process(make_message(1, headers={"x-retry-count": 2}))
+
+        args, kwargs = consumer.channel.default_exchange.publish.call_args
+        assert kwargs["routing_key"] == "order_worker.dead"
+        assert args[0].headers["x-error"] == "boom"
+
+    async def test_malformed_payload_is_dead_lettered_without_retry(self, consumer):
+        consumer.register(EventTypes.ORDER_PLACED, AsyncMock())
+
+        await consumer._process(make_message(1, body=b"not json"))
+
+        _, kwargs = consumer.channel.default_exchange.publish.call_args
+        assert kwargs["routing_key"] == "order_worker.dead"
+
+    async def test_reroute_failure_requeues(self, consumer):
+        consumer.register(EventTypes.ORDER_PLACED, AsyncMock(side_effect=Exception("boom")))
+        consumer.channel.default_exchange.publish.side_effect = Exception("channel closed")
+        message = make_message(1)
+
+        await consumer._process(message)
+
+        message.nack.assert_called_once_with(requeue=True)
+        assert 1 in consumer._settled
+
+    async def test_failed_ack_and_nack_do_not_stop_the_worker(self, consumer):
+        handler = AsyncMock(side_effect=[Exception("boom"), None, None])
+        consumer.register(EventTypes.ORDER_PLACED, handler)
+        consumer.channel.default_exchange.publish.side_effect = Exception("channel closed")
+        requeued, acked, last = make_message(1), make_message(2), make_message(3)
+        requeued.nack.side_effect = Exception("channel closed")
+        acked.ack.side_effect = Exception("channel closed")
+        consumer._workers = [asyncio.create_task(consumer._work())]
+        try:
+            for message in (requeued, acked, last):
+                await consumer._deliver(message)
+            await consumer._deliveries.join()
+        finally:
+            consumer._workers[0].cancel()
+
+        # The worker survived both failures and handled the next delivery
+        assert handler.await_count == 3
+        last.ack.assert_called_once_with(multiple=True)
+        assert not consumer._unacked
+
+    async def test_periodic_ack_survives_failed_flush(self, consumer):
+        consumer.ack_interval = 0
+        first, second = make_message(1), make_message(2)
+        first.ack.side_effect = Exception("channel closed")
+        consumer._unacked.append(1)
+        consumer._finished = {1: first}
+        acker = asyncio.create_task(consumer._ack_periodically())
+        try:
+            await asyncio.sleep(0.01)
+            consumer._unacked.append(2)
+            consumer._finished[2] = second
+            await asyncio.sleep(0.01)
+        finally:
+            acker.cancel()
+
+        # The flush after the failed one still acknowledges new deliveries
+        first.ack.assert_called_once_with(multiple=True)
+        second.ack.assert_called_once_with(multiple=True)
+        assert not consumer._unacked
+
+    async def test_flush_acks_up_to_first_unfinished(self, consumer):
+        messages = [make_message(tag) for tag in (1, 2, 3)]
+        consumer._unacked.extend([1, 2, 3])
+        consumer._finished = {1: messages[0], 3: messages[2]}
+
+        await consumer._flush_acks()
+
+        # Tag 2 is still being handled, so only tag 1 can be acknowledged
+        messages[0].ack.assert_called_once_with(multiple=True)
+        messages[2].ack.assert_not_called()
+        assert list(consumer._unacked) == [2, 3]
+
+    async def test_flush_acks_skips_settled_messages(self, consumer):
+        messages = [make_message(tag) for tag in (1, 2, 3)]
+        consumer._unacked.extend([1, 2, 3])
+        consumer._finished = {1: messages[0], 3: messages[2]}
+        consumer._settled = {2}
+
+        await consumer._flush_acks()
+
+        # One ack covers tags 1 and 3
+        messages[0].ack.assert_not_called()
+        messages[2].ack.assert_called_once_with(multiple=True)
+        assert not consumer._unacked
+
+    async def test_stop_drains_in_flight_messages(self, consumer):
+        handled = []
+
+        async def slow_handler(payload):
+            await asyncio.sleep(0.01)
+            handled.append(payload["order_id"])
+
+        consumer.register(EventTypes.ORDER_PLACED, slow_handler)
+        consumer.queue = AsyncMock()
+        consumer._consumer_tag = "ctag"
+        consumer.connection = AsyncMock()
+        consumer._workers = [asyncio.create_task(consumer._work()) for _ in range(2)]
+        messages = [make_message(tag) for tag in (1, 2, 3)]
+        for message in messages:
+            await consumer._deliver(message)
+
+        await consumer.stop()
+
+        consumer.queue.cancel.assert_called_once_with("ctag")
+        assert handled == [1, 1, 1]
+        messages[2].ack.assert_called_once_with(multiple=True)
+        consumer.connection.close.assert_called_once()
+
+    async def test_default_settings_ack_without_waiting_for_timer(self):
+        # prefetch=10 with the defaults: acks must not depend on ack_interval
+        consumer = RabbitMQConsumer(rabbitmq_url="amqp://test", ack_interval=3600)
+        assert consumer.ack_batch_size <= consumer.prefetch_count // 2
+
+        release = asyncio.Event()
+
+        async def handler(payload):
+            await release.wait()
+
+        consumer.register(EventTypes.ORDER_PLACED, handler)
+        consumer._workers = [asyncio.create_task(consumer._work()) for _ in range(consumer.concurrency)]
+        messages = [make_message(tag) for tag in range(1, consumer.prefetch_count + 1)]
+        try:
+            for message in messages:
+                await consumer._deliver(message)
+            await asyncio.sleep(0)
+            release.set()
+            await consumer._deliveries.join()
+        finally:
+            for worker in consumer._workers:
+                worker.cancel()
+
+        # Every delivery of the full prefetch window has been acknowledged
+        assert not consumer._unacked
+        assert any(message.ack.called for message in messages)
+
+    async def test_lone_delivery_is_acked_immediately(self, consumer):
+        consumer.register(EventTypes.ORDER_PLACED, AsyncMock())
+        consumer._workers = [asyncio.create_task(consumer._work())]
+        message = make_message(1)
+        try:
+            await consumer._deliver(message)
+            await consumer._deliveries.join()
+        finally:
+            consumer._workers[0].cancel()
+
+        message.ack.assert_called_once_with(multiple=True)
+
+    async def test_reconnect_forgets_deliveries_of_lost_channel(self, consumer):
+        handler = AsyncMock()
+        consumer.register(EventTypes.ORDER_PLACED, handler)
+        old = make_message(1)
+        consumer._unacked.append(1)
+        consumer._finished = {1: old}
+        stale = make_message(2)
+        await consumer._deliver(stale)
+
+        consumer._on_reconnect(consumer.connection)
+
+        consumer._workers = [asyncio.create_task(consumer._work())]
+        try:
+            await consumer._deliveries.join()
+        finally:
+            consumer._workers[0].cancel()
+        await consumer._flush_acks()
+
+        # Nothing from the lost channel is handled or acknowledged on the new one
+        assert not consumer._unacked and not consumer._finished
+        handler.assert_not_called()
+        old.ack.assert_not_called()
+        stale.ack.assert_not_called()
+
+    async def test_handler_finishing_after_reconnect_is_not_recorded(self, consumer):
+        consumer.register(EventTypes.ORDER_PLACED, AsyncMock())
+        generation = consumer._generation
+        consumer._on_reconnect(consumer.connection)
+
+        await consumer._process(make_message(1), generation)
+
+        assert 1 not in consumer._finished
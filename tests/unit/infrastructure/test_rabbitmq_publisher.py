@@ -4,6 +4,7 @@ test_rabbitmq_client.py
 Unit tests for RabbitMQPublisher using mocks.
 """
 
+import asyncio
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from src.infrastructure.messaging.rabbitmq_publisher import RabbitMQPublisher
@@ -61,3 +62,108 @@ class TestRabbitMQPublisher:
         # Assert
         assert publisher.connection == mock_conn
         mock_channel.declare_exchange.assert_called_once()
+
+    async def test_publish_raw_sets_message_id(self):
+        # Arrange
+        publisher = RabbitMQPublisher(rabbitmq_url="amqp://test")
+        publisher.exchange = AsyncMock()
+        
+        # Act
+        await publisher.publish_raw("order.placed", b'{"order_id": 1}', message_id="42")
+        
+        # Assert
+        args, kwargs = publisher.exchange.publish.call_args
+        assert kwargs["routing_key"] == "order.placed"
+        assert args[0].message_id == "42"
+        assert args[0].body == b'{"order_id": 1}'
+
+
+@pytest.mark.asyncio
+class TestBufferedRabbitMQPublisher:
+    """Tests for batched publishing over a pool of confirm-mode channels."""
+
+    @patch("src.infrastructure.messaging.rabbitmq_publisher.connect")
+    async def test_connect_opens_channel_pool(self, mock_connect):
+        mock_conn = AsyncMock()
+        mock_connect.return_value = mock_conn
+        publisher = RabbitMQPublisher(rabbitmq_url="amqp://test", channel_pool_size=3)
+        
+        await publisher.connect()
+        
+        assert mock_conn.channel.call_count == 3
+        mock_conn.channel.assert_called_with(publisher_confirms=True)
+        assert len(publisher._exchanges) == 3
+
+    async def test_batch_spread_over_channels(self, mock_event):
+        exchanges = [AsyncMock(), AsyncMock()]
+        publisher = RabbitMQPublisher(
+            rabbitmq_url="amqp://test", batch_size=10, linger=0.01
+        )
+        publisher.exchange = exchanges[0]
+        publisher._exchanges = exchanges
+        publisher._flusher = asyncio.create_task(publisher._flush_loop())
+        
+        try:
+            await asyncio.gather(*[publisher.publish(mock_event) for _ in range(4)])
+        finally:
+            publisher._flusher.cancel()
+        
+        assert exchanges[0].publish.call_count == 2
+        assert exchanges[1].publish.call_count == 2
+
+    async def test_nack_raises_for_caller(self, mock_event):
+        exchange = AsyncMock()
+        exchange.publish.side_effect = Exception("nack")
+        publisher = RabbitMQPublisher(rabbitmq_url="amqp://test", batch_size=10, linger=0)
+        publisher.exchange = exchange
+        publisher._exchanges = [exchange]
+        publisher._flusher = asyncio.create_task(publisher._flush_loop())
+        
+        try:
+            with pytest.raises(Exception, match="nack"):
+                await publisher.publish(mock_event)
+        finally:
+            publisher._flusher.cancel()
+        
+        # The in-flight slot is returned even when the broker rejects the message
+        assert publisher._in_flight._value == publisher.max_in_flight
+
+    async def test_backpressure_when_window_full(self, mock_event):
+        publisher = RabbitMQPublisher(
+            rabbitmq_url="amqp://test", batch_size=10, max_in_flight=1
+        )
+        publisher.exchange = AsyncMock()
+        publisher._exchanges = [publisher.exchange]
+        
+        # No flusher running: the first event occupies the only slot
+        first = asyncio.create_task(publisher.publish(mock_event))
+        second = asyncio.create_task(publisher.publish(mock_event))
+        await asyncio.sleep(0)
+        
+        assert publisher._buffer.qsize() == 1
+        assert not second.done()
+        
+        second.cancel()
+        await publisher.close()
+        with pytest.raises(RuntimeError, match="Publisher closed"):
+            await first
+
+    async def test_close_fails_batch_being_collected(self, mock_event):
+        publisher = RabbitMQPublisher(
+            rabbitmq_url="amqp://test", batch_size=10, linger=60
+        )
+        publisher.exchange = AsyncMock()
+        publisher._exchanges = [publisher.exchange]
+        publisher._flusher = asyncio.create_task(publisher._flush_loop())
+        
+        # The flusher has taken the event off the queue and is lingering for more
+        pending = asyncio.create_task(publisher.publish(mock_event))
+        await asyncio.sleep(0.01)
+        assert publisher._buffer.empty()
+        
+        await publisher.close()
+        
+        with pytest.raises(RuntimeError, match="Publisher closed"):
+            await pending
+        publisher.exchange.publish.assert_not_called()
+        assert publisher._in_flight._value == publisher.max_in_flight
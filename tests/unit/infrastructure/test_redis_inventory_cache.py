@@ -4,10 +4,12 @@ test_redis_client.py
 Unit tests for RedisInventoryCache using mocks.
 """
 
+import asyncio
+import json
 import pytest
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock
+from redis.exceptions import NoScriptError
 from src.infrastructure.caching.redis_inventory_cache import RedisInventoryCache
-from src.domain.exceptions import InventoryLockError
 
 
 @pytest.fixture
@@ -20,6 +22,16 @@ def inventory_cache(mock_redis):
     return RedisInventoryCache(redis_client=mock_redis)
 
 
+@pytest.fixture
+def mock_pipeline(mock_redis):
+    pipe = MagicMock()
+    pipe.execute = AsyncMock()
+    pipe.__aenter__ = AsyncMock(return_value=pipe)
+    pipe.__aexit__ = AsyncMock(return_value=False)
+    mock_redis.pipeline = MagicMock(return_value=pipe)
+    return pipe
+
+
 @pytest.mark.asyncio
 class TestRedisInventoryCache:
     """Tests for Redis inventory management and locking."""
@@ -33,49 +45,270 @@ class TestRedisInventoryCache:
         mock_redis.get.assert_called_with("inventory:product:1:stock")
 
     async def test_set_stock(self, inventory_cache, mock_redis):
-        await inventory_cache.set_stock(1, 100, ttl=60)
-        mock_redis.setex.assert_called_with("inventory:product:1:stock", 60, 100)
-
-    async def test_reserve_stock_success(self, inventory_cache, mock_redis):
-        """Should acquire lock, check stock, decrement, and release lock."""
-        # Arrange
-        product_id = 1
-        quantity = 5
-        mock_redis.set.return_value = True  # Lock acquired
-        mock_redis.get.return_value = b"10" # Current stock
-        
-        # Act
-        result = await inventory_cache.check_and_reserve_stock(product_id, quantity)
-        
-        # Assert
-        assert result is True
-        mock_redis.set.assert_called() # Lock key
-        mock_redis.get.assert_called_with("inventory:product:1:stock")
-        mock_redis.set.assert_any_call("inventory:product:1:stock", 5) # New stock
-        mock_redis.delete.assert_called_with("inventory:product:1:lock")
+        await inventory_cache.set_stock(1, 100)
+        mock_redis.set.assert_called_with("inventory:product:1:stock", 100, ex=None)
 
-    async def test_reserve_stock_insufficient(self, inventory_cache, mock_redis):
-        """Should release lock and return False if stock is insufficient."""
-        # Arrange
-        mock_redis.set.return_value = True
-        mock_redis.get.return_value = b"2"
+    async def test_release_stock(self, inventory_cache, mock_redis):
+        await inventory_cache.release_stock(1, 10)
+        mock_redis.incrby.assert_called_with("inventory:product:1:stock", 10)
+
+    async def test_reserve_many_success(self, inventory_cache, mock_redis):
+        """Should reserve all items with a single EVALSHA call."""
+        mock_redis.evalsha.return_value = 0
         
-        # Act
-        result = await inventory_cache.check_and_reserve_stock(1, 5)
+        result = await inventory_cache.reserve_many([(1, 2), (2, 3), (1, 1)])
         
-        # Assert
-        assert result is False
-        mock_redis.delete.assert_called_with("inventory:product:1:lock")
+        assert result is None
+        mock_redis.evalsha.assert_called_once()
+        args = mock_redis.evalsha.call_args.args
+        # sha, numkeys, keys..., quantities (duplicates merged)
+        assert args[1:] == (2, "inventory:product:1:stock", "inventory:product:2:stock", 3, 3)
+        mock_redis.set.assert_not_called()
 
-    async def test_reserve_stock_lock_fail(self, inventory_cache, mock_redis):
-        """Should raise InventoryLockError if lock cannot be acquired."""
-        # Arrange
-        mock_redis.set.return_value = False # Lock failed
+    async def test_reserve_many_insufficient(self, inventory_cache, mock_redis):
+        """Should return the product ID reported by the script."""
+        mock_redis.evalsha.return_value = 2
+        
+        result = await inventory_cache.reserve_many([(1, 2), (7, 3)])
         
-        # Act & Assert
-        with pytest.raises(InventoryLockError):
-            await inventory_cache.check_and_reserve_stock(1, 1, max_retries=1)
+        assert result == 7
 
-    async def test_release_stock(self, inventory_cache, mock_redis):
-        await inventory_cache.release_stock(1, 10)
-        mock_redis.incrby.assert_called_with("inventory:product:1:stock", 10)
+    async def test_reserve_many_missing_key(self, inventory_cache, mock_redis):
+        """Negative script result means the stock key is missing."""
+        mock_redis.evalsha.return_value = -1
+        
+        result = await inventory_cache.reserve_many([(5, 1)])
+        
+        assert result == 5
+
+    async def test_reserve_many_noscript_fallback(self, inventory_cache, mock_redis):
+        """Should load the script and retry once on NOSCRIPT."""
+        mock_redis.evalsha.side_effect = [NoScriptError("NOSCRIPT"), 0]
+        mock_redis.script_load.return_value = "loaded-sha"
+        
+        result = await inventory_cache.reserve_many([(1, 1)])
+        
+        assert result is None
+        mock_redis.script_load.assert_called_once()
+        assert mock_redis.evalsha.call_args.args[0] == "loaded-sha"
+
+@pytest.mark.asyncio
+class TestReservationLedger:
+    """Tests for expiring reservation holds."""
+
+    async def test_reserve_many_records_hold(self, inventory_cache, mock_redis):
+        """The hold should be written by the same script call as the decrement."""
+        mock_redis.evalsha.return_value = 0
+        
+        assert await inventory_cache.reserve_many([(1, 2)], reservation_id="r1") is None
+        
+        args = mock_redis.evalsha.call_args.args
+        assert args[1:6] == (
+            4, "inventory:product:1:stock", "inventory:reservations", "inventory:reservation_items",
+            "inventory:held_units",
+        )
+        assert args[6:9] == (2, "r1", 300)
+        assert json.loads(args[9]) == [[1, 2]]
+
+    async def test_confirm_reservation(self, inventory_cache, mock_redis):
+        mock_redis.evalsha.return_value = "[[1, 2]]"
+        
+        assert await inventory_cache.confirm_reservation("r1") is True
+        mock_redis.incrby.assert_not_called()
+
+    async def test_renew_reservation(self, inventory_cache, mock_redis):
+        mock_redis.evalsha.return_value = 1
+        
+        assert await inventory_cache.renew_reservation("r1") is True
+        assert mock_redis.evalsha.call_args.args[1:] == (1, "inventory:reservations", "r1", 300)
+        
+        mock_redis.evalsha.return_value = 0
+        assert await inventory_cache.renew_reservation("r1") is False
+
+    async def test_cancel_reservation_releases_stock(self, inventory_cache, mock_redis, mock_pipeline):
+        mock_redis.evalsha.return_value = "[[1, 2], [3, 1]]"
+        
+        assert await inventory_cache.cancel_reservation("r1") is True
+        assert [c.args for c in mock_pipeline.incrby.call_args_list] == [
+            ("inventory:product:1:stock", 2),
+            ("inventory:product:3:stock", 1),
+        ]
+
+    async def test_cancel_reservation_already_reaped(self, inventory_cache, mock_redis, mock_pipeline):
+        mock_redis.evalsha.return_value = None
+        
+        assert await inventory_cache.cancel_reservation("r1") is False
+        mock_pipeline.incrby.assert_not_called()
+
+    async def test_reap_coalesces_per_product(self, inventory_cache, mock_redis, mock_pipeline):
+        mock_redis.evalsha.return_value = ["[[1, 2]]", "[[1, 3], [2, 1]]"]
+        
+        assert await inventory_cache.reap_expired_reservations(batch_size=10) == 2
+        assert [c.args for c in mock_pipeline.incrby.call_args_list] == [
+            ("inventory:product:1:stock", 5),
+            ("inventory:product:2:stock", 1),
+        ]
+        mock_pipeline.execute.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+class TestReadThrough:
+    """Tests for cache-miss read-through and bulk warm-up."""
+
+    async def test_reserve_many_loads_missing_stock_and_retries(self, mock_redis, mock_pipeline):
+        loader = AsyncMock(return_value={1: 10})
+        cache = RedisInventoryCache(redis_client=mock_redis, stock_loader=loader)
+        mock_redis.evalsha.side_effect = [-1, 0]
+        mock_redis.mget.return_value = [None]
+        
+        assert await cache.reserve_many([(1, 2)]) is None
+        
+        loader.assert_awaited_once_with([1])
+        mock_pipeline.set.assert_called_once_with("inventory:product:1:stock", 10, nx=True)
+        assert mock_redis.evalsha.call_count == 2
+
+    async def test_reserve_many_without_loader_fails_on_miss(self, inventory_cache, mock_redis):
+        mock_redis.evalsha.return_value = -1
+        
+        assert await inventory_cache.reserve_many([(1, 2)]) == 1
+        mock_redis.mget.assert_not_called()
+
+    async def test_read_through_is_single_flight(self, mock_redis, mock_pipeline):
+        """Concurrent misses for the same product should share one loader call."""
+        release = asyncio.Event()
+        
+        async def slow_loader(product_ids):
+            await release.wait()
+            return {pid: 5 for pid in product_ids}
+        
+        loader = AsyncMock(side_effect=slow_loader)
+        cache = RedisInventoryCache(redis_client=mock_redis, stock_loader=loader)
+        mock_redis.mget.return_value = [None]
+        
+        tasks = [asyncio.create_task(cache._read_through([1])) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        
+        assert await asyncio.gather(*tasks) == [True, True, True]
+        loader.assert_awaited_once()
+
+    async def test_warm_up_overwrite_uses_mset(self, inventory_cache, mock_redis):
+        await inventory_cache.warm_up({1: 10, 2: 5}, overwrite=True)
+        
+        mock_redis.mset.assert_awaited_once_with(
+            {"inventory:product:1:stock": 10, "inventory:product:2:stock": 5}
+        )
+
+    async def test_warm_up_keeps_live_counters_by_default(self, inventory_cache, mock_redis, mock_pipeline):
+        await inventory_cache.warm_up({1: 10})
+        
+        mock_redis.mset.assert_not_called()
+        mock_pipeline.set.assert_called_once_with("inventory:product:1:stock", 10, nx=True)
+
+
+@pytest.mark.asyncio
+class TestBatchReservation:
+    """Tests for reserving, confirming and cancelling many orders per round trip."""
+
+    async def test_reserve_batch_pipelines_orders(self, inventory_cache, mock_redis, mock_pipeline):
+        mock_pipeline.execute.return_value = [0, 2]
+        
+        results = await inventory_cache.reserve_batch([
+            ("r1", [(1, 2)]),
+            ("r2", [(1, 1), (3, 5)]),
+        ])
+        
+        # Second order failed on its second key (product 3); the first is unaffected
+        assert results == [None, 3]
+        assert mock_pipeline.evalsha.call_count == 2
+        mock_pipeline.execute.assert_awaited_once_with(raise_on_error=False)
+        mock_redis.evalsha.assert_not_called()
+
+    async def test_reserve_batch_reloads_script(self, inventory_cache, mock_redis, mock_pipeline):
+        mock_pipeline.execute.side_effect = [[NoScriptError("NOSCRIPT"), 0], [0]]
+        mock_redis.script_load.return_value = "sha"
+        
+        results = await inventory_cache.reserve_batch([("r1", [(1, 2)]), ("r2", [(2, 1)])])
+        
+        assert results == [None, None]
+        mock_redis.script_load.assert_awaited_once()
+        # Only the rejected call is re-run
+        assert mock_pipeline.evalsha.call_count == 3
+
+    async def test_reserve_batch_missing_key_falls_back(self, inventory_cache, mock_redis, mock_pipeline):
+        mock_pipeline.execute.return_value = [-1]
+        mock_redis.evalsha.return_value = 0
+        
+        assert await inventory_cache.reserve_batch([("r1", [(1, 2)])]) == [None]
+        # Retried individually through reserve_many
+        mock_redis.evalsha.assert_awaited_once()
+
+    async def test_cancel_reservations_releases_claimed(self, inventory_cache, mock_pipeline):
+        mock_pipeline.execute.side_effect = [["[[1, 2]]", None], [None]]
+        
+        assert await inventory_cache.cancel_reservations(["r1", "r2"]) == 1
+        assert [c.args for c in mock_pipeline.incrby.call_args_list] == [("inventory:product:1:stock", 2)]
+
+    async def test_confirm_reservations(self, inventory_cache, mock_pipeline):
+        mock_pipeline.execute.return_value = ["[[1, 2]]", "[[2, 1]]"]
+        
+        assert await inventory_cache.confirm_reservations(["r1", "r2"]) == [True, True]
+
+    async def test_confirm_reservations_reports_lost_holds(self, inventory_cache, mock_pipeline):
+        mock_pipeline.execute.return_value = ["[[1, 2]]", None]
+        
+        assert await inventory_cache.confirm_reservations(["r1", "r2"]) == [True, False]
+
+    async def test_renew_reservations(self, inventory_cache, mock_pipeline):
+        mock_pipeline.execute.return_value = [1, 0]
+        
+        assert await inventory_cache.renew_reservations(["r1", "r2"]) == [True, False]
+        assert mock_pipeline.evalsha.call_count == 2
+
+
+@pytest.mark.asyncio
+class TestStockJournal:
+    """Tests for journaling confirmed holds."""
+
+    async def test_confirm_appends_to_journal(self, mock_redis):
+        cache = RedisInventoryCache(redis_client=mock_redis, journal=True)
+        mock_redis.evalsha.return_value = "[[1, 2]]"
+        
+        assert await cache.confirm_reservation("r1") is True
+        
+        args = mock_redis.evalsha.call_args.args
+        assert args[1:] == (
+            5, "inventory:reservations", "inventory:reservation_items", "inventory:held_units",
+            "inventory:stock_journal", "inventory:pending_units", "r1",
+        )
+
+    async def test_confirm_without_journal(self, inventory_cache, mock_redis):
+        mock_redis.evalsha.return_value = "[[1, 2]]"
+        
+        await inventory_cache.confirm_reservation("r1")
+        
+        assert mock_redis.evalsha.call_args.args[1] == 3
+
+    async def test_in_flight_reads_counters_of_requested_products(self, inventory_cache, mock_pipeline):
+        mock_pipeline.execute.return_value = [["4", None, None], ["1", "2", None]]
+        
+        assert await inventory_cache.in_flight_quantities([1, 2, 3]) == {1: 5, 2: 2}
+        
+        mock_pipeline.hmget.assert_any_call("inventory:held_units", [1, 2, 3])
+        mock_pipeline.hmget.assert_any_call("inventory:pending_units", [1, 2, 3])
+
+    async def test_settle_journal_is_guarded_by_marker(self, inventory_cache, mock_redis):
+        mock_redis.evalsha.return_value = 0
+        
+        assert await inventory_cache.settle_journal("5-0", "7-0", {1: 3}) is False
+        assert mock_redis.evalsha.call_args.args[5:] == ("5-0", "7-0", 1, 3)
+
+    async def test_get_stocks_reads_one_key_per_product(self, inventory_cache, mock_redis):
+        mock_redis.mget.return_value = ["5", None]
+        
+        stocks = await inventory_cache.get_stocks([1, 2])
+        
+        assert stocks == {1: 5, 2: None}
+        mock_redis.mget.assert_awaited_once_with(
+            ["inventory:product:1:stock", "inventory:product:2:stock"]
+        )
@@ -0,0 +1,156 @@
+"""
+test_redis_product_cache.py
+
+Unit tests for the shared Redis product cache tier.
+"""
+
+import pytest
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+
+from src.domain.entities import Product
+from src.infrastructure.caching.product_catalog_cache import ProductCatalogCache
+from src.infrastructure.caching.redis_product_cache import RedisProductCache
+from src.infrastructure.repositories.cached_product_repository import CachedProductRepository
+
+
+@pytest.fixture
+def product():
+    return Product(
+        id=1, sku="SKU-1", name="Product 1", description="", price=Decimal("9.99"), stock_quantity=3
+    )
+
+
+@pytest.fixture
+def mock_redis():
+    redis = AsyncMock()
+    pipe = MagicMock()
+    pipe.execute = AsyncMock()
+    pipe.__aenter__ = AsyncMock(return_value=pipe)
+    pipe.__aexit__ = AsyncMock(return_value=False)
+    redis.pipeline = MagicMock(return_value=pipe)
+    return redis
+
+
+@pytest.fixture
+def shared_cache(mock_redis):
+    return RedisProductCache(redis_client=mock_redis, ttl=60)
+
+
+@pytest.mark.asyncio
+class TestRedisProductCache:
+    """Tests for MGET reads, pipelined writes and serialization."""
+
+    async def test_round_trip(self, shared_cache, mock_redis, product):
+        await shared_cache.set_many([product], {1: "3"})
+        _, numkeys, *rest = mock_redis.eval.call_args.args
+        assert rest[:numkeys] == ["catalog:product:1", "catalog:product:1:version"]
+        ttl, version, value = rest[numkeys:]
+        assert (ttl, version) == (60, "3")
+        
+        mock_redis.mget.return_value = [value, None, "3", None]
+        found, versions = await shared_cache.get_many([1, 2])
+        
+        assert found == {1: product}
+        assert found[1].price == Decimal("9.99")
+        assert versions == {1: "3", 2: ""}
+        mock_redis.mget.assert_awaited_once_with([
+            "catalog:product:1", "catalog:product:2", "catalog:product:1:version", "catalog:product:2:version",
+        ])
+
+    async def test_redis_error_degrades_to_miss(self, shared_cache, mock_redis):
+        mock_redis.mget.side_effect = ConnectionError("down")
+        
+        assert await shared_cache.get_many([1]) == ({}, {})
+
+    async def test_delete_bumps_version_atomically(self, shared_cache, mock_redis):
+        await shared_cache.delete_many([1])
+        
+        mock_redis.pipeline.assert_called_once_with(transaction=True)
+        pipe = mock_redis.pipeline.return_value
+        pipe.incr.assert_called_once_with("catalog:product:1:version")
+        pipe.delete.assert_called_once_with("catalog:product:1")
+
+    async def test_fill_without_read_version_is_skipped(self, shared_cache, mock_redis, product):
+        await shared_cache.set_many([product], {})
+        
+        mock_redis.eval.assert_not_called()
+
+
+@pytest.mark.asyncio
+class TestTwoTierRepository:
+    """Tests for memory -> Redis -> database fallthrough."""
+
+    async def test_only_redis_misses_reach_database(self, shared_cache, mock_redis, product):
+        inner_repo = AsyncMock()
+        repo = CachedProductRepository(
+            inner_repo, ProductCatalogCache(mock_redis), after_commit=[].append, shared_cache=shared_cache
+        )
+        shared_cache.get_many = AsyncMock(return_value=({1: product}, {1: "", 2: "7"}))
+        shared_cache.set_many = AsyncMock()
+        other = Product(id=2, sku="SKU-2", name="P2", description="", price=Decimal("1"), stock_quantity=1)
+        inner_repo.get_many_by_ids.return_value = [other]
+        
+        products = await repo.get_many_by_ids([1, 2])
+        
+        assert [p.id for p in products] == [1, 2]
+        inner_repo.get_many_by_ids.assert_awaited_once_with([2])
+        shared_cache.set_many.assert_awaited_once_with([other], {1: "", 2: "7"})
+        
+        # Second call is served from memory
+        await repo.get_many_by_ids([1, 2])
+        shared_cache.get_many.assert_awaited_once()
+
+    async def test_save_deletes_shared_entry(self, shared_cache, mock_redis, product):
+        inner_repo = AsyncMock()
+        inner_repo.save.return_value = product
+        after_commit = []
+        repo = CachedProductRepository(
+            inner_repo, ProductCatalogCache(mock_redis), after_commit=after_commit.append, shared_cache=shared_cache
+        )
+        
+        await repo.save(product)
+        for callback in after_commit:
+            await callback()
+        
+        mock_redis.pipeline.return_value.delete.assert_called_once_with("catalog:product:1")
+        mock_redis.publish.assert_awaited_once()
+
+    async def test_invalidation_delivered_after_load_cannot_fill_shared_tier(self, shared_cache, mock_redis, product):
+        """A write on another replica during the load must block the fill before its invalidation arrives here."""
+        catalog = ProductCatalogCache(mock_redis)
+        inner_repo = AsyncMock()
+        versions = {"catalog:product:1:version": "4"}
+        filled = {}
+        
+        async def mget(keys):
+            return [versions.get(key) for key in keys]
+        
+        async def load(product_ids):
+            # Another replica commits a write and bumps the version in Redis;
+            # its pub/sub invalidation has not reached this replica yet
+            versions["catalog:product:1:version"] = "5"
+            return [product]
+        
+        async def fill_if_unchanged(script, numkeys, *keys_and_args):
+            # Mirrors FILL_IF_UNCHANGED_SCRIPT for a single product
+            keys, args = keys_and_args[:numkeys], keys_and_args[numkeys:]
+            if (versions.get(keys[1]) or "") != args[1]:
+                return 0
+            filled[keys[0]] = args[2]
+            return 1
+        
+        mock_redis.mget.side_effect = mget
+        mock_redis.eval.side_effect = fill_if_unchanged
+        inner_repo.get_many_by_ids.side_effect = load
+        repo = CachedProductRepository(inner_repo, catalog, after_commit=[].append, shared_cache=shared_cache)
+        
+        assert [p.id for p in await repo.get_many_by_ids([1])] == [1]
+        
+        # The fill was conditional on the version read before the load, which has moved
+        assert mock_redis.eval.call_args.args[5] == "4"
+        assert filled == {}
+        
+        # The late invalidation then evicts the row from memory
+        catalog.evict([1])
+        assert catalog.get_many([1]) == {}
@@ -6,15 +6,24 @@ Unit tests for Repositories using SQLite in-memory for testing SQLAlchemy logic.
 
 import pytest
 import pytest_asyncio
+from unittest.mock import MagicMock
+from datetime import datetime
 from decimal import Decimal
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import declarative_base
+from sqlalchemy.dialects import postgresql
 
 from src.infrastructure.models.product_model import ProductModel, Base as ProductBase
 from src.infrastructure.models.order_model import OrderModel, OrderItemModel, Base as OrderBase
+from src.infrastructure.models.outbox_model import Base as OutboxBase
+from src.infrastructure.models.inventory_sync_model import Base as InventorySyncBase
 from src.infrastructure.repositories.product_repository import ProductRepository
 from src.infrastructure.repositories.order_repository import OrderRepository
+from src.infrastructure.repositories.outbox_repository import OutboxRepository
+from src.infrastructure.repositories.order_query_repository import OrderQueryRepository
+from src.infrastructure.repositories.inventory_sync_repository import InventorySyncRepository
 from src.domain.entities import Product, Order, OrderItem, OrderStatus
+from src.domain.exceptions import ProductNotFoundError, InsufficientStockError
 
 # Use a combined base or separate ones for testing
 Base = declarative_base()
@@ -28,6 +37,8 @@ async def test_session():
     async with engine.begin() as conn:
         await conn.run_sync(ProductBase.metadata.create_all)
         await conn.run_sync(OrderBase.metadata.create_all)
+        await conn.run_sync(OutboxBase.metadata.create_all)
+        await conn.run_sync(InventorySyncBase.metadata.create_all)
     
     Session = async_sessionmaker(engine, expire_on_commit=False)
     async with Session() as session:
@@ -85,6 +96,72 @@ class TestProductRepository:
         updated = await repo.get_by_id(model.id)
         assert updated.stock_quantity == 5
 
+    async def test_update_stock_never_goes_negative(self, test_session):
+        repo = ProductRepository(test_session)
+        model = ProductModel(sku="SKU-3", name="N", price=1.0, stock_quantity=3)
+        test_session.add(model)
+        await test_session.commit()
+        
+        with pytest.raises(InsufficientStockError):
+            await repo.update_stock(model.id, -4)
+        with pytest.raises(ProductNotFoundError):
+            await repo.update_stock(model.id + 1, 1)
+        
+        assert await repo.update_stock(model.id, -3) == 0
+
+    async def test_update_stock_many_statement(self):
+        stmt = ProductRepository._update_stock_many_statement({1: -2, 3: 5})
+        compiled = stmt.compile(dialect=postgresql.dialect())
+        sql = str(compiled)
+        
+        assert "FROM (VALUES" in sql
+        assert "AS deltas (id, delta)" in sql
+        assert "products.stock_quantity + deltas.delta >= " in sql
+        assert "RETURNING products.id, products.stock_quantity" in sql
+        assert [compiled.params[f"param_{i}"] for i in range(1, 5)] == [1, -2, 3, 5]
+
+    async def test_get_stock_levels_keyset(self, test_session):
+        repo = ProductRepository(test_session)
+        for i in range(3):
+            test_session.add(ProductModel(sku=f"SKU-L{i}", name="N", price=1.0, stock_quantity=i))
+        await test_session.commit()
+        
+        first = await repo.get_stock_levels(limit=2)
+        rest = await repo.get_stock_levels(after_id=first[-1][0], limit=2)
+        
+        assert [stock for _, stock in first + rest] == [0, 1, 2]
+
+    async def test_list_products_keyset(self, test_session):
+        repo = ProductRepository(test_session)
+        for i in range(3):
+            test_session.add(ProductModel(sku=f"SKU-P{i}", name=f"N{i}", price=1.0, stock_quantity=i))
+        await test_session.commit()
+        
+        first = await repo.list_products(limit=2)
+        rest = await repo.list_products(limit=2, after_id=first[-1].id)
+        
+        assert [p.sku for p in first + rest] == ["SKU-P0", "SKU-P1", "SKU-P2"]
+
+    async def test_upsert_statement_conflicts_on_sku(self):
+        sql = str(ProductRepository._upsert_statement().compile(dialect=postgresql.dialect()))
+        
+        assert "ON CONFLICT (sku) DO UPDATE SET name = excluded.name" in sql
+        assert "stock_quantity = excluded.stock_quantity" in sql
+        assert "sku = excluded.sku" not in sql
+        assert "RETURNING products.id, xmax = 0 AS created" in sql
+
+    async def test_search_statement_uses_trigram_ranking(self):
+        stmt = ProductRepository._search_statement("50%_off", limit=5, after=(0.5, 10))
+        compiled = stmt.compile(dialect=postgresql.dialect())
+        sql = str(compiled)
+        
+        assert "similarity(products.name, %(similarity_1)s::VARCHAR) AS rank" in sql
+        assert "products.name %% %(name_1)s" in sql
+        assert "ORDER BY rank DESC, products.id" in sql
+        assert "products.id > %(id_1)s" in sql
+        # User wildcards are escaped in the substring match
+        assert compiled.params["name_2"] == "%50\\%\\_off%"
+
 
 @pytest.mark.asyncio
 class TestOrderRepository:
@@ -114,6 +191,48 @@ class TestOrderRepository:
         assert found_order.customer_id == 1
         assert found_order.total_amount == Decimal("10.00")
 
+    async def test_save_new_order_uses_returning(self, test_session):
+        repo = OrderRepository(test_session)
+        order = Order(
+            id=None,
+            customer_id=7,
+            items=[OrderItem(product_id=1, product_sku="S1", product_name="N1", quantity=3, unit_price=Decimal("2.00"))],
+            status=OrderStatus.PENDING
+        )
+        
+        saved = await repo.save(order)
+        
+        assert saved.id is not None
+        assert saved.created_at is not None
+        assert saved.total_amount == Decimal("6.00")
+        # Written with Core INSERTs: nothing is tracked by the unit of work
+        assert not test_session.new and not test_session.identity_map
+
+    async def test_save_many_orders(self, test_session):
+        repo = OrderRepository(test_session)
+        orders = [
+            Order(
+                id=None,
+                customer_id=customer_id,
+                items=[
+                    OrderItem(product_id=1, product_sku="S1", product_name="N1", quantity=1, unit_price=Decimal("5.00")),
+                    OrderItem(product_id=2, product_sku="S2", product_name="N2", quantity=customer_id, unit_price=Decimal("2.50")),
+                ],
+                status=OrderStatus.PENDING
+            )
+            for customer_id in (1, 2, 3)
+        ]
+        
+        saved = await repo.save_many(orders)
+        await test_session.commit()
+        
+        assert [order.customer_id for order in saved] == [1, 2, 3]
+        assert len({order.id for order in saved}) == 3
+        
+        found = await repo.get_by_id(saved[2].id)
+        assert found.customer_id == 3
+        assert found.total_amount == Decimal("12.50")
+
     async def test_update_status(self, test_session):
         repo = OrderRepository(test_session)
         model = OrderModel(customer_id=1, status="pending")
@@ -129,3 +248,125 @@ class TestOrderRepository:
         
         updated = await repo.get_by_id(model.id)
         assert updated.status == OrderStatus.CONFIRMED
+
+
+@pytest.mark.asyncio
+class TestOrderQueryRepository:
+    """Tests for the Core projection read path."""
+
+    async def test_get_by_id_projection(self, test_session):
+        saved = await OrderRepository(test_session).save(
+            Order(
+                id=None,
+                customer_id=1,
+                items=[
+                    OrderItem(product_id=1, product_sku="S1", product_name="N1", quantity=2, unit_price=Decimal("5.00")),
+                    OrderItem(product_id=2, product_sku="S2", product_name="N2", quantity=1, unit_price=Decimal("1.25")),
+                ],
+                status=OrderStatus.PENDING
+            )
+        )
+        await test_session.commit()
+        
+        view = await OrderQueryRepository(test_session).get_by_id(saved.id)
+        
+        assert view.id == saved.id
+        assert view.status == "pending"
+        assert [item.product_sku for item in view.items] == ["S1", "S2"]
+        assert view.items[0].subtotal == Decimal("10.00")
+        assert view.total_amount == Decimal("11.25")
+        assert view.total_items == 3
+        assert await OrderQueryRepository(test_session).get_by_id(saved.id + 1) is None
+
+    async def test_get_by_customer_id_pages(self, test_session):
+        repo = OrderRepository(test_session)
+        for day in (1, 2, 3):
+            await repo.save(
+                Order(
+                    id=None,
+                    customer_id=1,
+                    items=[OrderItem(product_id=1, product_sku="S1", product_name="N1", quantity=day, unit_price=Decimal("1.00"))],
+                    created_at=datetime(2026, 1, day),
+                    updated_at=datetime(2026, 1, day),
+                )
+            )
+        await test_session.commit()
+        
+        query_repo = OrderQueryRepository(test_session)
+        first = await query_repo.get_by_customer_id(1, limit=2)
+        second = await query_repo.get_by_customer_id(1, limit=2, after=(first[-1].created_at, first[-1].id))
+        
+        assert [view.total_items for view in first] == [3, 2]
+        assert [view.total_items for view in second] == [1]
+
+    async def test_stream_orders_groups_items_and_filters(self, test_session):
+        repo = OrderRepository(test_session)
+        for day, status in ((1, OrderStatus.PENDING), (2, OrderStatus.CONFIRMED), (3, OrderStatus.CONFIRMED)):
+            await repo.save(
+                Order(
+                    id=None,
+                    customer_id=day,
+                    items=[
+                        OrderItem(product_id=1, product_sku="S1", product_name="N1", quantity=1, unit_price=Decimal("1.00")),
+                        OrderItem(product_id=2, product_sku="S2", product_name="N2", quantity=day, unit_price=Decimal("2.00")),
+                    ],
+                    status=status,
+                    created_at=datetime(2026, 1, day),
+                    updated_at=datetime(2026, 1, day),
+                )
+            )
+        await test_session.commit()
+        
+        query_repo = OrderQueryRepository(test_session)
+        # A batch smaller than one order's rows still yields whole orders
+        streamed = [view async for view in query_repo.stream_orders(batch_size=1)]
+        confirmed = [
+            view async for view in query_repo.stream_orders(
+                status="confirmed", created_to=datetime(2026, 1, 3)
+            )
+        ]
+        
+        assert [view.customer_id for view in streamed] == [1, 2, 3]
+        assert all(len(view.items) == 2 for view in streamed)
+        assert streamed[2].total_amount == Decimal("7.00")
+        assert [view.customer_id for view in confirmed] == [2]
+
+
+@pytest.mark.asyncio
+class TestOutboxRepository:
+    """Tests for OutboxRepository implementation."""
+
+    async def test_add_fetch_and_mark_sent(self, test_session):
+        repo = OutboxRepository(test_session)
+        for order_id in (1, 2):
+            event = MagicMock()
+            event.to_dict.return_value = {"event_type": "order.placed", "order_id": order_id}
+            await repo.add(event)
+        await test_session.commit()
+        
+        unsent = await repo.fetch_unsent(limit=10)
+        assert [row.event_type for row in unsent] == ["order.placed", "order.placed"]
+        assert '"order_id": 1' in unsent[0].payload
+        
+        await repo.mark_sent([unsent[0].id])
+        await test_session.commit()
+        
+        remaining = await repo.fetch_unsent(limit=10)
+        assert [row.id for row in remaining] == [unsent[1].id]
+
+
+@pytest.mark.asyncio
+class TestInventorySyncRepository:
+    """Tests for InventorySyncRepository implementation."""
+
+    async def test_offset_starts_at_zero_and_advances(self, test_session):
+        repo = InventorySyncRepository(test_session)
+        
+        assert await repo.get_offset("journal") == "0-0"
+        assert await repo.lock_offset("journal") == "0-0"
+        
+        await repo.set_offset("journal", "17-3")
+        await test_session.commit()
+        
+        assert await repo.lock_offset("journal") == "17-3"
+        assert await repo.get_offset("other") == "0-0"
@@ -0,0 +1,98 @@
+"""
+test_token_verification_cache.py
+
+Unit tests for the verified-token cache and its use by AuthProvider.
+"""
+
+import time
+import pytest
+from jose import jwt
+from unittest.mock import patch
+
+from src.infrastructure.caching.token_verification_cache import TokenVerificationCache
+from src.infrastructure.clients.auth_provider import AuthProvider
+
+SECRET = "test-secret"
+
+
+def make_token(sub="user-1", exp_in=3600):
+    return jwt.encode(
+        {"sub": sub, "aud": "authenticated", "exp": int(time.time()) + exp_in}, SECRET, algorithm="HS256"
+    )
+
+
+class TestTokenVerificationCache:
+    """Tests for expiry, LRU eviction and hit-rate metrics."""
+
+    def test_hit_returns_copy_of_payload(self):
+        cache = TokenVerificationCache()
+        cache.put("t1", {"sub": "u1", "exp": time.time() + 60})
+
+        payload = cache.get("t1")
+        payload["sub"] = "mutated"
+
+        assert cache.get("t1")["sub"] == "u1"
+        assert cache.stats()["hits"] == 2
+
+    def test_entry_expires_with_token(self):
+        cache = TokenVerificationCache(ttl=300)
+        cache.put("t1", {"sub": "u1", "exp": time.time() - 1})
+
+        assert cache.get("t1") is None
+        assert cache.stats()["size"] == 0
+
+    def test_ttl_bounds_tokens_without_exp(self):
+        cache = TokenVerificationCache(ttl=60)
+        cache.put("t1", {"sub": "u1"})
+
+        with patch("src.infrastructure.caching.token_verification_cache.time.time", return_value=time.time() + 61):
+            assert cache.get("t1") is None
+
+    def test_evicts_least_recently_used(self):
+        cache = TokenVerificationCache(max_size=2)
+        cache.put("t1", {"sub": "u1"})
+        cache.put("t2", {"sub": "u2"})
+        cache.get("t1")
+        cache.put("t3", {"sub": "u3"})
+
+        assert cache.get("t2") is None
+        assert cache.get("t1") is not None
+        assert cache.stats()["evictions"] == 1
+
+    def test_hit_rate(self):
+        cache = TokenVerificationCache()
+        cache.put("t1", {"sub": "u1"})
+        cache.get("t1")
+        cache.get("t2")
+
+        assert cache.stats()["hit_rate"] == 0.5
+
+
+@pytest.mark.asyncio
+class TestAuthProviderTokenCache:
+    """Tests for cached local verification in AuthProvider."""
+
+    async def test_repeat_token_skips_decode(self):
+        provider = AuthProvider("http://auth", "key", SECRET, token_cache=TokenVerificationCache())
+        token = make_token()
+
+        with patch("src.infrastructure.clients.auth_provider.jwt.decode", wraps=jwt.decode) as decode:
+            first = await provider.verify_token(token)
+            second = await provider.verify_token(token)
+
+        assert first == second
+        assert first["sub"] == "user-1"
+        decode.assert_called_once()
+
+    async def test_invalid_token_is_not_cached(self):
+        cache = TokenVerificationCache()
+        provider = AuthProvider("http://auth", "key", SECRET, token_cache=cache)
+        token = jwt.encode({"sub": "u1", "aud": "authenticated"}, "wrong-secret", algorithm="HS256")
+
+        assert await provider.verify_token(token) is None
+        assert cache.stats()["size"] == 0
+
+    async def test_expired_token_is_rejected(self):
+        provider = AuthProvider("http://auth", "key", SECRET, token_cache=TokenVerificationCache())
+
+        assert await provider.verify_token(make_token(exp_in=-10)) is None
@@ -0,0 +1,59 @@
+"""
+test_transactional_session.py
+
+Unit tests for after-commit callbacks of TransactionalSession.
+"""
+
+import pytest
+from unittest.mock import AsyncMock
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+from src.infrastructure.repositories import TransactionalSession
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    return async_sessionmaker(engine, class_=TransactionalSession)
+
+
+@pytest.mark.asyncio
+class TestTransactionalSession:
+    """Tests for running and dropping after-commit callbacks."""
+
+    async def test_callbacks_run_after_commit_in_order(self, session_factory):
+        calls = []
+        async with session_factory() as session:
+            await session.execute(text("SELECT 1"))
+            session.after_commit(AsyncMock(side_effect=lambda: calls.append("first")))
+            session.after_commit(AsyncMock(side_effect=lambda: calls.append("second")))
+            assert calls == []
+            await session.commit()
+            assert calls == ["first", "second"]
+            await session.commit()
+        assert calls == ["first", "second"]
+
+    async def test_rollback_drops_callbacks(self, session_factory):
+        callback = AsyncMock()
+        async with session_factory() as session:
+            await session.execute(text("SELECT 1"))
+            session.after_commit(callback)
+            await session.rollback()
+            await session.commit()
+        callback.assert_not_called()
+
+    async def test_close_without_commit_drops_callbacks(self, session_factory):
+        callback = AsyncMock()
+        async with session_factory() as session:
+            session.after_commit(callback)
+        await session.commit()
+        callback.assert_not_called()
+
+    async def test_failing_callback_does_not_fail_commit(self, session_factory):
+        later = AsyncMock()
+        async with session_factory() as session:
+            session.after_commit(AsyncMock(side_effect=RuntimeError("redis down")))
+            session.after_commit(later)
+            await session.commit()
+        later.assert_awaited_once()
@@ -0,0 +1,107 @@
+"""
+test_middlewares.py
+
+Unit tests for the pure ASGI HTTP middlewares.
+"""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+from loguru import logger
+
+from configs.logging_config import _discard, hot_logger
+
+from src.interface.http.middlewares import LoggingMiddleware
+from src.interface.http.middlewares.redirect import HTTPSRedirectMiddleware
+
+
+def make_app(middleware_class) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/items")
+    async def items():
+        return {"ok": True}
+
+    @app.get("/stream")
+    async def stream():
+        async def chunks():
+            for i in range(3):
+                yield f"{i}\n"
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    app.add_middleware(middleware_class)
+    return app
+
+
+@pytest.fixture
+def log_messages():
+    messages = []
+    sink_id = logger.add(lambda message: messages.append(str(message)), level="INFO", format="{message}")
+    yield messages
+    logger.remove(sink_id)
+
+
+class TestLoggingMiddleware:
+    """Tests for request/response logging."""
+
+    def test_logs_request_with_masked_params_and_response_status(self, log_messages):
+        client = TestClient(make_app(LoggingMiddleware))
+
+        response = client.get("/items", params={"customer_id": "42", "limit": "5"})
+
+        assert response.status_code == 200
+        request_log = next(m for m in log_messages if "HTTP | REQUEST" in m)
+        assert "'customer_id': '***MASKED***'" in request_log
+        assert "'limit': '5'" in request_log
+        assert any("HTTP | RESPONSE | GET /items | Status: 200" in m for m in log_messages)
+
+    def test_streamed_responses_pass_through(self, log_messages):
+        client = TestClient(make_app(LoggingMiddleware))
+
+        response = client.get("/stream")
+
+        assert response.text == "0\n1\n2\n"
+        assert any("HTTP | RESPONSE | GET /stream | Status: 200" in m for m in log_messages)
+
+    def test_params_are_not_masked_when_logging_is_off(self, monkeypatch):
+        calls = []
+        monkeypatch.setattr(LoggingMiddleware, "_mask_pii", lambda self, data: calls.append(data))
+        logger.disable("src.interface.http.middlewares.logging_middleware")
+        try:
+            TestClient(make_app(LoggingMiddleware)).get("/items", params={"token": "secret"})
+        finally:
+            logger.enable("src.interface.http.middlewares.logging_middleware")
+
+        assert calls == []
+
+
+    def test_response_line_is_not_formatted_when_info_is_off(self, monkeypatch):
+        messages = []
+        sink_id = logger.add(lambda message: messages.append(str(message)), level="DEBUG", format="{message}")
+        monkeypatch.setattr(hot_logger, "info", _discard)
+        try:
+            TestClient(make_app(LoggingMiddleware)).get("/items")
+        finally:
+            logger.remove(sink_id)
+
+        assert not any("HTTP | RESPONSE" in m for m in messages)
+
+
+class TestHTTPSRedirectMiddleware:
+    """Tests for HTTP to HTTPS redirects."""
+
+    def test_redirects_http_to_https(self):
+        client = TestClient(make_app(HTTPSRedirectMiddleware), base_url="http://testserver")
+
+        response = client.get("/items?limit=5", follow_redirects=False)
+
+        assert response.status_code == 301
+        assert response.headers["location"] == "https://testserver/items?limit=5"
+
+    def test_passes_https_requests_through(self):
+        client = TestClient(make_app(HTTPSRedirectMiddleware), base_url="https://testserver")
+
+        response = client.get("/items")
+
+        assert response.json() == {"ok": True}
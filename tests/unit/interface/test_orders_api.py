@@ -4,16 +4,33 @@ test_orders_api.py
 Unit tests for Orders API routes using FastAPI TestClient.
 """
 
+import csv
+import io
+import json
 import pytest
+from fastapi.security import HTTPAuthorizationCredentials
 from fastapi.testclient import TestClient
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 from decimal import Decimal
 from datetime import datetime, timezone
 
 from src.main import app
-from src.dependencies import get_place_order_service, get_session, get_auth_payload
-from src.application.dtos import OrderResponseDTO, OrderItemResponseDTO
-from src.domain.exceptions import ProductNotFoundError, InsufficientStockError
+from src.dependencies import (
+    get_place_order_service,
+    get_order_query_service,
+    get_session,
+    get_auth_payload,
+    get_idempotency_store,
+    get_auth_provider,
+    security,
+)
+from src.application.dtos import OrderResponseDTO, OrderItemResponseDTO, BatchOrderResultDTO, OrderPageDTO
+from src.domain.exceptions import (
+    ProductNotFoundError,
+    InsufficientStockError,
+    OrderNotFoundError,
+    IdempotencyKeyMismatchError,
+)
 
 
 @pytest.fixture
@@ -22,13 +39,30 @@ def mock_service():
 
 
 @pytest.fixture
-def client(mock_service):
+def mock_idempotency_store():
+    store = AsyncMock()
+    store.begin.return_value = None
+    return store
+
+
+@pytest.fixture
+def mock_auth_provider():
+    provider = AsyncMock()
+    provider.authorize.return_value = True
+    return provider
+
+
+@pytest.fixture
+def client(mock_service, mock_idempotency_store, mock_auth_provider):
     # Setup dependency overrides
     app.dependency_overrides[get_place_order_service] = lambda: mock_service
+    app.dependency_overrides[get_idempotency_store] = lambda: mock_idempotency_store
     # Also override session to prevent DB connection
     app.dependency_overrides[get_session] = lambda: AsyncMock()
     # Override auth to allow access in unit tests
     app.dependency_overrides[get_auth_payload] = lambda: {"sub": "test-user", "role": "admin"}
+    app.dependency_overrides[security] = lambda: HTTPAuthorizationCredentials(scheme="Bearer", credentials="token")
+    app.dependency_overrides[get_auth_provider] = lambda: mock_auth_provider
     
     yield TestClient(app)
     
@@ -105,3 +139,232 @@ async def test_place_order_api_insufficient_stock(client, mock_service):
 
     assert response.status_code == 400
     assert "Insufficient stock" in response.json()["detail"][0]["msg"]
+
+
+@pytest.mark.asyncio
+async def test_place_orders_batch_api(client, mock_service):
+    """Should return per-order results for a batch."""
+    mock_service.execute_many.return_value = [
+        BatchOrderResultDTO(
+            index=0,
+            order=OrderResponseDTO(
+                id=1, customer_id=1, items=[], total_amount=Decimal("0"), total_items=0,
+                status="pending", created_at=datetime.now(timezone.utc),
+                updated_at=datetime.now(timezone.utc),
+            ),
+        ),
+        BatchOrderResultDTO(index=1, error="Product with ID 999 not found"),
+    ]
+
+    response = client.post(
+        "/api/v1/orders:batch",
+        json={
+            "orders": [
+                {"customer_id": 1, "items": [{"product_id": 1, "quantity": 2}]},
+                {"customer_id": 2, "items": [{"product_id": 999, "quantity": 1}]},
+            ]
+        }
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["succeeded"] == 1
+    assert data["failed"] == 1
+    assert data["results"][0]["order"]["id"] == 1
+    assert data["results"][1]["success"] is False
+    assert len(mock_service.execute_many.call_args.args[0]) == 2
+
+
+@pytest.mark.asyncio
+async def test_list_orders_api(client):
+    """Should return a page of orders with the next cursor."""
+    query_service = AsyncMock()
+    query_service.list_customer_orders.return_value = OrderPageDTO(items=[], next_cursor="abc")
+    app.dependency_overrides[get_order_query_service] = lambda: query_service
+
+    response = client.get("/api/v1/orders", params={"customer_id": 1, "cursor": "xyz", "limit": 5})
+
+    assert response.status_code == 200
+    assert response.json() == {"items": [], "next_cursor": "abc"}
+    query_service.list_customer_orders.assert_called_once_with(1, limit=5, cursor="xyz")
+
+
+@pytest.mark.asyncio
+async def test_get_order_api_not_found(client):
+    """Should return 404 when the order does not exist."""
+    query_service = AsyncMock()
+    query_service.get_order.side_effect = OrderNotFoundError(order_id=42)
+    app.dependency_overrides[get_order_query_service] = lambda: query_service
+
+    response = client.get("/api/v1/orders/42")
+
+    assert response.status_code == 404
+    assert response.json()["detail"][0]["type"] == "order_not_found"
+
+
+def _export_service(orders):
+    query_service = MagicMock()
+
+    async def stream(**filters):
+        for order in orders:
+            yield order
+
+    query_service.export_orders.side_effect = stream
+    return query_service
+
+
+def _exported_order():
+    return OrderResponseDTO(
+        id=7,
+        customer_id=1,
+        items=[
+            OrderItemResponseDTO(
+                product_id=1, product_sku="S1", product_name="Widget, large",
+                quantity=2, unit_price=Decimal("5.00"), subtotal=Decimal("10.00"),
+            ),
+            OrderItemResponseDTO(
+                product_id=2, product_sku="S2", product_name="Bolt",
+                quantity=1, unit_price=Decimal("1.25"), subtotal=Decimal("1.25"),
+            ),
+        ],
+        total_amount=Decimal("11.25"),
+        total_items=3,
+        status="confirmed",
+        created_at=datetime(2026, 1, 1),
+        updated_at=datetime(2026, 1, 1),
+    )
+
+
+@pytest.mark.asyncio
+async def test_export_orders_ndjson(client, mock_auth_provider):
+    """Should stream one JSON order per line and pass the filters through."""
+    query_service = _export_service([_exported_order(), _exported_order()])
+    app.dependency_overrides[get_order_query_service] = lambda: query_service
+
+    response = client.get(
+        "/api/v1/orders/export",
+        params={"status": "confirmed", "created_from": "2026-01-01T00:00:00"},
+    )
+
+    assert response.status_code == 200
+    mock_auth_provider.authorize.assert_called_once_with("token", "orders:export")
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = response.text.splitlines()
+    assert len(lines) == 2
+    assert json.loads(lines[0])["items"][1]["product_sku"] == "S2"
+    query_service.export_orders.assert_called_once_with(
+        status="confirmed", created_from=datetime(2026, 1, 1), created_to=None
+    )
+
+
+@pytest.mark.asyncio
+async def test_export_orders_csv(client):
+    """Should stream a header and one CSV row per order item."""
+    app.dependency_overrides[get_order_query_service] = lambda: _export_service([_exported_order()])
+
+    response = client.get("/api/v1/orders/export", params={"format": "csv"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    rows = list(csv.reader(io.StringIO(response.text)))
+    assert rows[0][0] == "order_id"
+    assert len(rows) == 3
+    assert rows[1][9] == "Widget, large"
+
+
+@pytest.mark.asyncio
+async def test_export_orders_rejects_empty_range(client):
+    """Should reject a date range that ends before it starts."""
+    app.dependency_overrides[get_order_query_service] = lambda: _export_service([])
+
+    response = client.get(
+        "/api/v1/orders/export",
+        params={"created_from": "2026-02-01T00:00:00", "created_to": "2026-01-01T00:00:00"},
+    )
+
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_export_orders_forbidden_without_permission(client, mock_auth_provider):
+    """Should refuse the export to callers lacking orders:export."""
+    query_service = _export_service([_exported_order()])
+    app.dependency_overrides[get_order_query_service] = lambda: query_service
+    mock_auth_provider.authorize.return_value = False
+
+    response = client.get("/api/v1/orders/export")
+
+    assert response.status_code == 403
+    query_service.export_orders.assert_not_called()
+
+
+IDEMPOTENT_ORDER = {"customer_id": 1, "items": [{"product_id": 1, "quantity": 2}]}
+
+
+@pytest.mark.asyncio
+async def test_place_order_with_idempotency_key_stores_response(client, mock_service, mock_idempotency_store):
+    """Should place the order once and record its response under the caller's key."""
+    mock_service.execute.return_value = _exported_order()
+
+    response = client.post("/api/v1/orders", json=IDEMPOTENT_ORDER, headers={"Idempotency-Key": "abc"})
+
+    assert response.status_code == 201
+    assert response.headers["Idempotent-Replayed"] == "false"
+    mock_service.execute.assert_called_once()
+    scope, key, fingerprint, body = mock_idempotency_store.complete.call_args.args
+    assert (scope, key) == ("orders:test-user", "abc")
+    assert mock_idempotency_store.begin.call_args.args[2] == fingerprint
+    assert json.loads(body) == response.json()
+
+
+@pytest.mark.asyncio
+async def test_place_order_replays_stored_response(client, mock_service, mock_idempotency_store):
+    """Should return the stored response without placing another order."""
+    mock_idempotency_store.begin.return_value = '{"id": 7}'
+
+    response = client.post("/api/v1/orders", json=IDEMPOTENT_ORDER, headers={"Idempotency-Key": "abc"})
+
+    assert response.status_code == 201
+    assert response.headers["Idempotent-Replayed"] == "true"
+    assert response.json() == {"id": 7}
+    mock_service.execute.assert_not_called()
+    mock_idempotency_store.complete.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_place_order_failure_releases_idempotency_key(client, mock_service, mock_idempotency_store):
+    """Should free the key when the order fails, so a retry can place it."""
+    mock_service.execute.side_effect = InsufficientStockError(product_id=1, requested=2, available=0)
+
+    response = client.post("/api/v1/orders", json=IDEMPOTENT_ORDER, headers={"Idempotency-Key": "abc"})
+
+    assert response.status_code == 400
+    mock_idempotency_store.release.assert_called_once()
+    mock_idempotency_store.complete.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_place_order_reports_committed_order_when_recording_fails(
+    client, mock_service, mock_idempotency_store
+):
+    """Should still return 201 for a committed order if its response cannot be recorded."""
+    mock_service.execute.return_value = _exported_order()
+    mock_idempotency_store.complete.side_effect = ConnectionError("redis down")
+
+    response = client.post("/api/v1/orders", json=IDEMPOTENT_ORDER, headers={"Idempotency-Key": "abc"})
+
+    assert response.status_code == 201
+    assert response.json()["id"] == 7
+    mock_idempotency_store.release.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_place_order_idempotency_key_mismatch(client, mock_service, mock_idempotency_store):
+    """Should reject a key reused with a different payload."""
+    mock_idempotency_store.begin.side_effect = IdempotencyKeyMismatchError("abc")
+
+    response = client.post("/api/v1/orders", json=IDEMPOTENT_ORDER, headers={"Idempotency-Key": "abc"})
+
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["type"] == "idempotency_key_mismatch"
+    mock_service.execute.assert_not_called()
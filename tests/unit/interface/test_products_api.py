@@ -0,0 +1,73 @@
+"""
+test_products_api.py
+
+Unit tests for Products API routes using FastAPI TestClient.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from unittest.mock import AsyncMock
+from decimal import Decimal
+
+from src.main import app
+from src.dependencies import get_product_query_service, get_session, get_auth_payload
+from src.application.dtos import ProductPageDTO, ProductResponseDTO
+from src.domain.exceptions import InvalidCursorError
+
+
+@pytest.fixture
+def mock_service():
+    return AsyncMock()
+
+
+@pytest.fixture
+def client(mock_service):
+    app.dependency_overrides[get_product_query_service] = lambda: mock_service
+    app.dependency_overrides[get_session] = lambda: AsyncMock()
+    app.dependency_overrides[get_auth_payload] = lambda: {"sub": "test-user", "role": "admin"}
+    
+    yield TestClient(app)
+    
+    app.dependency_overrides.clear()
+
+
+@pytest.mark.asyncio
+async def test_search_products_api(client, mock_service):
+    """Should return ranked products and the next cursor."""
+    mock_service.list_products.return_value = ProductPageDTO(
+        items=[
+            ProductResponseDTO(
+                id=1, sku="S1", name="Blue Widget", description="",
+                price=Decimal("9.99"), stock_quantity=3,
+            )
+        ],
+        next_cursor="abc",
+    )
+
+    response = client.get("/api/v1/products", params={"search": "widget", "limit": 1})
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["items"][0]["name"] == "Blue Widget"
+    assert data["next_cursor"] == "abc"
+    mock_service.list_products.assert_called_once_with(search="widget", limit=1, cursor=None)
+
+
+@pytest.mark.asyncio
+async def test_search_term_too_short(client, mock_service):
+    """Should reject search terms shorter than a trigram."""
+    response = client.get("/api/v1/products", params={"search": "ab"})
+
+    assert response.status_code == 422
+    mock_service.list_products.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_invalid_cursor(client, mock_service):
+    """Should return 400 for a malformed cursor."""
+    mock_service.list_products.side_effect = InvalidCursorError("bad")
+
+    response = client.get("/api/v1/products", params={"cursor": "bad"})
+
+    assert response.status_code == 400
+    assert response.json()["detail"][0]["type"] == "invalid_cursor"